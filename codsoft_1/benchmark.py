@@ -0,0 +1,243 @@
+"""Synthetic large-board benchmarks for the taskmaster model layer.
+
+    python benchmark.py                        # 1k, 10k, 100k and 1M task boards
+    python benchmark.py --sizes 1000 10000 -o before.json
+    python benchmark.py --sizes 1000 10000 -o after.json --compare before.json
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from taskmaster.config import PRIORITY_LEVELS, DEFAULT_CATEGORIES, FILTER_OPTIONS, SORT_OPTIONS
+from taskmaster.task import Task
+from taskmaster.manager import TaskManager
+from taskmaster.storage import JsonStorage, write_json_atomic
+
+BENCHMARK_SIZES = (1000, 10000, 100000, 1000000)
+REPORT_FILE = "benchmark-report.json"
+REPORT_VERSION = 1
+
+# Rough shape of a real board: a few busy categories, a long tail of tags, most tasks dated
+CATEGORY_WEIGHTS = (30, 22, 8, 7, 6, 6, 8, 5, 3, 5)
+PRIORITY_WEIGHTS = {"High": 15, "Medium": 35, "Low": 30, "None": 20}
+TAG_POOL = [f"tag{i}" for i in range(40)]
+TAG_WEIGHTS = [1 / (i + 1) for i in range(len(TAG_POOL))]  # Zipf-like: a few tags are everywhere
+RECURRING_RULES = ("Daily", "Weekly", "Monthly", "Yearly")
+WORDS = ("report", "call", "email", "review", "plan", "buy", "fix", "book", "pay", "write",
+         "meeting", "groceries", "invoice", "doctor", "garden", "budget", "slides", "trip", "code", "read")
+
+def generate_task(rng, task_id, today):
+    """One synthetic task in to_dict form"""
+    created = today - datetime.timedelta(days=rng.randint(0, 400), seconds=rng.randint(0, 86399))
+    due_date = None
+    if rng.random() < 0.85:
+        # Most due dates cluster around today, some are far out or long overdue
+        due_date = (today + datetime.timedelta(days=int(rng.gauss(10, 45)))).isoformat()
+    completed = rng.random() < (0.7 if due_date and due_date < today.isoformat() else 0.25)
+    reminder = None
+    if due_date and rng.random() < 0.2:
+        reminder = f"{due_date}T{rng.randint(7, 20):02d}:{rng.choice((0, 15, 30, 45)):02d}:00"
+    subtasks = []
+    if rng.random() < 0.3:
+        subtasks = [{"title": f"step {i + 1}", "completed": rng.random() < 0.5} for i in range(rng.randint(1, 5))]
+    tags = []
+    if rng.random() < 0.6:
+        tags = list(dict.fromkeys(rng.choices(TAG_POOL, weights=TAG_WEIGHTS, k=rng.randint(1, 3))))
+    words = rng.choices(WORDS, k=rng.randint(2, 6))
+    return {
+        "id": task_id,
+        "title": " ".join(words).capitalize(),
+        "description": " ".join(rng.choices(WORDS, k=rng.randint(0, 20))),
+        "due_date": due_date,
+        "priority": rng.choices(list(PRIORITY_WEIGHTS), weights=list(PRIORITY_WEIGHTS.values()))[0],
+        "category": rng.choices(DEFAULT_CATEGORIES, weights=CATEGORY_WEIGHTS)[0],
+        "completed": completed,
+        "created_at": created.isoformat(),
+        "reminder": reminder,
+        "subtasks": subtasks,
+        "notes": "" if rng.random() < 0.8 else " ".join(rng.choices(WORDS, k=12)),
+        "tags": tags,
+        "color": None if rng.random() < 0.9 else rng.choice(("#FFCDD2", "#C8E6C9", "#BBDEFB")),
+        "recurring": rng.choice(RECURRING_RULES) if due_date and rng.random() < 0.05 else None,
+        "completion_date": created.isoformat() if completed else None,
+        "progress": 0,
+        "sticker": None
+    }
+
+def generate_board(size, seed=0, today=None):
+    rng = random.Random(seed * 1000003 + size)
+    today = today or datetime.date.today()
+    return {
+        "categories": DEFAULT_CATEGORIES.copy(),
+        "tags": TAG_POOL.copy(),
+        "next_id": 100000 + size,
+        "tasks": [generate_task(rng, 100000 + i, today) for i in range(size)]
+    }
+
+def board_path(data_dir, size, seed):
+    return os.path.join(data_dir, f"board-{size}-{seed}.json")
+
+def ensure_board(data_dir, size, seed):
+    """Path of the synthetic board for size, generating it unless a previous run left it there"""
+    path = board_path(data_dir, size, seed)
+    if not os.path.exists(path):
+        write_json_atomic(path, generate_board(size, seed))
+    return path
+
+def measure(func, repeat, setup=None):
+    """Run func repeat times (after setup, untimed) and summarise the wall times in ms"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {"min_ms": round(min(times), 3), "median_ms": round(statistics.median(times), 3), "runs": repeat}
+
+def filter_and_sort(task_manager, search_text, filter_option, sort_option):
+    """The filter_tasks logic of the main window, without the widgets"""
+    return task_manager.sorter.sort(task_manager.query_tasks(search_text, filter_option), sort_option)
+
+def benchmark_board(path, repeat):
+    """Time the TaskManager operations on one board file"""
+    results = {}
+    # save_tasks rewrites the file, so work on a copy and leave the cached board as generated
+    scratch_path = f"{path}.scratch"
+    shutil.copyfile(path, scratch_path)
+    storage = JsonStorage(scratch_path, journal_mode=False)
+    task_manager = TaskManager(storage, load=False)
+    try:
+        results["load_tasks"] = measure(task_manager.load_tasks, repeat)
+        results["rebuild_indexes"] = measure(lambda: (task_manager.search_index.rebuild(task_manager.store),
+                                                      task_manager.search_index.wait()), repeat)
+        results["statistics_rebuild"] = measure(lambda: task_manager.statistics.rebuild(task_manager.store), repeat)
+        results["statistics_snapshot"] = measure(task_manager.statistics.snapshot, repeat)
+
+        def save():
+            task_manager.save_tasks()
+            task_manager.flush()
+        results["save_tasks"] = measure(save, repeat)
+
+        # Cold lookups: the query cache and the cached sort keys are dropped before every run
+        def cold():
+            task_manager.invalidate_queries()
+            task_manager.sorter.clear()
+        lookups = {
+            "get_tasks_by_category": (task_manager.get_tasks_by_category, task_manager.categories),
+            "get_tasks_by_priority": (task_manager.get_tasks_by_priority, list(PRIORITY_LEVELS)),
+            "get_tasks_by_tag": (task_manager.get_tasks_by_tag, task_manager.tags),
+            "get_tasks_by_date": (task_manager.get_tasks_by_date,
+                                  [(datetime.date.today() + datetime.timedelta(days=d)).isoformat()
+                                   for d in range(-30, 31)])
+        }
+        for name, (lookup, values) in lookups.items():
+            results[name] = measure(lambda: [lookup(value) for value in values], repeat, cold)
+        results["get_completed_tasks"] = measure(task_manager.get_completed_tasks, repeat, cold)
+        results["get_incomplete_tasks"] = measure(task_manager.get_incomplete_tasks, repeat, cold)
+        results["get_overdue_tasks"] = measure(task_manager.get_overdue_tasks, repeat, cold)
+
+        task_manager.search_index.wait()
+        for filter_option in FILTER_OPTIONS:
+            for sort_option in SORT_OPTIONS:
+                name = f"filter_sort[{filter_option}|{sort_option}]"
+                results[name] = measure(lambda: filter_and_sort(task_manager, "", filter_option, sort_option),
+                                        repeat, cold)
+        results["filter_sort[search|Due Date]"] = measure(
+            lambda: filter_and_sort(task_manager, "report", "All", "Due Date"), repeat, cold)
+        results["filter_sort[search+Incomplete|Priority]"] = measure(
+            lambda: filter_and_sort(task_manager, "report", "Incomplete", "Priority"), repeat, cold)
+        
+        # One edited task moved with a bisect, against re-sorting the whole list
+        sorter = task_manager.sorter
+        ordered = sorter.sort(task_manager.tasks, "Due Date")
+        if ordered:
+            middle = len(ordered) // 2
+            edited = Task.from_dict(dict(ordered[middle].to_dict(), due_date="2000-01-01"))
+            state = {}
+            
+            def edit():
+                state["tasks"] = ordered.copy()
+                state["tasks"][middle] = edited
+            results["sort_full[Due Date]"] = measure(lambda: sorter.sort(state["tasks"], "Due Date"), repeat, edit)
+            results["sort_reposition[Due Date]"] = measure(
+                lambda: sorter.reposition(state["tasks"], middle, "Due Date"), repeat, edit)
+    finally:
+        task_manager.close()
+        os.remove(scratch_path)
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+def compare(report, baseline):
+    """Print median time ratios against a baseline report (> 1.00 is slower)"""
+    for size, results in report["boards"].items():
+        old_results = baseline.get("boards", {}).get(size)
+        if not old_results:
+            continue
+        print(f"\n{size} tasks (vs {baseline.get('revision') or 'baseline'})")
+        for name, result in results["operations"].items():
+            old = old_results["operations"].get(name)
+            if old and old["median_ms"] > 0:
+                ratio = result["median_ms"] / old["median_ms"]
+                flag = "  <-- slower" if ratio > 1.2 else ""
+                print(f"  {name:<48}{old['median_ms']:>10.2f}{result['median_ms']:>10.2f} ms  x{ratio:.2f}{flag}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark TaskManager on synthetic boards")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCHMARK_SIZES), help="board sizes in tasks")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per operation (min and median are reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", help="keep and reuse the generated boards here (default: a temporary directory)")
+    parser.add_argument("-o", "--output", default=REPORT_FILE, help=f"report file (default {REPORT_FILE})")
+    parser.add_argument("--compare", help="earlier report to compare against")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="taskmaster-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    report = {
+        "version": REPORT_VERSION,
+        "revision": git_revision(),
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "boards": {}
+    }
+    for size in args.sizes:
+        start = time.perf_counter()
+        path = ensure_board(data_dir, size, args.seed)
+        print(f"{size} tasks: board ready in {time.perf_counter() - start:.1f}s ({os.path.getsize(path) / 1e6:.1f} MB)")
+        operations = benchmark_board(path, args.repeat)
+        report["boards"][str(size)] = {"file_bytes": os.path.getsize(path), "operations": operations}
+        for name, result in operations.items():
+            print(f"  {name:<48}{result['median_ms']:>10.2f} ms")
+        if not args.data_dir:
+            os.remove(path)
+
+    write_json_atomic(args.output, report, indent=2)
+    print(f"\nReport written to {args.output}")
+    if args.compare:
+        with open(args.compare, "r", encoding='utf-8') as f:
+            compare(report, json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
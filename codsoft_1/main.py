@@ -1,9 +1,8 @@
 import sys
-import json
-import os
+import time
+import heapq
 import datetime
 import random
-from functools import lru_cache
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QLineEdit, QListWidget, QListWidgetItem, 
                              QCheckBox, QComboBox, QTabWidget, QScrollArea, QCalendarWidget, 
@@ -11,15 +10,35 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                              QFileDialog, QFontDialog, QSlider, QProgressBar, QMenu, QAction,
                              QSystemTrayIcon, QSplashScreen, QDialog, QTextEdit, QGroupBox,
                              QRadioButton, QSpinBox, QToolBar, QStatusBar, QDockWidget, QFrame,
-                             QSizePolicy)
-from PyQt5.QtCore import Qt, QTimer, QDate, QTime, QSize, QPropertyAnimation, QRect, QEasingCurve, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QPixmap, QCursor, QBrush, QLinearGradient
+                             QSizePolicy, QListView, QStyledItemDelegate, QStyle, QStyleOptionButton,
+                             QToolTip)
+from PyQt5.QtCore import (Qt, QTimer, QDate, QTime, QSize, QPropertyAnimation, QRect, QRectF, QEasingCurve,
+                          pyqtSignal, QAbstractListModel, QModelIndex, QEvent, QObject)
+from PyQt5.QtGui import (QIcon, QFont, QColor, QPalette, QPixmap, QCursor, QBrush, QLinearGradient,
+                         QPainter, QPen, QFontMetrics, QTextCharFormat, QKeySequence)
+
+from taskmaster.config import PRIORITY_LEVELS, DEFAULT_CATEGORIES, FILTER_OPTIONS, SORT_OPTIONS
+from taskmaster.task import Task
+from taskmaster.manager import TaskManager
+from taskmaster.transfer import TaskLoader, TaskImporter, TaskExporter
+from taskmaster.profiling import profiler
 
 # Constants
 APP_NAME = "TaskMaster Pro"
 APP_VERSION = "1.0.0"
 DEFAULT_THEME = "purple"
-SAVE_FILE = "tasks.json"
+SEARCH_DEBOUNCE_MS = 150  # Quiet time after the last keystroke before the list is filtered
+REMINDER_GRACE_SECONDS = 60  # Reminders this far in the past still fire when (re)scheduled
+REMINDER_MAX_SLEEP_MS = 60 * 60 * 1000  # Re-check at least hourly so clock changes are picked up
+LOAD_POLL_MS = 50
+HEATMAP_THRESHOLDS = (1, 3, 5, 8)  # Open tasks on a day needed for each calendar heat-map shade
+HEATMAP_ALPHAS = (50, 100, 160, 220)
+FRAME_PROBE_MS = 16  # Event loop lag probe of the developer dock, about one frame
+DEVTOOLS_REFRESH_MS = 500
+BULK_PATCH_LIMIT = 50  # Bulk edits of more tasks than this rebuild the views instead of patching them
+CELEBRATION_SHOW_MS = 4000
+CELEBRATION_MIN_INTERVAL_MS = 1500  # Completions closer together than this share one celebration
+CELEBRATION_TITLES_SHOWN = 3  # Task titles listed in a merged celebration
 
 # Stickers for task completion
 COMPLETION_STICKERS = [
@@ -91,20 +110,6 @@ THEMES = {
     }
 }
 
-# Task priority levels
-PRIORITY_LEVELS = {
-    "High": {"color": "#F44336", "value": 3},
-    "Medium": {"color": "#FF9800", "value": 2},
-    "Low": {"color": "#4CAF50", "value": 1},
-    "None": {"color": "#9E9E9E", "value": 0}
-}
-
-# Task categories
-DEFAULT_CATEGORIES = [
-    "Work", "Personal", "Shopping", "Health", "Education", 
-    "Finance", "Home", "Family", "Entertainment", "Other"
-]
-
 # Celebration stickers and messages
 CELEBRATION_STICKERS = [
     "🎉", "🎊", "🥳", "🌟", "⭐", "✨", "🏆", "🎯", "💫", "🔥", "👏", "🙌", "💪", "🚀", "🎈"
@@ -155,510 +160,896 @@ TASK_STICKERS = {
     "Other": ["⭐", "🌟", "✨", "💫", "🔥", "⚡", "🎯", "💎", "🚀", "🌈"]
 }
 
-class Task:
-    def __init__(self, title, description="", due_date=None, priority="None", 
-                 category="Other", completed=False, created_at=None, reminder=None,
-                 subtasks=None, notes="", tags=None, color=None, recurring=None):
-        self.id = random.randint(10000, 99999)
-        self.title = title
-        self.description = description
-        self.due_date = due_date
-        self.priority = priority
-        self.category = category
-        self.completed = completed
-        self.created_at = created_at if created_at else datetime.datetime.now().isoformat()
-        self.reminder = reminder
-        self.subtasks = subtasks if subtasks else []
-        self.notes = notes
-        self.tags = tags if tags else []
-        self.color = color
-        self.recurring = recurring
-        self.completion_date = None
-        self.progress = 0
-    
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "due_date": self.due_date,
-            "priority": self.priority,
-            "category": self.category,
-            "completed": self.completed,
-            "created_at": self.created_at,
-            "reminder": self.reminder,
-            "subtasks": self.subtasks,
-            "notes": self.notes,
-            "tags": self.tags,
-            "color": self.color,
-            "recurring": self.recurring,
-            "completion_date": self.completion_date,
-            "progress": self.progress
-        }
-    
-    @classmethod
-    def from_dict(cls, data):
-        task = cls(data["title"])
-        for key, value in data.items():
-            setattr(task, key, value)
-        return task
-
-class TaskManager:
+class ThemeCompiler:
+    """Builds each theme's application stylesheet and palette once and caches them"""
+    
     def __init__(self):
-        self.tasks = []
-        self.categories = DEFAULT_CATEGORIES.copy()
-        self.tags = []
-        self._task_cache = {}
-        self._stats_cache = {}
-        self._cache_timestamp = 0
-        self.load_tasks()
-    
-    def add_task(self, task):
-        self.tasks.append(task)
-        self._clear_cache()
-        self.save_tasks()
-        return task
-    
-    def update_task(self, task_id, updated_task):
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks[i] = updated_task
-                self._clear_cache()
-                self.save_tasks()
-                return True
-        return False
+        self._stylesheets = {}
+        self._palettes = {}
     
-    def delete_task(self, task_id):
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                del self.tasks[i]
-                self._clear_cache()
-                self.save_tasks()
-                return True
-        return False
+    def stylesheet(self, theme_name):
+        if theme_name not in self._stylesheets:
+            self._stylesheets[theme_name] = self._compile(THEMES[theme_name])
+        return self._stylesheets[theme_name]
     
-    def get_task(self, task_id):
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+    def palette(self, theme_name):
+        if theme_name not in self._palettes:
+            theme = THEMES[theme_name]
+            palette = QPalette()
+            palette.setColor(QPalette.Window, QColor(theme["background"]))
+            palette.setColor(QPalette.WindowText, QColor(theme["text"]))
+            palette.setColor(QPalette.Base, QColor("white"))
+            palette.setColor(QPalette.AlternateBase, QColor(theme["background"]))
+            palette.setColor(QPalette.ToolTipBase, QColor("white"))
+            palette.setColor(QPalette.ToolTipText, QColor(theme["text"]))
+            palette.setColor(QPalette.Text, QColor(theme["text"]))
+            palette.setColor(QPalette.Button, QColor(theme["primary"]))
+            palette.setColor(QPalette.ButtonText, QColor("white"))
+            palette.setColor(QPalette.BrightText, QColor("red"))
+            palette.setColor(QPalette.Highlight, QColor(theme["primary"]))
+            palette.setColor(QPalette.HighlightedText, QColor("white"))
+            self._palettes[theme_name] = palette
+        return self._palettes[theme_name]
+    
+    def _compile(self, theme):
+        # Widgets opt in through their objectName or a "role" property instead of carrying their own sheet
+        return f"""
+            * {{  /* Global font settings */
+                font-family: 'Segoe UI', 'Roboto', 'Arial', sans-serif;
+                font-size: 11pt;
+            }}
+            QMainWindow, QDialog {{
+                background-color: {theme["background"]};
+            }}
+            QLabel {{
+                font-size: 11pt;
+            }}
+            QTabWidget::pane {{
+                border: 2px solid {theme["accent"]};
+                background-color: white;
+                border-radius: 8px;
+                padding: 5px;
+            }}
+            QTabBar::tab {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+                padding: 10px 12px;
+                margin-right: 3px;
+                border-top-left-radius: 6px;
+                border-top-right-radius: 6px;
+                font-size: 11pt;
+                font-weight: bold;
+                min-width: 100px;
+                max-width: 150px;
+                text-align: center;
+            }}
+            QTabBar::tab:selected {{
+                background-color: {theme["primary"]};
+                color: white;
+                font-weight: bold;
+                border-bottom: 3px solid {theme["secondary"]};
+            }}
+            QGroupBox {{
+                border: 2px solid {theme["accent"]};
+                border-radius: 8px;
+                margin-top: 15px;
+                font-weight: bold;
+                padding: 10px;
+                background-color: rgba(255, 255, 255, 0.7);
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                subcontrol-position: top center;
+                padding: 0 10px;
+                color: {theme["primary"]};
+                font-size: 12pt;
+                font-weight: bold;
+            }}
+            QPushButton {{
+                background-color: {theme["primary"]};
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 6px;
+                font-weight: bold;
+                font-size: 10pt;
+                min-width: 80px;
+                max-width: 150px;
+            }}
+            QPushButton:hover {{
+                background-color: {theme["secondary"]};
+            }}
+            QLineEdit, QTextEdit, QDateEdit, QTimeEdit, QComboBox {{
+                border: 2px solid {theme["accent"]};
+                border-radius: 6px;
+                padding: 8px;
+                font-size: 11pt;
+                background-color: white;
+                min-height: 20px;
+            }}
+            QComboBox {{
+                min-width: 120px;
+                max-width: 200px;
+            }}
+            QProgressBar {{
+                border: 2px solid {theme["accent"]};
+                border-radius: 4px;
+                text-align: center;
+                height: 15px;
+                font-weight: bold;
+                color: white;
+                background-color: #f0f0f0;
+            }}
+            QProgressBar::chunk {{
+                background-color: {theme["primary"]};
+                border-radius: 4px;
+            }}
+            QScrollBar:vertical {{
+                border: none;
+                background: {theme["background"]};
+                width: 14px;
+                margin: 0px;
+            }}
+            QScrollBar::handle:vertical {{
+                background: {theme["accent"]};
+                min-height: 30px;
+                border-radius: 7px;
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                border: none;
+                background: none;
+            }}
+            QScrollBar:horizontal {{
+                border: none;
+                background: {theme["background"]};
+                height: 14px;
+                margin: 0px;
+            }}
+            QScrollBar::handle:horizontal {{
+                background: {theme["accent"]};
+                min-width: 30px;
+                border-radius: 7px;
+            }}
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+                border: none;
+                background: none;
+            }}
+            QListWidget, QListView, QTreeView, QTableView {{
+                border: 2px solid {theme["accent"]};
+                border-radius: 6px;
+                padding: 5px;
+                background-color: white;
+                alternate-background-color: #f9f9f9;
+            }}
+            QListWidget::item:selected, QListView::item:selected {{
+                background-color: {theme["primary"]};
+                color: white;
+                border-radius: 4px;
+            }}
+
+            /* Header and filter bar */
+            QLabel#appTitle {{
+                font-family: 'Segoe UI', 'Roboto', sans-serif;
+                font-size: 32pt;
+                font-weight: bold;
+                color: {theme["primary"]};
+                letter-spacing: 1px;
+            }}
+            QLabel#themeLabel {{
+                color: {theme["text"]};
+                font-weight: bold;
+            }}
+            QLabel[role="field"] {{
+                color: {theme["text"]};
+            }}
+            QComboBox#themeCombo {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+                border: 1px solid {theme["accent"]};
+                border-radius: 4px;
+                padding: 5px 10px;
+            }}
+            QComboBox#themeCombo::drop-down {{
+                border: none;
+            }}
+            QComboBox#themeCombo::down-arrow {{
+                image: none;
+            }}
+            QLineEdit#searchInput, QComboBox#filterCombo, QComboBox#sortCombo {{
+                padding: 8px 12px;
+                border-radius: 6px;
+                background-color: {theme["background"]};
+                border: 1px solid {theme["accent"]};
+                color: {theme["text"]};
+            }}
+
+            /* Calendar */
+            QCalendarWidget#taskCalendar {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+            }}
+            QCalendarWidget#taskCalendar QToolButton {{
+                color: {theme["text"]};
+                background-color: transparent;
+                border: none;
+                border-radius: 4px;
+                padding: 5px;
+                min-width: 0px;
+            }}
+            QCalendarWidget#taskCalendar QToolButton:hover {{
+                background-color: {theme["accent"]};
+            }}
+            QCalendarWidget#taskCalendar QMenu {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+            }}
+
+            /* Button roles */
+            QPushButton[role="primary"] {{
+                padding: 8px 15px;
+            }}
+            QPushButton[role="cancel"] {{
+                background-color: #9E9E9E;
+                padding: 8px 16px;
+                font-weight: normal;
+            }}
+            QPushButton[role="cancel"]:hover {{
+                background-color: #757575;
+            }}
+            QPushButton[role="confirm"], QPushButton[role="danger"] {{
+                padding: 12px 24px;
+                font-size: 12px;
+            }}
+            QPushButton[role="confirm"] {{
+                background-color: #28a745;
+            }}
+            QPushButton[role="confirm"]:hover {{
+                background-color: #218838;
+            }}
+            QPushButton[role="confirm"]:pressed {{
+                background-color: #1e7e34;
+            }}
+            QPushButton[role="danger"] {{
+                background-color: #dc3545;
+            }}
+            QPushButton[role="danger"]:hover {{
+                background-color: #c82333;
+            }}
+            QPushButton[role="danger"]:pressed {{
+                background-color: #bd2130;
+            }}
+            QPushButton[role="sticker"] {{
+                font-size: 20px;
+                font-weight: normal;
+                padding: 0px;
+                min-width: 0px;
+                color: black;
+                border: 2px solid #cccccc;
+                border-radius: 20px;
+                background-color: #f9f9f9;
+            }}
+            QPushButton[role="sticker"]:hover {{
+                border-color: #007acc;
+                background-color: #e6f3ff;
+            }}
+            QPushButton[role="sticker"]:checked {{
+                border-color: #007acc;
+                background-color: #cce7ff;
+                border-width: 3px;
+            }}
+            QPushButton[role="plain"] {{
+                padding: 8px;
+                color: {theme["text"]};
+                font-weight: normal;
+                border: 1px solid #cccccc;
+                border-radius: 4px;
+                background-color: #f0f0f0;
+            }}
+            QPushButton[role="plain"]:hover {{
+                background-color: #e0e0e0;
+            }}
+
+            /* Delete confirmation */
+            QDialog#deleteDialog {{
+                background-color: #ffffff;
+                border: 2px solid #cccccc;
+                border-radius: 10px;
+            }}
+            QLabel#deleteMessage {{
+                font-size: 14px;
+                color: #333333;
+                font-weight: bold;
+                padding: 10px;
+            }}
+
+            /* Completion celebration */
+            QFrame#celebrationOverlay {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #FFD700, stop:0.5 #FFA500, stop:1 #FF6347);
+                border-radius: 15px;
+                border: 3px solid #FFD700;
+            }}
+            QLabel#celebrationSticker {{
+                font-size: 48px;
+                background: transparent;
+                padding: 10px;
+            }}
+            QLabel#celebrationMessage {{
+                font-size: 16px;
+                font-weight: bold;
+                color: white;
+                background: transparent;
+                padding: 10px;
+            }}
+            QLabel#celebrationTasks {{
+                font-size: 14px;
+                font-style: italic;
+                color: #333333;
+                background: rgba(255,255,255,0.8);
+                border-radius: 8px;
+                padding: 8px;
+            }}
+        """
+
+theme_compiler = ThemeCompiler()
+
+class TaskListModel(QAbstractListModel):
+    """List model exposing Task objects to a TaskListView"""
     
-    @lru_cache(maxsize=128)
-    def get_tasks_by_category(self, category):
-        return tuple(task for task in self.tasks if task.category == category)
+    TaskRole = Qt.UserRole + 1
     
-    @lru_cache(maxsize=128)
-    def get_tasks_by_priority(self, priority):
-        return tuple(task for task in self.tasks if task.priority == priority)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+        self._row_of = {}  # task id -> row, rebuilt lazily after rows shift
     
-    def get_tasks_by_date(self, date):
-        return [task for task in self.tasks if task.due_date == date]
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
     
-    def get_tasks_by_tag(self, tag):
-        return [task for task in self.tasks if tag in task.tags]
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == self.TaskRole:
+            return task
+        if role == Qt.DisplayRole:
+            return task.title
+        if role == Qt.ToolTipRole:
+            return task.description or None
+        return None
     
-    @lru_cache(maxsize=32)
-    def get_completed_tasks(self):
-        return tuple(task for task in self.tasks if task.completed)
+    def set_tasks(self, tasks):
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        profiler.count("model.rows_reset", len(self._tasks))
+        self._row_of = None
+        self.endResetModel()
     
-    @lru_cache(maxsize=32)
-    def get_incomplete_tasks(self):
-        return tuple(task for task in self.tasks if not task.completed)
+    def task_at(self, row):
+        return self._tasks[row]
     
-    def get_overdue_tasks(self):
-        today = datetime.datetime.now().date().isoformat()
-        return [task for task in self.tasks if not task.completed and 
-                task.due_date and task.due_date < today]
+    def tasks(self):
+        """The shown tasks in row order (the model's own list, not a copy)"""
+        return self._tasks
     
-    def add_category(self, category):
-        if category not in self.categories:
-            self.categories.append(category)
-            self.save_tasks()
-            return True
-        return False
+    def row_of(self, task_id):
+        if self._row_of is None:
+            self._row_of = {task.id: row for row, task in enumerate(self._tasks)}
+        return self._row_of.get(task_id)
     
-    def add_tag(self, tag):
-        if tag not in self.tags:
-            self.tags.append(tag)
-            self.save_tasks()
-            return True
-        return False
+    def insert_task(self, row, task):
+        profiler.count("model.rows_inserted")
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, task)
+        if row == len(self._tasks) - 1 and self._row_of is not None:
+            self._row_of[task.id] = row
+        else:
+            self._row_of = None
+        self.endInsertRows()
     
-    def _clear_cache(self):
-        """Clear all caches when tasks are modified"""
-        self._task_cache.clear()
-        self._stats_cache.clear()
-        self._cache_timestamp = datetime.datetime.now().timestamp()
-        # Clear lru_cache decorated methods
-        if hasattr(self.get_tasks_by_category, 'cache_clear'):
-            self.get_tasks_by_category.cache_clear()
-        if hasattr(self.get_tasks_by_priority, 'cache_clear'):
-            self.get_tasks_by_priority.cache_clear()
-        if hasattr(self.get_completed_tasks, 'cache_clear'):
-            self.get_completed_tasks.cache_clear()
-        if hasattr(self.get_incomplete_tasks, 'cache_clear'):
-            self.get_incomplete_tasks.cache_clear()
-
-    def save_tasks(self):
-        try:
-            data = {
-                "tasks": [task.to_dict() for task in self.tasks],
-                "categories": self.categories,
-                "tags": self.tags
-            }
-            with open(SAVE_FILE, "w", encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving tasks: {e}")
+    def remove_task(self, task_id):
+        row = self.row_of(task_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        self._row_of = None
+        self.endRemoveRows()
+        return True
     
-    def load_tasks(self):
-        if not os.path.exists(SAVE_FILE):
-            return
-        
-        try:
-            with open(SAVE_FILE, "r", encoding='utf-8') as f:
-                data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in data.get("tasks", [])]
-                self.categories = data.get("categories", DEFAULT_CATEGORIES.copy())
-                self.tags = data.get("tags", [])
-        except Exception as e:
-            print(f"Error loading tasks: {e}")
-            # Create backup of corrupted file
-            if os.path.exists(SAVE_FILE):
-                backup_name = f"{SAVE_FILE}.backup.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                try:
-                    os.rename(SAVE_FILE, backup_name)
-                    print(f"Corrupted file backed up as: {backup_name}")
-                except Exception:
-                    pass
+    def refresh_task(self, task):
+        """Repaint the row showing task, picking up a replaced Task object"""
+        row = self.row_of(task.id)
+        if row is None:
+            return False
+        self._tasks[row] = task
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
 
-class TaskItemWidget(QWidget):
-    # Define signals for communication with parent
+class TaskItemDelegate(QStyledItemDelegate):
+    """Paints task cards for visible rows only and turns clicks into task signals"""
+    
     task_completed = pyqtSignal(object)  # Signal when task completion changes
     task_edit_requested = pyqtSignal(object)  # Signal when edit is requested
     task_delete_requested = pyqtSignal(int)  # Signal when delete is requested
     
-    def __init__(self, task, parent=None, theme=DEFAULT_THEME):
+    DELETE_COLOR = "#F44336"
+    DELETE_HOVER_COLOR = "#E53935"
+    CHIP_COLOR = QColor(200, 200, 200, 51)
+    
+    def __init__(self, parent=None, theme=DEFAULT_THEME, row_height=120):
         super().__init__(parent)
-        self.task = task
         self.theme = theme
-        self.main_window = None  # Will be set by parent
-        self.setup_ui()
-        
-        # Apply gradient background
-        gradient = QLinearGradient(0, 0, self.width(), 0)
-        gradient.setColorAt(0, QColor(THEMES[self.theme]['gradient_start']))
-        gradient.setColorAt(1, QColor(THEMES[self.theme]['gradient_end']))
-        
-        palette = self.palette()
-        palette.setBrush(QPalette.Window, QBrush(gradient))
-        self.setAutoFillBackground(True)
-        self.setPalette(palette)
+        self.row_height = row_height
+        self.title_font = QFont("Segoe UI", 11)
+        self.title_font.setBold(True)
+        self.small_font = QFont("Segoe UI", 9)
+        self.small_bold_font = QFont("Segoe UI", 9)
+        self.small_bold_font.setBold(True)
+        self.sticker_font = QFont("Segoe UI", 16)
+        self.button_font = QFont("Segoe UI", 12)
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 8, 10, 8)  # Reduced margins
-        layout.setSpacing(10)  # Reduced spacing
-        
-        # Set minimum height for the widget
-        self.setMinimumHeight(100)  # Increased from default
+    def sizeHint(self, option, index):
+        return QSize(0, self.row_height)
+    
+    def _layout(self, rect):
+        """Rects for the card and its clickable parts within a row"""
+        card = rect.adjusted(4, 4, -4, -4)
+        middle = card.center().y()
+        checkbox = QRect(card.left() + 10, middle - 10, 20, 20)
+        edit = QRect(card.right() - 40, middle - 32, 30, 30)
+        delete = QRect(card.right() - 40, middle + 2, 30, 30)
+        content = QRect(checkbox.right() + 10, card.top() + 8,
+                        edit.left() - checkbox.right() - 20, card.height() - 16)
+        return {"card": card, "checkbox": checkbox, "edit": edit, "delete": delete, "content": content}
+    
+    def _hit(self, rect, pos):
+        for part in ("checkbox", "edit", "delete"):
+            if self._layout(rect)[part].contains(pos):
+                return part
+        return None
+    
+    def paint(self, painter, option, index):
+        task = index.data(TaskListModel.TaskRole)
+        if task is None:
+            return
+        profiler.count("delegate.rows_painted")
+        colors = THEMES[self.theme]
+        parts = self._layout(option.rect)
+        card = parts["card"]
+        hover = None
+        if option.state & QStyle.State_MouseOver and option.widget is not None:
+            cursor_pos = option.widget.viewport().mapFromGlobal(QCursor.pos())
+            hover = self._hit(option.rect, cursor_pos)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Card background based on completion or custom color
+        if task.color:
+            background = QColor(task.color)
+        elif task.completed:
+            background = QColor(colors["background"])
+        else:
+            background = QColor("white")
+        painter.setPen(QPen(QColor(colors["primary"]), 2) if option.state & QStyle.State_Selected else Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(card), 8, 8)
         
         # Checkbox for completion status
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(self.task.completed)
-        self.checkbox.stateChanged.connect(self.on_completion_changed)
-        self.checkbox.setStyleSheet(f"QCheckBox::indicator {{ width: 20px; height: 20px; }}")
-        layout.addWidget(self.checkbox)
-        
-        # Task details container
-        details_widget = QWidget()
-        details_layout = QVBoxLayout(details_widget)
-        details_layout.setContentsMargins(0, 0, 0, 0)
-        details_layout.setSpacing(6)
-        
-        # Title and priority
-        title_layout = QHBoxLayout()
-        
-        # Add task sticker if available
-        if hasattr(self.task, 'sticker') and self.task.sticker:
-            task_sticker = QLabel(self.task.sticker)
-            task_sticker.setStyleSheet("font-size: 18pt; margin-right: 8px;")
-            title_layout.addWidget(task_sticker)
-        
-        # Add completion sticker for completed tasks
-        if self.task.completed:
-            import random
-            completion_sticker = QLabel(random.choice(CELEBRATION_STICKERS))
-            completion_sticker.setStyleSheet("font-size: 16pt; margin-right: 5px;")
-            title_layout.addWidget(completion_sticker)
-        
-        self.title_label = QLabel(self.task.title)
-        font = QFont("Segoe UI", 11)
-        font.setBold(True)
-        self.title_label.setFont(font)
-        self.title_label.setWordWrap(True)  # Enable word wrapping
-        self.title_label.setMaximumWidth(300)  # Limit width to prevent overflow
-        
-        if self.task.completed:
-            self.title_label.setStyleSheet(f"color: {THEMES[self.theme]['completed']}; text-decoration: line-through;")
-        else:
-            self.title_label.setStyleSheet(f"color: {THEMES[self.theme]['text']};")
-        
-        title_layout.addWidget(self.title_label)
-        title_layout.addStretch()
-        
-        # Priority indicator with better sizing
-        if self.task.priority != "None":
-            priority_color = PRIORITY_LEVELS[self.task.priority]["color"]
-            priority_label = QLabel(self.task.priority)
-            priority_label.setStyleSheet(f"""
-                background-color: {priority_color}; 
-                color: white; 
-                padding: 4px 8px; 
-                border-radius: 4px; 
-                font-weight: bold; 
-                font-size: 9pt;
-                min-width: 50px;
-                max-width: 80px;
-            """)
-            priority_label.setAlignment(Qt.AlignCenter)
-            priority_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            title_layout.addWidget(priority_label)
-        
-        details_layout.addLayout(title_layout)
-        
-        # Description and metadata
-        if self.task.description:
-            desc_text = self.task.description[:80] + "..." if len(self.task.description) > 80 else self.task.description
-            desc_label = QLabel(desc_text)
-            desc_label.setStyleSheet(f"color: {THEMES[self.theme]['secondary']}; font-size: 9pt; margin-top: 2px;")
-            desc_label.setWordWrap(True)
-            desc_label.setMaximumWidth(350)  # Limit width
-            details_layout.addWidget(desc_label)
-        
-        # Due date and category
-        meta_layout = QHBoxLayout()
-        meta_layout.setSpacing(10)
-        
-        if self.task.due_date:
-            due_date = QDate.fromString(self.task.due_date, Qt.ISODate)
-            due_label = QLabel(f"📅 {due_date.toString('MMM d, yyyy')}")
-            due_label.setStyleSheet(f"color: {THEMES[self.theme]['accent']}; font-size: 9pt; font-weight: bold; background-color: rgba(200,200,200,0.2); padding: 3px 6px; border-radius: 3px;")
-            meta_layout.addWidget(due_label)
-        
-        category_label = QLabel(f"🏷️ {self.task.category}")
-        category_label.setStyleSheet(f"color: {THEMES[self.theme]['accent']}; font-size: 9pt; font-weight: bold; background-color: rgba(200,200,200,0.2); padding: 3px 6px; border-radius: 3px;")
-        meta_layout.addWidget(category_label)
-        meta_layout.addStretch()
+        checkbox_option = QStyleOptionButton()
+        checkbox_option.rect = parts["checkbox"]
+        checkbox_option.state = QStyle.State_Enabled | (QStyle.State_On if task.completed else QStyle.State_Off)
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, checkbox_option, painter, option.widget)
+        
+        content = parts["content"]
+        x = content.left()
+        title_rect = QRect(content.left(), content.top(), content.width(), 28)
+        
+        # Priority badge on the right of the title line
+        if task.priority != "None" and task.priority in PRIORITY_LEVELS:
+            painter.setFont(self.small_bold_font)
+            badge_width = min(max(QFontMetrics(self.small_bold_font).width(task.priority) + 16, 50), 80)
+            badge = QRect(content.right() - badge_width, title_rect.top() + 2, badge_width, 22)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(PRIORITY_LEVELS[task.priority]["color"]))
+            painter.drawRoundedRect(QRectF(badge), 4, 4)
+            painter.setPen(QColor("white"))
+            painter.drawText(badge, Qt.AlignCenter, task.priority)
+            title_rect.setRight(badge.left() - 8)
+        
+        # Task sticker and completion sticker
+        painter.setFont(self.sticker_font)
+        stickers = []
+        if task.sticker:
+            stickers.append(task.sticker)
+        if task.completed:
+            stickers.append(CELEBRATION_STICKERS[task.id % len(CELEBRATION_STICKERS)])
+        for sticker in stickers:
+            painter.setPen(QColor(colors["text"]))
+            sticker_width = QFontMetrics(self.sticker_font).width(sticker) + 6
+            painter.drawText(QRect(x, title_rect.top(), sticker_width, title_rect.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, sticker)
+            x += sticker_width
+        title_rect.setLeft(x)
+        
+        # Title
+        title_font = QFont(self.title_font)
+        title_font.setStrikeOut(task.completed)
+        painter.setFont(title_font)
+        painter.setPen(QColor(colors["completed"] if task.completed else colors["text"]))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         QFontMetrics(title_font).elidedText(task.title, Qt.ElideRight, title_rect.width()))
+        y = title_rect.bottom() + 4
+        
+        # Description
+        if task.description:
+            desc_text = task.description[:80] + "..." if len(task.description) > 80 else task.description
+            painter.setFont(self.small_font)
+            painter.setPen(QColor(colors["secondary"]))
+            desc_rect = QRect(content.left(), y, content.width(), 18)
+            painter.drawText(desc_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             QFontMetrics(self.small_font).elidedText(desc_text.replace("\n", " "), Qt.ElideRight, desc_rect.width()))
+            y = desc_rect.bottom() + 4
         
         # Progress bar for subtasks
-        if self.task.subtasks and len(self.task.subtasks) > 0:
-            completed = sum(1 for subtask in self.task.subtasks if subtask["completed"])
-            total = len(self.task.subtasks)
-            progress = int((completed / total) * 100) if total > 0 else 0
-            
-            progress_bar = QProgressBar()
-            progress_bar.setValue(progress)
-            progress_bar.setTextVisible(False)
-            progress_bar.setMaximumHeight(8)
-            progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: {THEMES[self.theme]['background']};
-                    border: none;
-                    border-radius: 4px;
-                    margin-top: 5px;
-                    margin-bottom: 5px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {THEMES[self.theme]['primary']};
-                    border-radius: 4px;
-                }}
-            """)
-            details_layout.addWidget(progress_bar)
-        
-        details_layout.addLayout(meta_layout)
-        layout.addWidget(details_widget)
-        
-        # Buttons container with vertical layout to save space
-        buttons_widget = QWidget()
-        buttons_layout = QVBoxLayout(buttons_widget)
-        buttons_layout.setContentsMargins(0, 0, 0, 0)
-        buttons_layout.setSpacing(4)
-        
-        # Edit and delete buttons with compact styling
-        edit_btn = QPushButton("✏️")
-        edit_btn.setToolTip("Edit Task")
-        edit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {THEMES[self.theme]['primary']};
-                color: white;
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12pt;
-                min-width: 30px;
-                max-width: 30px;
-                min-height: 30px;
-                max-height: 30px;
-            }}
-            QPushButton:hover {{
-                background-color: {THEMES[self.theme]['secondary']};
-            }}
-        """)
-        edit_btn.clicked.connect(self.on_edit_clicked)
-        buttons_layout.addWidget(edit_btn)
-        
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Delete Task")
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #F44336;
-                color: white;
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12pt;
-                min-width: 30px;
-                max-width: 30px;
-                min-height: 30px;
-                max-height: 30px;
-            }}
-            QPushButton:hover {{
-                background-color: #E53935;
-            }}
-        """)
-        delete_btn.clicked.connect(self.on_delete_clicked)
-        buttons_layout.addWidget(delete_btn)
-        
-        layout.addWidget(buttons_widget)
-        
-        # Set background color based on completion or custom color
-        if self.task.color:
-            self.setStyleSheet(f"background-color: {self.task.color}; border-radius: 8px; margin: 4px; box-shadow: 0px 2px 5px rgba(0,0,0,0.1);")
-        elif self.task.completed:
-            self.setStyleSheet(f"background-color: {THEMES[self.theme]['background']}; border-radius: 8px; margin: 4px; box-shadow: 0px 2px 5px rgba(0,0,0,0.1);")
-        else:
-            self.setStyleSheet(f"background-color: white; border-radius: 8px; margin: 4px; box-shadow: 0px 2px 5px rgba(0,0,0,0.1);")
+        if task.subtasks:
+            completed = sum(1 for subtask in task.subtasks if subtask.get("completed"))
+            bar = QRect(content.left(), y + 2, min(content.width(), 350), 8)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(colors["background"]))
+            painter.drawRoundedRect(QRectF(bar), 4, 4)
+            if completed:
+                chunk = QRect(bar.left(), bar.top(), int(bar.width() * completed / len(task.subtasks)), bar.height())
+                painter.setBrush(QColor(colors["primary"]))
+                painter.drawRoundedRect(QRectF(chunk), 4, 4)
+            y = bar.bottom() + 6
+        
+        # Due date and category chips
+        painter.setFont(self.small_bold_font)
+        metrics = QFontMetrics(self.small_bold_font)
+        chips = []
+        if task.due_date:
+            due_date = QDate.fromString(task.due_date, Qt.ISODate)
+            chips.append(f"📅 {due_date.toString('MMM d, yyyy')}")
+        chips.append(f"🏷️ {task.category}")
+        chip_x = content.left()
+        for chip in chips:
+            chip_rect = QRect(chip_x, y, metrics.width(chip) + 12, 22)
+            if chip_rect.bottom() > card.bottom() - 2:
+                chip_rect.moveBottom(card.bottom() - 4)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.CHIP_COLOR)
+            painter.drawRoundedRect(QRectF(chip_rect), 3, 3)
+            painter.setPen(QColor(colors["accent"]))
+            painter.drawText(chip_rect, Qt.AlignCenter, chip)
+            chip_x = chip_rect.right() + 10
+        
+        # Edit and delete buttons
+        painter.setFont(self.button_font)
+        for part, icon, color, hover_color in (
+                ("edit", "✏️", colors["primary"], colors["secondary"]),
+                ("delete", "🗑️", self.DELETE_COLOR, self.DELETE_HOVER_COLOR)):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(hover_color if hover == part else color))
+            painter.drawRoundedRect(QRectF(parts[part]), 4, 4)
+            painter.setPen(QColor("white"))
+            painter.drawText(parts[part], Qt.AlignCenter, icon)
+        
+        painter.restore()
     
-    def on_completion_changed(self, state):
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            if option.widget is not None:
+                option.widget.viewport().update(option.rect)
+            return False
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        
+        task = index.data(TaskListModel.TaskRole)
+        part = self._hit(option.rect, event.pos())
+        if task is None or part is None:
+            return False
         try:
-            self.task.completed = (state == Qt.Checked)
-            if self.task.completed:
-                self.task.completion_date = datetime.datetime.now().isoformat()
-                self.title_label.setStyleSheet(f"color: {THEMES[self.theme]['completed']}; text-decoration: line-through;")
-            else:
-                self.task.completion_date = None
-                self.title_label.setStyleSheet(f"color: {THEMES[self.theme]['text']};")
-            
-            # Emit signal instead of using fragile parent chain
-            self.task_completed.emit(self.task)
+            if part == "checkbox":
+                self.on_completion_changed(task)
+            elif part == "edit":
+                self.task_edit_requested.emit(task)
+            elif part == "delete":
+                self.on_delete_clicked(task, option.widget)
         except Exception as e:
-            print(f"Error in completion change: {e}")
+            print(f"Error handling task action: {e}")
+        return True
     
-    def on_edit_clicked(self):
-        try:
-            self.task_edit_requested.emit(self.task)
-        except Exception as e:
-            print(f"Error in edit request: {e}")
+    def helpEvent(self, event, view, option, index):
+        part = self._hit(option.rect, event.pos())
+        if part in ("edit", "delete"):
+            QToolTip.showText(event.globalPos(), "Edit Task" if part == "edit" else "Delete Task", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+    
+    def on_completion_changed(self, task):
+        task.completed = not task.completed
+        task.completion_date = datetime.datetime.now().isoformat() if task.completed else None
+        
+        # Emit signal instead of using fragile parent chain
+        self.task_completed.emit(task)
+    
+    def on_delete_clicked(self, task, parent):
+        # Create a custom dialog to ensure full control over styling
+        dialog = QDialog(parent)
+        dialog.setObjectName("deleteDialog")
+        dialog.setWindowTitle("🗑️ Confirm Deletion")
+        dialog.setModal(True)
+        dialog.resize(350, 150)
+        
+        # Main layout
+        layout = QVBoxLayout(dialog)
+        layout.setSpacing(20)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Message
+        message = QLabel(f"Are you sure you want to delete\n'{task.title}'?")
+        message.setAlignment(Qt.AlignCenter)
+        message.setWordWrap(True)
+        message.setObjectName("deleteMessage")
+        layout.addWidget(message)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(15)
+        
+        # No button (default)
+        no_btn = QPushButton("❌ No")
+        no_btn.setProperty("role", "confirm")
+        no_btn.clicked.connect(dialog.reject)
+        
+        # Yes button
+        yes_btn = QPushButton("✅ Yes, Delete")
+        yes_btn.setProperty("role", "danger")
+        yes_btn.clicked.connect(dialog.accept)
+        
+        button_layout.addWidget(no_btn)
+        button_layout.addWidget(yes_btn)
+        layout.addLayout(button_layout)
+        
+        # Show dialog and handle result
+        if dialog.exec_() == QDialog.Accepted:
+            self.task_delete_requested.emit(task.id)
+
+class TaskListView(QListView):
+    """Virtualized task list: one model and delegate instead of a widget per task"""
+    
+    task_completed = pyqtSignal(object)
+    task_edit_requested = pyqtSignal(object)
+    task_delete_requested = pyqtSignal(int)
+    
+    def __init__(self, parent=None, theme=DEFAULT_THEME, row_height=120):
+        super().__init__(parent)
+        self.task_model = TaskListModel(self)
+        self.delegate = TaskItemDelegate(self, theme=theme, row_height=row_height)
+        self.setModel(self.task_model)
+        self.setItemDelegate(self.delegate)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        
+        self.delegate.task_completed.connect(self.task_completed)
+        self.delegate.task_edit_requested.connect(self.task_edit_requested)
+        self.delegate.task_delete_requested.connect(self.task_delete_requested)
     
-    def on_delete_clicked(self):
+    def set_tasks(self, tasks):
+        self.task_model.set_tasks(tasks)
+    
+    def selected_tasks(self):
+        """Selected tasks in row order"""
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        return [self.task_model.task_at(row) for row in rows]
+    
+    def set_theme(self, theme):
+        self.delegate.theme = theme
+        self.viewport().update()
+    
+    def count(self):
+        return self.task_model.rowCount()
+
+class ReminderScheduler(QObject):
+    """Fires task reminders exactly when due from a min-heap and one single-shot timer"""
+    
+    reminder_due = pyqtSignal(object)
+    
+    def __init__(self, task_manager, parent=None):
+        super().__init__(parent)
+        self.task_manager = task_manager
+        self._heap = []  # (reminder_time, task_id); stale entries are skipped lazily
+        self._armed = {}  # task id -> reminder_time currently scheduled
+        self._fired = {}  # task id -> reminder_time already shown, to avoid double-firing
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._fire)
+        self.task_manager.subscribe(self.on_tasks_changed)
+        self.reschedule_all()
+    
+    @staticmethod
+    def _reminder_time(task):
+        if not task.reminder or task.completed:
+            return None
         try:
-            # Create a custom dialog to ensure full control over styling
-            from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-            
-            dialog = QDialog(self)
-            dialog.setWindowTitle("🗑️ Confirm Deletion")
-            dialog.setModal(True)
-            dialog.resize(350, 150)
-            
-            # Main layout
-            layout = QVBoxLayout(dialog)
-            layout.setSpacing(20)
-            layout.setContentsMargins(20, 20, 20, 20)
-            
-            # Message
-            message = QLabel(f"Are you sure you want to delete\n'{self.task.title}'?")
-            message.setAlignment(Qt.AlignCenter)
-            message.setWordWrap(True)
-            message.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    color: #333333;
-                    font-weight: bold;
-                    padding: 10px;
-                }
-            """)
-            layout.addWidget(message)
-            
-            # Buttons
-            button_layout = QHBoxLayout()
-            button_layout.setSpacing(15)
-            
-            # No button (default)
-            no_btn = QPushButton("❌ No")
-            no_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    padding: 12px 24px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    font-size: 12px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-                QPushButton:pressed {
-                    background-color: #1e7e34;
-                }
-            """)
-            no_btn.clicked.connect(dialog.reject)
-            
-            # Yes button
-            yes_btn = QPushButton("✅ Yes, Delete")
-            yes_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                    color: white;
-                    border: none;
-                    padding: 12px 24px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    font-size: 12px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #c82333;
-                }
-                QPushButton:pressed {
-                    background-color: #bd2130;
-                }
-            """)
-            yes_btn.clicked.connect(dialog.accept)
-            
-            button_layout.addWidget(no_btn)
-            button_layout.addWidget(yes_btn)
-            layout.addLayout(button_layout)
-            
-            # Set dialog styling
-            dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #ffffff;
-                    border: 2px solid #cccccc;
-                    border-radius: 10px;
-                }
-            """)
-            
-            # Show dialog and handle result
-            if dialog.exec_() == QDialog.Accepted:
-                self.task_delete_requested.emit(self.task.id)
-                
-        except Exception as e:
-            print(f"Error in delete request: {e}")
+            return datetime.datetime.fromisoformat(task.reminder)
+        except (TypeError, ValueError):
+            return None
+    
+    def reschedule_all(self):
+        now = datetime.datetime.now()
+        self._heap = []
+        self._armed = {}
+        for task in self.task_manager.store:
+            self._schedule(task, now)
+        heapq.heapify(self._heap)
+        self._arm()
+    
+    def _schedule(self, task, now, push=None):
+        """Record task's reminder; returns True if it changed what is armed"""
+        when = self._reminder_time(task)
+        if when is None or when < now - datetime.timedelta(seconds=REMINDER_GRACE_SECONDS) \
+                or self._fired.get(task.id) == when:
+            return self._armed.pop(task.id, None) is not None
+        if self._armed.get(task.id) == when:
+            return False
+        self._armed[task.id] = when
+        if push:
+            push(self._heap, (when, task.id))
+        else:
+            self._heap.append((when, task.id))
+        return True
+    
+    def on_tasks_changed(self, change):
+        if change.kind == "batch":
+            for single in change.task:
+                self.on_tasks_changed(single)
+            return
+        if change.kind == "reset":
+            self.reschedule_all()
+            return
+        if change.kind == "removed":
+            self._fired.pop(change.task_id, None)
+            changed = self._armed.pop(change.task_id, None) is not None
+        elif change.kind in ("added", "updated"):
+            changed = self._schedule(change.task, datetime.datetime.now(), push=heapq.heappush)
+        else:
+            return
+        if changed:
+            self._arm()
+    
+    def _discard_stale(self):
+        while self._heap and self._armed.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+    
+    def _arm(self):
+        """Point the timer at the earliest live reminder, or stop it when there is none"""
+        self._discard_stale()
+        if not self._heap:
+            self.timer.stop()
+            return
+        delay = (self._heap[0][0] - datetime.datetime.now()).total_seconds() * 1000
+        self.timer.start(int(min(max(delay, 0), REMINDER_MAX_SLEEP_MS)))
+    
+    def _fire(self):
+        now = datetime.datetime.now()
+        self._discard_stale()
+        while self._heap and self._heap[0][0] <= now:
+            when, task_id = heapq.heappop(self._heap)
+            if self._armed.get(task_id) != when:
+                continue
+            del self._armed[task_id]
+            self._fired[task_id] = when
+            task = self.task_manager.get_task(task_id)
+            if task is not None and not task.completed:
+                self.reminder_due.emit(task)
+        self._arm()
+    
+    def next_reminder(self):
+        """(reminder_time, task_id) of the next reminder to fire, or None"""
+        self._discard_stale()
+        return self._heap[0] if self._heap else None
+
+class CelebrationChannel(QObject):
+    """Queues completed tasks and releases them at most once per CELEBRATION_MIN_INTERVAL_MS.
+    
+    Everything completed in one burst (a bulk edit, or several clicks within the interval)
+    comes out as a single celebration_ready list.
+    """
+    
+    celebration_ready = pyqtSignal(list)
+    
+    def __init__(self, parent=None, min_interval_ms=CELEBRATION_MIN_INTERVAL_MS):
+        super().__init__(parent)
+        self.min_interval_ms = min_interval_ms
+        self._pending = []
+        self._last_release = None  # time.monotonic() of the last celebration
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._release)
+    
+    def post(self, task):
+        self._pending.append(task)
+        if self.timer.isActive():
+            return
+        wait = 0
+        if self._last_release is not None:
+            elapsed_ms = (time.monotonic() - self._last_release) * 1000
+            wait = max(0, int(self.min_interval_ms - elapsed_ms))
+        # Even with no wait the timer fires after the current event, so a burst is merged
+        self.timer.start(wait)
+    
+    def _release(self):
+        tasks, self._pending = self._pending, []
+        if tasks:
+            self._last_release = time.monotonic()
+            profiler.count("celebrations.shown")
+            profiler.count("celebrations.merged", len(tasks) - 1)
+            self.celebration_ready.emit(tasks)
+
+class CelebrationOverlay(QFrame):
+    """Celebration card floating over the top of its window, built once and reused for every completion"""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setObjectName("celebrationOverlay")
+        self.setFixedWidth(400)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        self.sticker_label = QLabel()
+        self.sticker_label.setObjectName("celebrationSticker")
+        self.sticker_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.sticker_label)
+        
+        self.message_label = QLabel()
+        self.message_label.setObjectName("celebrationMessage")
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
+        
+        self.tasks_label = QLabel()
+        self.tasks_label.setObjectName("celebrationTasks")
+        self.tasks_label.setAlignment(Qt.AlignCenter)
+        self.tasks_label.setWordWrap(True)
+        layout.addWidget(self.tasks_label)
+        
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self.hide)
+        parent.installEventFilter(self)
+        self.hide()
+    
+    def celebrate(self, sticker, message, tasks_text):
+        self.sticker_label.setText(sticker)
+        self.message_label.setText(message)
+        self.tasks_label.setText(tasks_text)
+        self.adjustSize()
+        self._place()
+        self.show()
+        self.raise_()
+        self.hide_timer.start(CELEBRATION_SHOW_MS)
+    
+    def _place(self):
+        parent = self.parentWidget()
+        self.move(max(0, (parent.width() - self.width()) // 2), max(0, parent.height() // 6))
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize and self.isVisible():
+            self._place()
+        return False
+    
+    def mousePressEvent(self, event):
+        self.hide_timer.stop()
+        self.hide()
 
 class TaskDialog(QDialog):
     def __init__(self, parent=None, task=None, categories=None, tags=None, theme=DEFAULT_THEME):
@@ -792,29 +1183,13 @@ class TaskDialog(QDialog):
         
         # Create sticker buttons grid
         sticker_grid = QHBoxLayout()
-        self.selected_sticker = getattr(self.task, 'sticker', None) if self.task else None
+        self.selected_sticker = self.task.sticker if self.task else None
         self.sticker_buttons = []
         
         for i, sticker in enumerate(category_stickers):
             sticker_btn = QPushButton(sticker)
             sticker_btn.setFixedSize(40, 40)
-            sticker_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 20px;
-                    border: 2px solid #cccccc;
-                    border-radius: 20px;
-                    background-color: #f9f9f9;
-                }
-                QPushButton:hover {
-                    border-color: #007acc;
-                    background-color: #e6f3ff;
-                }
-                QPushButton:checked {
-                    border-color: #007acc;
-                    background-color: #cce7ff;
-                    border-width: 3px;
-                }
-            """)
+            sticker_btn.setProperty("role", "sticker")
             sticker_btn.setCheckable(True)
             sticker_btn.clicked.connect(lambda checked, s=sticker: self.select_sticker(s))
             
@@ -836,17 +1211,7 @@ class TaskDialog(QDialog):
         # No sticker option
         no_sticker_btn = QPushButton("❌ No Sticker")
         no_sticker_btn.clicked.connect(lambda: self.select_sticker(None))
-        no_sticker_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        no_sticker_btn.setProperty("role", "plain")
         sticker_layout.addWidget(no_sticker_btn)
         
         content_layout.addWidget(sticker_group)
@@ -906,33 +1271,11 @@ class TaskDialog(QDialog):
         buttons_layout = QHBoxLayout()
         save_btn = QPushButton("Save")
         save_btn.clicked.connect(self.accept)
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {THEMES[self.theme]['primary']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {THEMES[self.theme]['secondary']};
-            }}
-        """)
+        save_btn.setProperty("role", "primary")
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #9E9E9E;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #757575;
-            }}
-        """)
+        cancel_btn.setProperty("role", "cancel")
         
         buttons_layout.addWidget(save_btn)
         buttons_layout.addWidget(cancel_btn)
@@ -1028,14 +1371,159 @@ class TaskDialog(QDialog):
             task.sticker = self.selected_sticker
             return task
 
+class DeveloperDock(QDockWidget):
+    """Hidden developer dock showing profiler spans, counters and a latency histogram live"""
+    
+    def __init__(self, task_manager, parent=None):
+        super().__init__("Developer Tools", parent)
+        self.task_manager = task_manager
+        self.setObjectName("developerDock")
+        
+        content = QWidget()
+        layout = QVBoxLayout(content)
+        
+        histogram_layout = QHBoxLayout()
+        histogram_layout.addWidget(QLabel("Histogram:"))
+        self.histogram_span = "ui.frame_lag"
+        self.histogram_combo = QComboBox()
+        self.histogram_combo.addItem(self.histogram_span)
+        self.histogram_combo.currentTextChanged.connect(self.on_histogram_span_changed)
+        histogram_layout.addWidget(self.histogram_combo)
+        layout.addLayout(histogram_layout)
+        
+        self.report = QTextEdit()
+        self.report.setReadOnly(True)
+        self.report.setLineWrapMode(QTextEdit.NoWrap)
+        self.report.setFont(QFont("Courier New", 9))
+        layout.addWidget(self.report)
+        
+        buttons_layout = QHBoxLayout()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        trace_btn = QPushButton("Dump Trace")
+        trace_btn.clicked.connect(self.dump_trace)
+        self.cprofile_btn = QPushButton("Start cProfile")
+        self.cprofile_btn.clicked.connect(self.toggle_cprofile)
+        buttons_layout.addWidget(reset_btn)
+        buttons_layout.addWidget(trace_btn)
+        buttons_layout.addWidget(self.cprofile_btn)
+        layout.addLayout(buttons_layout)
+        self.setWidget(content)
+        
+        # Both timers only run while the dock is visible
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(DEVTOOLS_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setInterval(FRAME_PROBE_MS)
+        self.frame_timer.timeout.connect(self.on_frame)
+        self._last_frame = None
+        self.visibilityChanged.connect(self.on_visibility_changed)
+    
+    def on_visibility_changed(self, visible):
+        if visible:
+            self._last_frame = None
+            self.frame_timer.start()
+            self.refresh_timer.start()
+            self.refresh()
+        else:
+            self.frame_timer.stop()
+            self.refresh_timer.stop()
+    
+    def on_histogram_span_changed(self, name):
+        self.histogram_span = name
+        self.refresh()
+    
+    def on_frame(self):
+        # How late the probe fires is how long the event loop was busy, i.e. frame latency
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            profiler.record("ui.frame_lag", max(0.0, now - self._last_frame - FRAME_PROBE_MS / 1000))
+        self._last_frame = now
+    
+    def refresh(self):
+        snapshot = profiler.snapshot()
+        spans = snapshot["spans"]
+        
+        names = sorted(spans)
+        choices = sorted(set(names) | {self.histogram_span})
+        if choices != [self.histogram_combo.itemText(i) for i in range(self.histogram_combo.count())]:
+            self.histogram_combo.blockSignals(True)
+            self.histogram_combo.clear()
+            self.histogram_combo.addItems(choices)
+            self.histogram_combo.setCurrentText(self.histogram_span)
+            self.histogram_combo.blockSignals(False)
+        
+        lines = [f"{'span':<26}{'calls':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'max':>9}{'total':>10}  (ms)"]
+        for name in names:
+            span = spans[name]
+            lines.append(f"{name:<26}{span['calls']:>8}{span['mean_ms']:>9.2f}{span['p50_ms']:>9.2f}"
+                         f"{span['p95_ms']:>9.2f}{span['max_ms']:>9.2f}{span['total_ms']:>10.1f}")
+        
+        lines.append("")
+        counters = dict(snapshot["counters"])
+        cache = self.task_manager.query_cache.stats()
+        counters["query_cache.hits"] = cache["hits"]
+        counters["query_cache.misses"] = cache["misses"]
+        counters["persist.writes"] = self.task_manager.persistence.writes
+        for name in sorted(counters):
+            lines.append(f"{name:<34}{counters[name]:>12}")
+        
+        histogram = profiler.histogram(self.histogram_span)
+        most = max((count for _, count in histogram), default=0)
+        lines.append("")
+        lines.append(f"{self.histogram_span} (last {profiler.window})")
+        for label, count in histogram:
+            bar = "█" * (round(count / most * 40) if most else 0)
+            lines.append(f"{label:>10} {count:>6} {bar}")
+        
+        self.report.setPlainText("\n".join(lines))
+    
+    def reset(self):
+        profiler.reset()
+        self.refresh()
+    
+    def dump_trace(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Trace", "taskmaster-trace.json", "JSON Files (*.json)")
+        if not file_path:
+            return
+        try:
+            profiler.dump_trace(file_path)
+            QMessageBox.information(self, "Trace Saved", f"Trace written to {file_path}\n(open it in chrome://tracing or Perfetto)")
+        except Exception as e:
+            QMessageBox.critical(self, "Trace Error", f"Error writing trace: {str(e)}")
+    
+    def toggle_cprofile(self):
+        if not profiler.cprofile_running:
+            profiler.start_cprofile()
+            self.cprofile_btn.setText("Stop cProfile")
+            return
+        self.cprofile_btn.setText("Start cProfile")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Profile", "taskmaster.prof", "Profile Files (*.prof)")
+        try:
+            profiler.stop_cprofile(file_path or None)
+        except Exception as e:
+            QMessageBox.critical(self, "Profile Error", f"Error writing profile: {str(e)}")
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Emitted from the persistence worker thread, delivered on the GUI thread
+    persistence_failed = pyqtSignal(str)
+    
+    def __init__(self, task_manager=None):
         super().__init__()
-        self.task_manager = TaskManager()
+        self.task_manager = task_manager if task_manager is not None else TaskManager()
         self.current_theme = DEFAULT_THEME
+        self._stats_dirty = True
+        self._quitting = False
         self.setup_ui()
+        self.task_manager.subscribe(self.on_tasks_changed)
+        self.persistence_failed.connect(self.on_persistence_failed)
+        self.task_manager.persistence.on_error = self.persistence_failed.emit
         self.setup_tray_icon()
         self.setup_reminders()
+        self.setup_celebrations()
+        self.setup_midnight_timer()
+        self.setup_developer_tools()
     
     def setup_ui(self):
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
@@ -1054,33 +1542,18 @@ class MainWindow(QMainWindow):
         header_layout.setContentsMargins(10, 10, 10, 10)
         
         app_title = QLabel(APP_NAME)
-        app_title.setStyleSheet(f"font-family: 'Segoe UI', 'Roboto', sans-serif; font-size: 32pt; font-weight: bold; color: {THEMES[self.current_theme]['primary']}; letter-spacing: 1px; text-shadow: 2px 2px 3px rgba(0,0,0,0.2);")
+        app_title.setObjectName("appTitle")
         header_layout.addWidget(app_title)
         
         # Theme selector with custom styling
         theme_layout = QHBoxLayout()
         self.theme_label = QLabel("Theme:")
-        self.theme_label.setStyleSheet(f"color: {THEMES[self.current_theme]['text']}; font-size: 11pt; font-weight: bold;")
+        self.theme_label.setObjectName("themeLabel")
         self.theme_combo = QComboBox()
+        self.theme_combo.setObjectName("themeCombo")
         self.theme_combo.addItems(list(THEMES.keys()))
         self.theme_combo.setCurrentText(self.current_theme)
         self.theme_combo.currentTextChanged.connect(self.change_theme)
-        self.theme_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {THEMES[self.current_theme]['background']};
-                color: {THEMES[self.current_theme]['text']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-                border-radius: 4px;
-                padding: 5px 10px;
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-            }}
-        """)
         theme_layout.addWidget(self.theme_label)
         theme_layout.addWidget(self.theme_combo)
         header_layout.addLayout(theme_layout)
@@ -1102,68 +1575,78 @@ class MainWindow(QMainWindow):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search tasks...")
-        self.search_input.textChanged.connect(self.filter_tasks)
+        # Debounce typing so the list is filtered once the user pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.filter_tasks)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
         self.search_input.setMinimumWidth(250)
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: {THEMES[self.current_theme]['background']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-            }}
-        """)
+        self.search_input.setObjectName("searchInput")
         filter_layout.addWidget(self.search_input)
         
         filter_label = QLabel("Filter:")
-        filter_label.setStyleSheet(f"color: {THEMES[self.current_theme]['text']}; font-size: 11pt;")
+        filter_label.setProperty("role", "field")
         filter_layout.addWidget(filter_label)
         
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["All", "Completed", "Incomplete", "High Priority", "Medium Priority", "Low Priority", "Overdue"])
-        self.filter_combo.currentTextChanged.connect(self.filter_tasks)
+        self.filter_combo.addItems(FILTER_OPTIONS)
+        self.filter_combo.currentTextChanged.connect(lambda _: self.filter_tasks())
         self.filter_combo.setMinimumWidth(150)
-        self.filter_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: {THEMES[self.current_theme]['background']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-            }}
-        """)
+        self.filter_combo.setObjectName("filterCombo")
         filter_layout.addWidget(self.filter_combo)
         
         self.sort_label = QLabel("Sort:")
-        self.sort_label.setStyleSheet(f"color: {THEMES[self.current_theme]['text']}; font-size: 11pt;")
+        self.sort_label.setProperty("role", "field")
         filter_layout.addWidget(self.sort_label)
         
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems(["Due Date", "Priority", "Title", "Creation Date", "Category"])
-        self.sort_combo.currentTextChanged.connect(self.filter_tasks)
+        self.sort_combo.addItems(SORT_OPTIONS)
+        self.sort_combo.currentTextChanged.connect(lambda _: self.change_sort())
         self.sort_combo.setMinimumWidth(120)
+        self.sort_combo.setObjectName("sortCombo")
         filter_layout.addWidget(self.sort_combo)
         
         all_tasks_layout.addWidget(filter_widget)
         
-        # Tasks list
-        self.tasks_list = QListWidget()
-        self.tasks_list.setSpacing(5)
+        # Tasks list; Ctrl/Shift-click selects several tasks for the bulk actions
+        self.tasks_list = self._create_task_view()
+        self.tasks_list.setSelectionMode(QListView.ExtendedSelection)
+        self.tasks_list.selectionModel().selectionChanged.connect(lambda *_: self.update_bulk_actions())
+        # Resets and removed rows change the selection without selectionChanged
+        self.tasks_list.task_model.modelReset.connect(self.update_bulk_actions)
+        self.tasks_list.task_model.rowsRemoved.connect(lambda *_: self.update_bulk_actions())
+        delete_selected = QAction("Delete Selected Tasks", self.tasks_list)
+        delete_selected.setShortcut(QKeySequence.Delete)
+        delete_selected.setShortcutContext(Qt.WidgetShortcut)
+        delete_selected.triggered.connect(self.bulk_delete)
+        self.tasks_list.addAction(delete_selected)
         all_tasks_layout.addWidget(self.tasks_list)
         
+        # Bulk actions, shown while tasks are selected
+        self.bulk_bar = QWidget()
+        bulk_layout = QHBoxLayout(self.bulk_bar)
+        bulk_layout.setContentsMargins(0, 0, 0, 0)
+        self.bulk_label = QLabel()
+        self.bulk_label.setProperty("role", "field")
+        bulk_layout.addWidget(self.bulk_label)
+        for text, handler, role in (("✅ Complete", lambda: self.bulk_complete(True), "primary"),
+                                    ("↩️ Reopen", lambda: self.bulk_complete(False), "plain"),
+                                    ("📁 Move", self.bulk_move, "plain"),
+                                    ("🏷️ Tag", self.bulk_tag, "plain"),
+                                    ("🏷️ Untag", self.bulk_untag, "plain"),
+                                    ("📅 Reschedule", self.bulk_reschedule, "plain"),
+                                    ("🗑️ Delete", self.bulk_delete, "danger")):
+            button = QPushButton(text)
+            button.setProperty("role", role)
+            button.clicked.connect(handler)
+            bulk_layout.addWidget(button)
+        bulk_layout.addStretch()
+        self.bulk_bar.hide()
+        all_tasks_layout.addWidget(self.bulk_bar)
+        
         # Add task button
         add_task_btn = QPushButton("Add New Task")
-        add_task_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {THEMES[self.current_theme]['primary']};
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {THEMES[self.current_theme]['secondary']};
-            }}
-        """)
         add_task_btn.clicked.connect(self.add_task)
         all_tasks_layout.addWidget(add_task_btn)
         
@@ -1174,7 +1657,9 @@ class MainWindow(QMainWindow):
         categories_layout = QVBoxLayout(self.categories_tab)
         
         self.category_tabs = QTabWidget()
+        self.category_tabs.currentChanged.connect(lambda _: self._fill_current_category())
         categories_layout.addWidget(self.category_tabs)
+        self._stale_categories = set()  # Categories whose tab view needs filling from scratch
         
         self.tabs.addTab(self.categories_tab, f"{BUTTON_ICONS['categories']} Categories")
         
@@ -1184,30 +1669,11 @@ class MainWindow(QMainWindow):
         
         self.calendar = QCalendarWidget()
         self.calendar.clicked.connect(self.on_calendar_clicked)
-        self.calendar.setStyleSheet(f"""
-            QCalendarWidget {{
-                background-color: {THEMES[self.current_theme]['background']};
-                color: {THEMES[self.current_theme]['text']};
-            }}
-            QCalendarWidget QToolButton {{
-                color: {THEMES[self.current_theme]['text']};
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QCalendarWidget QToolButton:hover {{
-                background-color: {THEMES[self.current_theme]['accent']};
-            }}
-            QCalendarWidget QMenu {{
-                background-color: {THEMES[self.current_theme]['background']};
-                color: {THEMES[self.current_theme]['text']};
-            }}
-        """)
+        self.calendar.currentPageChanged.connect(lambda year, month: self._paint_calendar_heatmap())
+        self.calendar.setObjectName("taskCalendar")
         calendar_layout.addWidget(self.calendar)
         
-        self.calendar_tasks_list = QListWidget()
-        self.calendar_tasks_list.setSpacing(5)
+        self.calendar_tasks_list = self._create_task_view()
         calendar_layout.addWidget(QLabel("Tasks for selected date:"))
         calendar_layout.addWidget(self.calendar_tasks_list)
         
@@ -1256,6 +1722,7 @@ class MainWindow(QMainWindow):
         category_group = QGroupBox("Category Distribution")
         category_layout = QVBoxLayout(category_group)
         self.category_stats_layout = QVBoxLayout()
+        self.category_stat_labels = {}
         category_layout.addLayout(self.category_stats_layout)
         
         stats_content_layout.addWidget(category_group)
@@ -1268,390 +1735,206 @@ class MainWindow(QMainWindow):
         self.due_today_label = QLabel()
         self.due_this_week_label = QLabel()
         self.no_due_date_label = QLabel()
+        self.recurring_week_label = QLabel()
         
         time_layout.addWidget(self.overdue_label)
         time_layout.addWidget(self.due_today_label)
         time_layout.addWidget(self.due_this_week_label)
         time_layout.addWidget(self.no_due_date_label)
+        time_layout.addWidget(self.recurring_week_label)
         
-        stats_content_layout.addWidget(time_group)
-        
-        stats_content_layout.addStretch()
-        stats_scroll.setWidget(stats_content)
-        stats_layout.addWidget(stats_scroll)
-        
-        self.tabs.addTab(self.stats_tab, "Statistics")
-        
-        # Settings tab
-        self.settings_tab = QWidget()
-        settings_layout = QVBoxLayout(self.settings_tab)
-        
-        # Categories management
-        categories_group = QGroupBox("Manage Categories")
-        categories_group_layout = QVBoxLayout(categories_group)
-        
-        self.categories_list = QListWidget()
-        self.categories_list.addItems(self.task_manager.categories)
-        categories_group_layout.addWidget(self.categories_list)
-        
-        categories_btn_layout = QHBoxLayout()
-        add_category_btn = QPushButton(f"{BUTTON_ICONS['add']} Add Category")
-        add_category_btn.clicked.connect(self.add_category)
-        add_category_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {THEMES[self.current_theme]['primary']};
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {THEMES[self.current_theme]['secondary']};
-            }}
-        """)
-        
-        remove_category_btn = QPushButton(f"{BUTTON_ICONS['delete']} Remove Selected")
-        remove_category_btn.clicked.connect(self.remove_category)
-        categories_group_layout.addLayout(categories_btn_layout)
-        
-        settings_layout.addWidget(categories_group)
-        
-        # Tags management
-        tags_group = QGroupBox("Manage Tags")
-        tags_group_layout = QVBoxLayout(tags_group)
-        
-        self.tags_list = QListWidget()
-        self.tags_list.addItems(self.task_manager.tags)
-        tags_group_layout.addWidget(self.tags_list)
-        
-        tags_btn_layout = QHBoxLayout()
-        add_tag_btn = QPushButton(f"{BUTTON_ICONS['add']} Add Tag")
-        add_tag_btn.clicked.connect(self.add_tag)
-        add_tag_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {THEMES[self.current_theme]['primary']};
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {THEMES[self.current_theme]['secondary']};
-            }}
-        """)
-        
-        remove_tag_btn = QPushButton(f"{BUTTON_ICONS['delete']} Remove Selected")
-        remove_tag_btn.clicked.connect(self.remove_tag)
-        tags_group_layout.addLayout(tags_btn_layout)
-        
-        settings_layout.addWidget(tags_group)
-        
-        # Data management
-        data_group = QGroupBox("Data Management")
-        data_group_layout = QVBoxLayout(data_group)
-        
-        export_btn = QPushButton("Export Tasks")
-        export_btn.clicked.connect(self.export_tasks)
-        data_group_layout.addWidget(export_btn)
-        
-        import_btn = QPushButton("Import Tasks")
-        import_btn.clicked.connect(self.import_tasks)
-        data_group_layout.addWidget(import_btn)
-        
-        settings_layout.addWidget(data_group)
-        
-        self.tabs.addTab(self.settings_tab, "Settings")
-        
-        main_layout.addWidget(self.tabs)
-        
-        # Status bar
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage(f"Welcome to {APP_NAME}!")
-        
-        # Set central widget
-        self.setCentralWidget(central_widget)
-        
-        # Populate tasks
-        self.refresh_tasks()
-    
-    def setup_tray_icon(self):
-        # Create system tray icon
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setToolTip(APP_NAME)
-        
-        # Create tray menu
-        tray_menu = QMenu()
-        
-        show_action = QAction("Show", self)
-        show_action.triggered.connect(self.show)
-        tray_menu.addAction(show_action)
-        
-        hide_action = QAction("Hide", self)
-        hide_action.triggered.connect(self.hide)
-        tray_menu.addAction(hide_action)
-        
-        add_task_action = QAction("Add Task", self)
-        add_task_action.triggered.connect(self.add_task)
-        tray_menu.addAction(add_task_action)
-        
-        quit_action = QAction("Quit", self)
-        quit_action.triggered.connect(self.close)
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
-    
-    def setup_reminders(self):
-        # Setup timer to check for reminders
-        self.reminder_timer = QTimer(self)
-        self.reminder_timer.timeout.connect(self.check_reminders)
-        self.reminder_timer.start(60000)  # Check every minute
-    
-    def check_reminders(self):
-        current_time = datetime.datetime.now()
-        for task in self.task_manager.tasks:
-            if task.reminder and not task.completed:
-                reminder_time = datetime.datetime.fromisoformat(task.reminder)
-                time_diff = (reminder_time - current_time).total_seconds()
-                if 0 <= time_diff <= 60:  # Within a minute
-                    self.show_reminder(task)
-    
-    def show_reminder(self, task):
-        self.tray_icon.showMessage(
-            f"Reminder: {task.title}",
-            f"Due: {task.due_date if task.due_date else 'No due date'}",
-            QSystemTrayIcon.Information,
-            5000
-        )
-    
-    def apply_theme(self, theme_name):
-        if theme_name not in THEMES:
-            theme_name = DEFAULT_THEME
-        
-        self.current_theme = theme_name
-        theme = THEMES[theme_name]
-        
-        # Apply theme to application
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(theme["background"]))
-        palette.setColor(QPalette.WindowText, QColor(theme["text"]))
-        palette.setColor(QPalette.Base, QColor("white"))
-        palette.setColor(QPalette.AlternateBase, QColor(theme["background"]))
-        palette.setColor(QPalette.ToolTipBase, QColor("white"))
-        palette.setColor(QPalette.ToolTipText, QColor(theme["text"]))
-        palette.setColor(QPalette.Text, QColor(theme["text"]))
-        palette.setColor(QPalette.Button, QColor(theme["primary"]))
-        palette.setColor(QPalette.ButtonText, QColor("white"))
-        palette.setColor(QPalette.BrightText, QColor("red"))
-        palette.setColor(QPalette.Highlight, QColor(theme["primary"]))
-        palette.setColor(QPalette.HighlightedText, QColor("white"))
-        
-        self.setPalette(palette)
-        
-        # Apply stylesheet with improved fonts and styling
-        self.setStyleSheet(f"""
-            * {{  /* Global font settings */
-                font-family: 'Segoe UI', 'Roboto', 'Arial', sans-serif;
-                font-size: 11pt;
-            }}
-            QMainWindow, QDialog {{
-                background-color: {theme["background"]};
-            }}
-            QLabel {{
-                font-size: 11pt;
-            }}
-            QTabWidget::pane {{
-                border: 2px solid {theme["accent"]};
-                background-color: white;
-                border-radius: 8px;
-                padding: 5px;
-            }}
-            QTabBar::tab {{
-                background-color: {theme["background"]};
-                color: {theme["text"]};
-                padding: 10px 12px;
-                margin-right: 3px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-size: 11pt;
-                font-weight: bold;
-                min-width: 100px;
-                max-width: 150px;
-                text-align: center;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {theme["primary"]};
-                color: white;
-                font-weight: bold;
-                border-bottom: 3px solid {theme["secondary"]};
-            }}
-            QGroupBox {{
-                border: 2px solid {theme["accent"]};
-                border-radius: 8px;
-                margin-top: 15px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: rgba(255, 255, 255, 0.7);
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 10px;
-                color: {theme["primary"]};
-                font-size: 12pt;
-                font-weight: bold;
-            }}
-            QPushButton {{
-                background-color: {theme["primary"]};
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 10pt;
-                min-width: 80px;
-                max-width: 150px;
-            }}
-            QPushButton:hover {{
-                background-color: {theme["secondary"]};
-                transform: scale(1.05);
-            }}
-            QLineEdit, QTextEdit, QDateEdit, QTimeEdit, QComboBox {{
-                border: 2px solid {theme["accent"]};
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 11pt;
-                background-color: white;
-                min-height: 20px;
-            }}
-            QComboBox {{
-                min-width: 120px;
-                max-width: 200px;
-            }}
-            QProgressBar {{
-                border: 2px solid {theme["accent"]};
-                border-radius: 4px;
-                text-align: center;
-                height: 15px;
-                font-weight: bold;
-                color: white;
-                background-color: #f0f0f0;
-            }}
-            QProgressBar::chunk {{
-                background-color: {theme["primary"]};
-                border-radius: 4px;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {theme["background"]};
-                width: 14px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {theme["accent"]};
-                min-height: 30px;
-                border-radius: 7px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none;
-                background: none;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background: {theme["background"]};
-                height: 14px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {theme["accent"]};
-                min-width: 30px;
-                border-radius: 7px;
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                border: none;
-                background: none;
-            }}
-            QListWidget, QListView, QTreeView, QTableView {{
-                border: 2px solid {theme["accent"]};
-                border-radius: 6px;
-                padding: 5px;
-                background-color: white;
-                alternate-background-color: #f9f9f9;
-            }}
-            QListWidget::item:selected, QListView::item:selected {{  
-                background-color: {theme["primary"]};
-                color: white;
-                border-radius: 4px;
-            }}
-        """)
-    
-    def change_theme(self, theme_name):
-        self.current_theme = theme_name
-        self.apply_theme(theme_name)
-        
-        # Update all dynamic text colors
-        self.theme_label.setStyleSheet(f"color: {THEMES[self.current_theme]['text']}; font-size: 11pt; font-weight: bold;")
+        stats_content_layout.addWidget(time_group)
         
-        # Update theme combo styling
-        self.theme_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {THEMES[self.current_theme]['background']};
-                color: {THEMES[self.current_theme]['text']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-                border-radius: 4px;
-                padding: 5px 10px;
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-            }}
-        """)
+        stats_content_layout.addStretch()
+        stats_scroll.setWidget(stats_content)
+        stats_layout.addWidget(stats_scroll)
         
-        # Update filter and sort labels
-        if hasattr(self, 'sort_label'):
-            self.sort_label.setStyleSheet(f"color: {THEMES[self.current_theme]['text']}; font-size: 11pt;")
+        self.tabs.addTab(self.stats_tab, "Statistics")
         
-        # Update search input styling
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: {THEMES[self.current_theme]['background']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-                color: {THEMES[self.current_theme]['text']};
-            }}
-        """)
+        # Settings tab
+        self.settings_tab = QWidget()
+        settings_layout = QVBoxLayout(self.settings_tab)
         
-        # Update filter combo styling
-        self.filter_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: {THEMES[self.current_theme]['background']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-                color: {THEMES[self.current_theme]['text']};
-            }}
-        """)
+        # Categories management
+        categories_group = QGroupBox("Manage Categories")
+        categories_group_layout = QVBoxLayout(categories_group)
         
-        # Update sort combo styling
-        self.sort_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding: 8px 12px;
-                border-radius: 6px;
-                background-color: {THEMES[self.current_theme]['background']};
-                border: 1px solid {THEMES[self.current_theme]['accent']};
-                color: {THEMES[self.current_theme]['text']};
-            }}
-        """)
+        self.categories_list = QListWidget()
+        self.categories_list.addItems(self.task_manager.categories)
+        categories_group_layout.addWidget(self.categories_list)
+        
+        categories_btn_layout = QHBoxLayout()
+        add_category_btn = QPushButton(f"{BUTTON_ICONS['add']} Add Category")
+        add_category_btn.clicked.connect(self.add_category)
+        add_category_btn.setProperty("role", "primary")
+        
+        remove_category_btn = QPushButton(f"{BUTTON_ICONS['delete']} Remove Selected")
+        remove_category_btn.clicked.connect(self.remove_category)
+        categories_group_layout.addLayout(categories_btn_layout)
+        
+        settings_layout.addWidget(categories_group)
+        
+        # Tags management
+        tags_group = QGroupBox("Manage Tags")
+        tags_group_layout = QVBoxLayout(tags_group)
+        
+        self.tags_list = QListWidget()
+        self.tags_list.addItems(self.task_manager.tags)
+        tags_group_layout.addWidget(self.tags_list)
+        
+        tags_btn_layout = QHBoxLayout()
+        add_tag_btn = QPushButton(f"{BUTTON_ICONS['add']} Add Tag")
+        add_tag_btn.clicked.connect(self.add_tag)
+        add_tag_btn.setProperty("role", "primary")
+        
+        remove_tag_btn = QPushButton(f"{BUTTON_ICONS['delete']} Remove Selected")
+        remove_tag_btn.clicked.connect(self.remove_tag)
+        tags_group_layout.addLayout(tags_btn_layout)
+        
+        settings_layout.addWidget(tags_group)
+        
+        # Data management
+        data_group = QGroupBox("Data Management")
+        data_group_layout = QVBoxLayout(data_group)
+        
+        export_btn = QPushButton("Export Tasks")
+        export_btn.clicked.connect(self.export_tasks)
+        data_group_layout.addWidget(export_btn)
+        
+        import_btn = QPushButton("Import Tasks")
+        import_btn.clicked.connect(self.import_tasks)
+        data_group_layout.addWidget(import_btn)
+        
+        settings_layout.addWidget(data_group)
+        
+        self.tabs.addTab(self.settings_tab, "Settings")
+        self.tabs.currentChanged.connect(lambda _: self._update_statistics())
+        self.tabs.currentChanged.connect(lambda _: self._fill_current_category())
+        
+        main_layout.addWidget(self.tabs)
         
+        # Status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage(f"Welcome to {APP_NAME}!")
+        
+        # Set central widget
+        self.setCentralWidget(central_widget)
+        
+        # Populate tasks
         self.refresh_tasks()
     
+    def setup_tray_icon(self):
+        # Create system tray icon
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setToolTip(APP_NAME)
+        
+        # Create tray menu
+        tray_menu = QMenu()
+        
+        show_action = QAction("Show", self)
+        show_action.triggered.connect(self.show)
+        tray_menu.addAction(show_action)
+        
+        hide_action = QAction("Hide", self)
+        hide_action.triggered.connect(self.hide)
+        tray_menu.addAction(hide_action)
+        
+        add_task_action = QAction("Add Task", self)
+        add_task_action.triggered.connect(self.add_task)
+        tray_menu.addAction(add_task_action)
+        
+        quit_action = QAction("Quit", self)
+        quit_action.triggered.connect(self.quit_application)
+        tray_menu.addAction(quit_action)
+        
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.show()
+    
+    def setup_developer_tools(self):
+        # Hidden until toggled with Ctrl+Shift+D
+        self.developer_dock = DeveloperDock(self.task_manager, self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.developer_dock)
+        self.developer_dock.hide()
+        toggle_action = QAction("Developer Tools", self)
+        toggle_action.setShortcut("Ctrl+Shift+D")
+        toggle_action.triggered.connect(lambda: self.developer_dock.setVisible(not self.developer_dock.isVisible()))
+        self.addAction(toggle_action)
+    
+    def setup_reminders(self):
+        # Fire each reminder when it is due instead of polling every minute
+        self.reminder_scheduler = ReminderScheduler(self.task_manager, self)
+        self.reminder_scheduler.reminder_due.connect(self.show_reminder)
+    
+    def setup_celebrations(self):
+        # One overlay reused for every completion, fed through a rate-limited channel
+        self.celebration_overlay = CelebrationOverlay(self)
+        self.celebrations = CelebrationChannel(self)
+        self.celebrations.celebration_ready.connect(self.on_celebration_ready)
+    
+    def setup_midnight_timer(self):
+        # Date-relative statistics roll over at midnight
+        self.midnight_timer = QTimer(self)
+        self.midnight_timer.setSingleShot(True)
+        self.midnight_timer.timeout.connect(self.on_midnight)
+        self._arm_midnight_timer()
+    
+    def _arm_midnight_timer(self):
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+        self.midnight_timer.start(int((midnight - now).total_seconds() * 1000) + 1000)
+    
+    def on_midnight(self):
+        self.task_manager.statistics.roll_over()
+        self._stats_dirty = True
+        self._update_statistics()
+        self._arm_midnight_timer()
+    
+    def show_reminder(self, task):
+        self.tray_icon.showMessage(
+            f"Reminder: {task.title}",
+            f"Due: {task.due_date if task.due_date else 'No due date'}",
+            QSystemTrayIcon.Information,
+            5000
+        )
+    
+    def apply_theme(self, theme_name):
+        if theme_name not in THEMES:
+            theme_name = DEFAULT_THEME
+        
+        self.current_theme = theme_name
+        
+        # One cached stylesheet at application level, so dialogs pick it up too and a switch is a single polish pass
+        app = QApplication.instance()
+        app.setPalette(theme_compiler.palette(theme_name))
+        app.setStyleSheet(theme_compiler.stylesheet(theme_name))
+    
+    def change_theme(self, theme_name):
+        self.apply_theme(theme_name)
+        
+        # Task rows are painted by the delegates, so a repaint is enough
+        for view in self._task_views():
+            view.set_theme(self.current_theme)
+        self._paint_calendar_heatmap()
+    
+    def _create_task_view(self, row_height=120):
+        """Create a task list view wired to the task action handlers"""
+        view = TaskListView(theme=self.current_theme, row_height=row_height)
+        profiler.count("widgets.task_views_created")
+        view.task_completed.connect(self.on_task_completed)
+        view.task_edit_requested.connect(self.edit_task)
+        view.task_delete_requested.connect(self.on_task_delete_requested)
+        return view
+    
+    def _task_views(self):
+        views = [self.tasks_list, self.calendar_tasks_list]
+        for i in range(self.category_tabs.count()):
+            category_list = self.category_tabs.widget(i).findChild(TaskListView)
+            if category_list:
+                views.append(category_list)
+        return views
+    
+    @profiler.timed()
     def refresh_tasks(self):
         """Optimized task refresh with minimal widget recreation"""
         try:
@@ -1659,6 +1942,7 @@ class MainWindow(QMainWindow):
             self._update_task_list()
             self._update_category_tabs()
             self._update_calendar_view()
+            self._stats_dirty = True
             self._update_statistics()
         except Exception as e:
             print(f"Error refreshing tasks: {e}")
@@ -1668,204 +1952,293 @@ class MainWindow(QMainWindow):
         # Store current scroll position
         scroll_pos = self.tasks_list.verticalScrollBar().value()
         
-        # Clear and repopulate with filtered tasks
-        self.tasks_list.clear()
+        # Repopulate with filtered tasks
         self.filter_tasks()
         
         # Restore scroll position
         self.tasks_list.verticalScrollBar().setValue(scroll_pos)
     
     def _update_category_tabs(self):
-        """Update category tabs only if categories changed"""
+        """Mark every category tab stale and fill only the one being looked at"""
         current_categories = [self.category_tabs.tabText(i) for i in range(self.category_tabs.count())]
         
-        if set(current_categories) != set(self.task_manager.categories):
-            # Categories changed, rebuild tabs
+        if current_categories != self.task_manager.categories:
+            # Categories changed, rebuild the (still empty) tabs
+            self.category_tabs.blockSignals(True)
             while self.category_tabs.count() > 0:
+                category_tab = self.category_tabs.widget(0)
                 self.category_tabs.removeTab(0)
+                category_tab.deleteLater()
             
             for category in self.task_manager.categories:
                 category_tab = QWidget()
-                category_layout = QVBoxLayout(category_tab)
-                
-                category_list = QListWidget()
-                category_list.setSpacing(3)
-                category_layout.addWidget(category_list)
+                QVBoxLayout(category_tab)
                 self.category_tabs.addTab(category_tab, category)
+            self.category_tabs.blockSignals(False)
         
-        # Update tasks in category tabs
-        for i, category in enumerate(self.task_manager.categories):
-            if i < self.category_tabs.count():
-                tab_widget = self.category_tabs.widget(i)
-                category_list = tab_widget.findChild(QListWidget)
-                if category_list:
-                    category_list.clear()
-                    
-                    # Add tasks for this category
-                    category_tasks = [task for task in self.task_manager.tasks if task.category == category]
-                    for task in category_tasks[:50]:  # Limit to first 50 for performance
-                        item = QListWidgetItem()
-                        item.setSizeHint(QSize(0, 110))  # Increased height for better content display
-                        task_widget = TaskItemWidget(task, theme=self.current_theme)
-                        
-                        # Connect signals to handlers
-                        task_widget.task_completed.connect(self.on_task_completed)
-                        task_widget.task_edit_requested.connect(self.edit_task)
-                        task_widget.task_delete_requested.connect(self.on_task_delete_requested)
-                        
-                        category_list.addItem(item)
-                        category_list.setItemWidget(item, task_widget)
+        self._stale_categories = set(self.task_manager.categories)
+        self._fill_current_category()
+    
+    def _fill_current_category(self):
+        """Populate the visible category tab if its view is missing or stale"""
+        if self.tabs.currentWidget() is not self.categories_tab:
+            return  # Nobody is looking at the category tabs
+        i = self.category_tabs.currentIndex()
+        if i < 0:
+            return
+        category = self.category_tabs.tabText(i)
+        category_list = self._category_view(category)
+        if category_list is not None and category not in self._stale_categories:
+            return
+        if category_list is None:
+            # Views are created the first time their tab is shown and kept afterwards
+            category_list = self._create_task_view(row_height=110)
+            self.category_tabs.widget(i).layout().addWidget(category_list)
+        category_tasks = list(self.task_manager.get_tasks_by_category(category))
+        category_list.set_tasks(self.task_manager.sorter.sort(category_tasks, self._sort_option()))
+        self._stale_categories.discard(category)
     
     def _update_calendar_view(self):
         """Update calendar view efficiently"""
         if hasattr(self, 'calendar') and hasattr(self, 'calendar_tasks_list'):
             self.on_calendar_clicked(self.calendar.selectedDate())
+            self._paint_calendar_heatmap()
+    
+    def _visible_calendar_range(self):
+        """First and last dates of the 6x7 grid shown for the calendar's current month"""
+        first = datetime.date(self.calendar.yearShown(), self.calendar.monthShown(), 1)
+        # Qt shows a whole week of the previous month when the 1st starts a row
+        lead = (first.isoweekday() - int(self.calendar.firstDayOfWeek())) % 7 or 7
+        start = first - datetime.timedelta(days=lead)
+        return start, start + datetime.timedelta(days=41)
+    
+    def _heatmap_formats(self):
+        if getattr(self, "_heatmap_theme", None) != self.current_theme:
+            self._heatmap_theme = self.current_theme
+            self._heatmap_format_cache = []
+            for level, alpha in enumerate(HEATMAP_ALPHAS):
+                text_format = QTextCharFormat()
+                color = QColor(THEMES[self.current_theme]["primary"])
+                color.setAlpha(alpha)
+                text_format.setBackground(color)
+                if level >= 2:
+                    text_format.setForeground(QColor("white"))
+                    text_format.setFontWeight(QFont.Bold)
+                self._heatmap_format_cache.append(text_format)
+        return self._heatmap_format_cache
+    
+    def _heatmap_format(self, count):
+        level = sum(1 for threshold in HEATMAP_THRESHOLDS if count >= threshold)
+        return self._heatmap_formats()[level - 1] if level else QTextCharFormat()
+    
+    def _paint_calendar_heatmap(self, dates=None):
+        """Shade visible calendar days by open workload; dates limits the repaint to those ISO dates"""
+        start, end = self._visible_calendar_range()
+        if dates is None:
+            # A null date clears every stored format, so earlier pages don't pile up
+            self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+            workload = self.task_manager.workload(start, end)
+        else:
+            workload = {}
+            for date in dates:
+                if not date or not start.isoformat() <= date <= end.isoformat():
+                    continue
+                try:
+                    day = datetime.date.fromisoformat(date)
+                except ValueError:
+                    continue
+                workload[date] = self.task_manager.workload(day, day).get(date, 0)
+        
+        for date, count in workload.items():
+            self.calendar.setDateTextFormat(QDate.fromString(date, Qt.ISODate), self._heatmap_format(count))
     
     def _update_statistics(self):
-        """Update statistics with caching"""
+        """Recompute statistics only when they changed and the statistics tab is visible"""
         try:
-            cache_key = f"stats_{len(self.task_manager.tasks)}_{self.task_manager._cache_timestamp}"
+            if not self._stats_dirty or self.tabs.currentWidget() is not self.stats_tab:
+                return  # Stats haven't changed or nobody is looking at them
             
-            if hasattr(self, '_stats_cache_key') and self._stats_cache_key == cache_key:
-                return  # Stats haven't changed
-            
-            self._stats_cache_key = cache_key
+            self._stats_dirty = False
             self.update_statistics()
         except Exception as e:
             print(f"Error updating statistics: {e}")
     
+    @profiler.timed()
+    def on_tasks_changed(self, change):
+        """Patch each view for the changed tasks instead of rebuilding everything"""
+        if change.kind == "reset" or (change.kind == "batch" and len(change.task) > BULK_PATCH_LIMIT):
+            self.refresh_tasks()
+            return
+        changes = change.task if change.kind == "batch" else (change,)
+        task_changes = [single for single in changes if single.kind != "metadata"]
+        if task_changes:
+            self._patch_task_list(task_changes)
+            self._patch_category_tabs(task_changes)
+            for single in task_changes:
+                self._patch_calendar_view(single)
+        if len(task_changes) < len(changes):
+            self._update_category_tabs()
+        self._stats_dirty = True
+        self._update_statistics()
+    
+    def _sort_option(self):
+        return self.sort_combo.currentText()
+    
+    def _patch_task_list(self, changes):
+        search_text = self.search_input.text()
+        filter_option = self.filter_combo.currentText()
+        matches = [change.kind != "removed" and
+                   self.task_manager.task_matches(change.task, search_text, filter_option)
+                   for change in changes]
+        self._patch_sorted_view(self.tasks_list.task_model, list(zip(changes, matches)))
+    
+    def _patch_sorted_view(self, model, changes):
+        """Add, move, repaint or drop changed tasks in a model kept in sort_combo order.
+        
+        changes holds (change, matches) pairs, matches telling whether the task belongs in the view.
+        """
+        sorter = self.task_manager.sorter
+        sort_option = self._sort_option()
+        if len(changes) == 1:
+            change, matches = changes[0]
+            row = model.row_of(change.task_id)
+            # Repaint in place when the task still sits between its neighbours
+            if matches and row is not None and sorter.in_place(model.tasks(), row, change.task, sort_option):
+                model.refresh_task(change.task)
+                return
+        
+        # Tasks edited together may each sit next to another edited one, so the list is only
+        # sorted again once all of them are out of it
+        for change, matches in changes:
+            if model.row_of(change.task_id) is not None:
+                model.remove_task(change.task_id)
+        for change, matches in changes:
+            if matches and model.row_of(change.task_id) is None:
+                model.insert_task(sorter.insertion_index(model.tasks(), change.task, sort_option), change.task)
+    
+    def _category_view(self, category):
+        if category not in self.task_manager.categories:
+            return None
+        i = self.task_manager.categories.index(category)
+        if i >= self.category_tabs.count():
+            return None
+        return self.category_tabs.widget(i).findChild(TaskListView)
+    
+    def _patch_category_tabs(self, changes):
+        patches = {}
+        for change in changes:
+            previous_category = change.previous["category"] if change.previous else None
+            current_category = change.task.category if change.kind != "removed" else None
+            for category in {previous_category, current_category} - {None}:
+                patches.setdefault(category, []).append((change, category == current_category))
+        for category, category_changes in patches.items():
+            category_list = self._category_view(category)
+            if category_list is None or category in self._stale_categories:
+                continue  # Filled from scratch when its tab is shown
+            self._patch_sorted_view(category_list.task_model, category_changes)
+    
+    def _patch_calendar_view(self, change):
+        if (change.previous and change.previous.get("recurring")) or \
+                (change.kind != "removed" and change.task.recurring):
+            # Occurrences may have moved on or off the selected date
+            self._update_calendar_view()
+            return
+        # Only the old and new due dates can change shade
+        self._paint_calendar_heatmap({change.previous["due_date"] if change.previous else None,
+                                      change.task.due_date if change.kind != "removed" else None})
+        model = self.calendar_tasks_list.task_model
+        selected_date = self.calendar.selectedDate().toString(Qt.ISODate)
+        on_date = change.kind != "removed" and change.task.due_date == selected_date
+        if on_date:
+            if not model.refresh_task(change.task):
+                model.insert_task(model.rowCount(), change.task)
+        else:
+            model.remove_task(change.task_id)
+    
+    def change_sort(self):
+        self.filter_tasks()
+        self._stale_categories = set(self.task_manager.categories)
+        self._fill_current_category()
+    
+    @profiler.timed()
     def filter_tasks(self):
-        self.tasks_list.clear()
-        
-        search_text = self.search_input.text().lower()
+        search_text = self.search_input.text()
         filter_option = self.filter_combo.currentText()
-        sort_option = self.sort_combo.currentText()
         
         # Filter tasks
-        filtered_tasks = []
-        for task in self.task_manager.tasks:
-            # Apply search filter
-            if search_text and search_text not in task.title.lower() and search_text not in task.description.lower():
-                continue
-            
-            # Apply status filter
-            if filter_option == "Completed" and not task.completed:
-                continue
-            elif filter_option == "Incomplete" and task.completed:
-                continue
-            elif filter_option == "High Priority" and task.priority != "High":
-                continue
-            elif filter_option == "Medium Priority" and task.priority != "Medium":
-                continue
-            elif filter_option == "Low Priority" and task.priority != "Low":
-                continue
-            elif filter_option == "Overdue":
-                if task.completed or not task.due_date:
-                    continue
-                due_date = datetime.datetime.fromisoformat(task.due_date).date()
-                today = datetime.datetime.now().date()
-                if due_date >= today:
-                    continue
-            
-            filtered_tasks.append(task)
+        filtered_tasks = self.task_manager.query_tasks(search_text, filter_option)
         
         # Sort tasks
-        if sort_option == "Due Date":
-            filtered_tasks.sort(key=lambda t: t.due_date if t.due_date else "9999-12-31")
-        elif sort_option == "Priority":
-            filtered_tasks.sort(key=lambda t: PRIORITY_LEVELS[t.priority]["value"], reverse=True)
-        elif sort_option == "Title":
-            filtered_tasks.sort(key=lambda t: t.title.lower())
-        elif sort_option == "Creation Date":
-            filtered_tasks.sort(key=lambda t: t.created_at)
-        elif sort_option == "Category":
-            filtered_tasks.sort(key=lambda t: t.category)
-        
-        # Add filtered tasks to list
-        for task in filtered_tasks:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 120))  # Increased height for better content display
-            task_widget = TaskItemWidget(task, theme=self.current_theme)
-            
-            # Connect signals to handlers
-            task_widget.task_completed.connect(self.on_task_completed)
-            task_widget.task_edit_requested.connect(self.edit_task)
-            task_widget.task_delete_requested.connect(self.on_task_delete_requested)
-            
-            self.tasks_list.addItem(item)
-            self.tasks_list.setItemWidget(item, task_widget)
+        self.task_manager.sorter.sort(filtered_tasks, self._sort_option())
+        
+        # Show filtered tasks in the list
+        self.tasks_list.set_tasks(filtered_tasks)
     
     def on_calendar_clicked(self, date):
-        self.calendar_tasks_list.clear()
         date_str = date.toString(Qt.ISODate)
         
-        # Find tasks for the selected date
-        for task in self.task_manager.tasks:
-            if task.due_date == date_str:
-                item = QListWidgetItem()
-                item.setSizeHint(QSize(0, 120))  # Increased height for better content display
-                task_widget = TaskItemWidget(task, theme=self.current_theme)
-                
-                # Connect signals to handlers
-                task_widget.task_completed.connect(self.on_task_completed)
-                task_widget.task_edit_requested.connect(self.edit_task)
-                task_widget.task_delete_requested.connect(self.on_task_delete_requested)
-                
-                self.calendar_tasks_list.addItem(item)
-                self.calendar_tasks_list.setItemWidget(item, task_widget)
+        # Tasks due on the selected date, then recurring tasks that repeat on it
+        tasks = self.task_manager.get_tasks_by_date(date_str)
+        tasks.extend(self.task_manager.recurrence.tasks_on(date.toPyDate()))
+        self.calendar_tasks_list.set_tasks(tasks)
     
+    @profiler.timed()
     def update_statistics(self):
+        stats = self.task_manager.statistics.snapshot()
+        
         # Task completion stats
-        total_tasks = len(self.task_manager.tasks)
-        completed_tasks = len(self.task_manager.get_completed_tasks())
+        total_tasks = stats["total"]
+        completed_tasks = stats["completed"]
         completion_percentage = int((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
         
         self.completed_progress.setValue(completion_percentage)
         self.completed_label.setText(f"Completed: {completed_tasks} out of {total_tasks} tasks ({completion_percentage}%)")
         
         # Priority distribution
-        high_priority = len(self.task_manager.get_tasks_by_priority("High"))
-        medium_priority = len(self.task_manager.get_tasks_by_priority("Medium"))
-        low_priority = len(self.task_manager.get_tasks_by_priority("Low"))
-        no_priority = len(self.task_manager.get_tasks_by_priority("None"))
+        high_priority = stats["by_priority"].get("High", 0)
+        medium_priority = stats["by_priority"].get("Medium", 0)
+        low_priority = stats["by_priority"].get("Low", 0)
+        no_priority = stats["by_priority"].get("None", 0)
         
         self.high_priority_label.setText(f"High Priority: {high_priority} tasks")
         self.medium_priority_label.setText(f"Medium Priority: {medium_priority} tasks")
         self.low_priority_label.setText(f"Low Priority: {low_priority} tasks")
         self.no_priority_label.setText(f"No Priority: {no_priority} tasks")
         
-        # Clear category stats layout
-        while self.category_stats_layout.count():
-            item = self.category_stats_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Category distribution
-        for category in self.task_manager.categories:
-            category_tasks = len(self.task_manager.get_tasks_by_category(category))
-            category_label = QLabel(f"{category}: {category_tasks} tasks")
-            self.category_stats_layout.addWidget(category_label)
+        # Category distribution, reusing labels for categories that are still present
+        categories = self.task_manager.categories
+        for category in list(self.category_stat_labels):
+            if category not in categories:
+                self.category_stat_labels.pop(category).deleteLater()
+        for i, category in enumerate(categories):
+            category_label = self.category_stat_labels.get(category)
+            if category_label is None:
+                category_label = self.category_stat_labels[category] = QLabel()
+            if self.category_stats_layout.indexOf(category_label) != i:
+                self.category_stats_layout.insertWidget(i, category_label)
+            category_label.setText(f"{category}: {stats['by_category'].get(category, 0)} tasks")
         
         # Time stats
-        today = datetime.datetime.now().date().isoformat()
-        week_end = (datetime.datetime.now() + datetime.timedelta(days=7)).date().isoformat()
-        
-        overdue_tasks = len(self.task_manager.get_overdue_tasks())
-        due_today = len([task for task in self.task_manager.tasks if not task.completed and task.due_date == today])
-        due_this_week = len([task for task in self.task_manager.tasks if not task.completed and 
-                            task.due_date and today < task.due_date <= week_end])
-        no_due_date = len([task for task in self.task_manager.tasks if not task.due_date])
+        overdue_tasks = stats["overdue"]
+        due_today = stats["due_today"]
+        due_this_week = stats["due_this_week"]
+        no_due_date = stats["no_due_date"]
         
         self.overdue_label.setText(f"Overdue: {overdue_tasks} tasks")
         self.due_today_label.setText(f"Due Today: {due_today} tasks")
         self.due_this_week_label.setText(f"Due This Week: {due_this_week} tasks")
         self.no_due_date_label.setText(f"No Due Date: {no_due_date} tasks")
+        
+        # Recurring occurrences expanded lazily for the coming week
+        today_date = datetime.date.today()
+        recurring_this_week = self.task_manager.recurrence.count_between(
+            today_date + datetime.timedelta(days=1), today_date + datetime.timedelta(days=7))
+        self.recurring_week_label.setText(f"Recurring This Week: {recurring_this_week} occurrences")
     
     def on_task_completed(self, task):
         """Handle task completion signal with celebration"""
         try:
             self.task_manager.update_task(task.id, task)
-            self.refresh_tasks()
             
             if task.completed:
                 self.show_completion_celebration(task)
@@ -1876,127 +2249,156 @@ class MainWindow(QMainWindow):
             print(f"Error updating task completion: {e}")
     
     def show_completion_celebration(self, task):
-        """Show celebration animation and message for completed task"""
+        """Queue a celebration for a completed task; bursts are merged into one"""
+        self.celebrations.post(task)
+    
+    @staticmethod
+    def _completion_type(task):
+        """Completion timing against the due date: "early", "on_time", "late" or "general" (no due date)"""
+        if not task.due_date:
+            return "general"
+        try:
+            due_date = datetime.datetime.fromisoformat(task.due_date).date()
+        except ValueError:
+            return "general"
+        today = datetime.datetime.now().date()
+        if today < due_date:
+            return "early"
+        elif today == due_date:
+            return "on_time"
+        return "late"
+    
+    def on_celebration_ready(self, tasks):
+        """Show one celebration for the tasks completed since the last one"""
         try:
-            from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel
-            from PyQt5.QtCore import QTimer
-            import datetime
-            
-            # Determine completion timing
-            completion_type = "general"
-            if task.due_date:
-                try:
-                    due_date = datetime.datetime.fromisoformat(task.due_date).date()
-                    today = datetime.datetime.now().date()
-                    
-                    if today < due_date:
-                        completion_type = "early"
-                    elif today == due_date:
-                        completion_type = "on_time"
-                    else:
-                        completion_type = "late"
-                except:
-                    completion_type = "general"
-            
-            # Select random celebration message and sticker
-            import random
-            celebration_msg = random.choice(CELEBRATION_MESSAGES[completion_type])
             celebration_sticker = random.choice(CELEBRATION_STICKERS)
+            if len(tasks) == 1:
+                task = tasks[0]
+                celebration_msg = random.choice(CELEBRATION_MESSAGES[self._completion_type(task)])
+                tasks_text = f"\"{task.title}\""
+                status_msg = f"{celebration_sticker} Task '{task.title}' completed! {celebration_sticker}"
+            else:
+                celebration_msg = f"🏆 {len(tasks)} tasks completed!"
+                tasks_text = ", ".join(f"\"{task.title}\"" for task in tasks[:CELEBRATION_TITLES_SHOWN])
+                if len(tasks) > CELEBRATION_TITLES_SHOWN:
+                    tasks_text += f" and {len(tasks) - CELEBRATION_TITLES_SHOWN} more"
+                status_msg = f"{celebration_sticker} {len(tasks)} tasks completed! {celebration_sticker}"
             
-            # Create celebration dialog
-            celebration_dialog = QDialog(self)
-            celebration_dialog.setWindowTitle(f"{celebration_sticker} Task Completed!")
-            celebration_dialog.setModal(False)  # Non-blocking
-            celebration_dialog.resize(400, 200)
-            celebration_dialog.setStyleSheet("""
-                QDialog {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #FFD700, stop:0.5 #FFA500, stop:1 #FF6347);
-                    border-radius: 15px;
-                    border: 3px solid #FFD700;
-                }
-            """)
-            
-            layout = QVBoxLayout(celebration_dialog)
-            layout.setSpacing(20)
-            layout.setContentsMargins(20, 20, 20, 20)
-            
-            # Big celebration sticker
-            sticker_label = QLabel(celebration_sticker)
-            sticker_label.setAlignment(Qt.AlignCenter)
-            sticker_label.setStyleSheet("""
-                QLabel {
-                    font-size: 48px;
-                    background: transparent;
-                    padding: 10px;
-                }
-            """)
-            layout.addWidget(sticker_label)
-            
-            # Celebration message
-            message_label = QLabel(celebration_msg)
-            message_label.setAlignment(Qt.AlignCenter)
-            message_label.setWordWrap(True)
-            message_label.setStyleSheet("""
-                QLabel {
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: white;
-                    background: transparent;
-                    text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-                    padding: 10px;
-                }
-            """)
-            layout.addWidget(message_label)
-            
-            # Task title
-            task_label = QLabel(f"\"{ task.title}\"")
-            task_label.setAlignment(Qt.AlignCenter)
-            task_label.setWordWrap(True)
-            task_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-style: italic;
-                    color: #333333;
-                    background: rgba(255,255,255,0.8);
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-            """)
-            layout.addWidget(task_label)
-            
-            # Show dialog
-            celebration_dialog.show()
-            
-            # Auto-close after 4 seconds
-            QTimer.singleShot(4000, celebration_dialog.close)
-            
-            # Update status bar
-            status_msg = f"{celebration_sticker} Task '{task.title}' completed! {celebration_sticker}"
+            self.celebration_overlay.celebrate(celebration_sticker, celebration_msg, tasks_text)
             self.status_bar.showMessage(status_msg, 5000)
-            
         except Exception as e:
             print(f"Error showing celebration: {e}")
             # Fallback to simple message
-            status_msg = f"Task '{task.title}' completed!"
-            self.status_bar.showMessage(status_msg, 3000)
+            self.status_bar.showMessage(f"{len(tasks)} task(s) completed!", 3000)
     
     def on_task_delete_requested(self, task_id):
         """Handle task deletion signal"""
         try:
             if self.task_manager.delete_task(task_id):
-                self.refresh_tasks()
                 self.status_bar.showMessage("Task deleted successfully!", 3000)
         except Exception as e:
             print(f"Error deleting task: {e}")
     
+    def update_bulk_actions(self):
+        count = len(self.tasks_list.selectionModel().selectedRows())
+        self.bulk_label.setText(f"{count} selected")
+        self.bulk_bar.setVisible(count > 1)
+    
+    def bulk_complete(self, completed=True):
+        tasks = [task for task in self.tasks_list.selected_tasks() if task.completed != completed]
+        if not tasks:
+            return
+        self.task_manager.complete_tasks([task.id for task in tasks], completed)
+        if completed:
+            for task in tasks:
+                self.show_completion_celebration(task)  # Merged into one celebration
+        else:
+            self.status_bar.showMessage(f"{len(tasks)} tasks marked as incomplete!", 3000)
+    
+    def bulk_delete(self):
+        task_ids = [task.id for task in self.tasks_list.selected_tasks()]
+        if not task_ids:
+            return
+        confirm = QMessageBox.question(self, "Delete Tasks", f"Delete {len(task_ids)} selected task(s)?",
+                                       QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if confirm == QMessageBox.Yes:
+            deleted = self.task_manager.delete_tasks(task_ids)
+            self.status_bar.showMessage(f"{deleted} tasks deleted!", 3000)
+    
+    def bulk_move(self):
+        task_ids = [task.id for task in self.tasks_list.selected_tasks()]
+        if not task_ids:
+            return
+        category, ok = QInputDialog.getItem(self, "Move Tasks", f"Move {len(task_ids)} tasks to category:",
+                                            self.task_manager.categories, 0, True)
+        if ok and category:
+            if category not in self.task_manager.categories:
+                self.categories_list.addItem(category)
+            moved = self.task_manager.move_tasks(task_ids, category)
+            self.status_bar.showMessage(f"{moved} tasks moved to '{category}'!", 3000)
+    
+    def bulk_tag(self):
+        task_ids = [task.id for task in self.tasks_list.selected_tasks()]
+        if not task_ids:
+            return
+        tag, ok = QInputDialog.getItem(self, "Tag Tasks", f"Add tag to {len(task_ids)} tasks:",
+                                       self.task_manager.tags, 0, True)
+        if ok and tag:
+            if tag not in self.task_manager.tags:
+                self.tags_list.addItem(tag)
+            tagged = self.task_manager.tag_tasks(task_ids, tag)
+            self.status_bar.showMessage(f"Tag '{tag}' added to {tagged} tasks!", 3000)
+    
+    def bulk_untag(self):
+        tasks = self.tasks_list.selected_tasks()
+        tags = list(dict.fromkeys(tag for task in tasks for tag in task.tags))
+        if not tags:
+            return
+        tag, ok = QInputDialog.getItem(self, "Untag Tasks", f"Remove tag from {len(tasks)} tasks:", tags, 0, False)
+        if ok and tag:
+            untagged = self.task_manager.untag_tasks([task.id for task in tasks], tag)
+            self.status_bar.showMessage(f"Tag '{tag}' removed from {untagged} tasks!", 3000)
+    
+    def bulk_reschedule(self):
+        task_ids = [task.id for task in self.tasks_list.selected_tasks()]
+        if not task_ids:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Reschedule Tasks")
+        layout = QVBoxLayout(dialog)
+        
+        date_label = QLabel(f"New due date for {len(task_ids)} tasks:")
+        date_label.setProperty("role", "field")
+        layout.addWidget(date_label)
+        date_edit = QDateEdit(QDate.currentDate())
+        date_edit.setCalendarPopup(True)
+        layout.addWidget(date_edit)
+        no_date = QCheckBox("No due date")
+        no_date.toggled.connect(date_edit.setDisabled)
+        layout.addWidget(no_date)
+        
+        button_layout = QHBoxLayout()
+        ok_btn = QPushButton("OK")
+        ok_btn.setProperty("role", "primary")
+        ok_btn.clicked.connect(dialog.accept)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setProperty("role", "cancel")
+        cancel_btn.clicked.connect(dialog.reject)
+        button_layout.addWidget(ok_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+        
+        if dialog.exec_():
+            due_date = None if no_date.isChecked() else date_edit.date().toString(Qt.ISODate)
+            rescheduled = self.task_manager.reschedule_tasks(task_ids, due_date)
+            self.status_bar.showMessage(f"{rescheduled} tasks rescheduled!", 3000)
+    
     def add_task(self):
         dialog = TaskDialog(self, categories=self.task_manager.categories, 
                           tags=self.task_manager.tags, theme=self.current_theme)
         if dialog.exec_():
             task = dialog.get_task_data()
             self.task_manager.add_task(task)
-            self.refresh_tasks()
             self.status_bar.showMessage(f"Task '{task.title}' added successfully!", 3000)
     
     def edit_task(self, task):
@@ -2005,7 +2407,6 @@ class MainWindow(QMainWindow):
         if dialog.exec_():
             updated_task = dialog.get_task_data()
             self.task_manager.update_task(task.id, updated_task)
-            self.refresh_tasks()
             self.status_bar.showMessage(f"Task '{task.title}' updated successfully!", 3000)
     
     def add_category(self):
@@ -2013,7 +2414,6 @@ class MainWindow(QMainWindow):
         if ok and category:
             if self.task_manager.add_category(category):
                 self.categories_list.addItem(category)
-                self.refresh_tasks()
                 self.status_bar.showMessage(f"Category '{category}' added successfully!", 3000)
             else:
                 QMessageBox.warning(self, "Warning", f"Category '{category}' already exists!")
@@ -2032,17 +2432,14 @@ class MainWindow(QMainWindow):
                                       f"Are you sure you want to delete category '{category}'?",
                                       QMessageBox.Yes | QMessageBox.No)
         if confirm == QMessageBox.Yes:
-            # Update tasks with this category
-            for task in self.task_manager.tasks:
-                if task.category == category:
-                    task.category = "Other"
-                    self.task_manager.update_task(task.id, task)
+            # Move its tasks to "Other" in one batch
+            self.task_manager.move_tasks([task.id for task in self.task_manager.get_tasks_by_category(category)],
+                                         "Other")
             
             # Remove category
             self.task_manager.categories.remove(category)
-            self.task_manager.save_tasks()
+            self.task_manager.save_metadata()
             self.categories_list.takeItem(self.categories_list.row(selected_items[0]))
-            self.refresh_tasks()
             self.status_bar.showMessage(f"Category '{category}' removed successfully!", 3000)
     
     def add_tag(self):
@@ -2064,61 +2461,143 @@ class MainWindow(QMainWindow):
                                       f"Are you sure you want to delete tag '{tag}'?",
                                       QMessageBox.Yes | QMessageBox.No)
         if confirm == QMessageBox.Yes:
-            # Remove tag from all tasks
-            for task in self.task_manager.tasks:
-                if tag in task.tags:
-                    task.tags.remove(tag)
-                    self.task_manager.update_task(task.id, task)
+            # Remove tag from all tasks in one batch
+            self.task_manager.untag_tasks([task.id for task in self.task_manager.get_tasks_by_tag(tag)], tag)
             
             # Remove tag
             self.task_manager.tags.remove(tag)
-            self.task_manager.save_tasks()
+            self.task_manager.save_metadata()
             self.tags_list.takeItem(self.tags_list.row(selected_items[0]))
             self.status_bar.showMessage(f"Tag '{tag}' removed successfully!", 3000)
     
     def export_tasks(self):
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export Tasks", "", "JSON Files (*.json)")
+        if getattr(self, 'exporter', None) is not None:
+            QMessageBox.warning(self, "Warning", "An export is already running!")
+            return
+        formats = {"JSON Files (*.json)": "json", "NDJSON Files (*.ndjson)": "ndjson",
+                   "CSV Files (*.csv)": "csv", "iCalendar Files (*.ics)": "ics"}
+        file_path, selected = QFileDialog.getSaveFileName(self, "Export Tasks", "", ";;".join(formats))
         if file_path:
+            fmt = formats.get(selected, "json")
+            if not file_path.lower().endswith(f".{fmt}"):
+                file_path += f".{fmt}"
+            
+            # Offer to export just the tasks in the current view
+            search_text = self.search_input.text()
+            filter_option = self.filter_combo.currentText()
+            if search_text or filter_option != "All":
+                confirm = QMessageBox.question(self, "Export Tasks", "Export only the tasks in the current view?",
+                                               QMessageBox.Yes | QMessageBox.No)
+                if confirm != QMessageBox.Yes:
+                    search_text, filter_option = "", "All"
+            key = self.task_manager.sorter.key(self._sort_option())
             try:
-                data = {
-                    "tasks": [task.to_dict() for task in self.task_manager.tasks],
-                    "categories": self.task_manager.categories,
-                    "tags": self.task_manager.tags
-                }
-                with open(file_path, "w") as f:
-                    json.dump(data, f, indent=2)
-                self.status_bar.showMessage(f"Tasks exported successfully to {file_path}!", 3000)
+                self.exporter = TaskExporter(self.task_manager, file_path, fmt, search_text, filter_option, key)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export tasks: {str(e)}")
+                return
+            self.exporter.start()
+            self.export_timer = QTimer(self)
+            self.export_timer.timeout.connect(self.on_export_tick)
+            self.export_timer.start(LOAD_POLL_MS)
+    
+    def on_export_tick(self):
+        exporter = self.exporter
+        if not exporter.done:
+            self.status_bar.showMessage(f"Exporting tasks... {int(exporter.progress * 100)}%")
+            return
+        self.export_timer.stop()
+        self.exporter = None
+        if exporter.error is not None:
+            QMessageBox.critical(self, "Error", f"Failed to export tasks: {str(exporter.error)}")
+        else:
+            self.status_bar.showMessage(f"Exported {exporter.written} tasks to {exporter.path}!", 3000)
     
     def import_tasks(self):
+        if getattr(self, 'importer', None) is not None:
+            QMessageBox.warning(self, "Warning", "An import is already running!")
+            return
         file_path, _ = QFileDialog.getOpenFileName(self, "Import Tasks", "", "JSON Files (*.json)")
         if file_path:
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    
-                    # Import tasks
-                    imported_tasks = [Task.from_dict(task_data) for task_data in data.get("tasks", [])]
-                    self.task_manager.tasks = imported_tasks
-                    
-                    # Import categories and tags
-                    if "categories" in data:
-                        self.task_manager.categories = data["categories"]
-                    if "tags" in data:
-                        self.task_manager.tags = data["tags"]
-                    
-                    self.task_manager.save_tasks()
-                    self.refresh_tasks()
-                    self.status_bar.showMessage(f"Tasks imported successfully from {file_path}!", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to import tasks: {str(e)}")
+            modes = {"Merge": "merge", "Skip duplicates": "skip_duplicates", "Replace": "replace"}
+            mode, ok = QInputDialog.getItem(self, "Import Tasks", "Import mode:", list(modes), 0, False)
+            if not ok:
+                return
+            # Parse and dedup in the background, then commit as one batch
+            self.importer = TaskImporter(self.task_manager, file_path, modes[mode])
+            self.importer.start()
+            self.import_timer = QTimer(self)
+            self.import_timer.timeout.connect(self.on_import_tick)
+            self.import_timer.start(LOAD_POLL_MS)
+    
+    def on_import_tick(self):
+        importer = self.importer
+        if not importer.done:
+            self.status_bar.showMessage(f"Importing tasks... {int(importer.progress * 100)}%")
+            return
+        self.import_timer.stop()
+        self.importer = None
+        if importer.error is not None:
+            QMessageBox.critical(self, "Error", f"Failed to import tasks: {str(importer.error)}")
+            return
+        try:
+            importer.apply()
+            self.categories_list.clear()
+            self.categories_list.addItems(self.task_manager.categories)
+            self.tags_list.clear()
+            self.tags_list.addItems(self.task_manager.tags)
+            self.status_bar.showMessage(
+                f"Imported {len(importer.added)} tasks, updated {len(importer.updated)}, "
+                f"skipped {importer.skipped} duplicates from {importer.path}!", 5000)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to import tasks: {str(e)}")
 
+    def track_loading(self, loader, splash=None):
+        """Poll a TaskLoader until the board is loaded, showing progress on the splash screen"""
+        self.loader = loader
+        self.splash = splash
+        self.load_timer = QTimer(self)
+        self.load_timer.timeout.connect(self.on_load_tick)
+        self.load_timer.start(LOAD_POLL_MS)
+        self.on_load_tick()
+    
+    def on_load_tick(self):
+        loading = self.loader.poll()
+        message = f"Loading tasks... {self.loader.loaded} ({int(self.loader.progress * 100)}%)"
+        if loading:
+            self.status_bar.showMessage(message)
+            if self.splash is not None:
+                self.splash.showMessage(message, Qt.AlignBottom | Qt.AlignHCenter, QColor("white"))
+            return
+        self.load_timer.stop()
+        self.status_bar.showMessage(f"Loaded {self.loader.loaded} tasks", 3000)
+        if self.splash is not None:
+            self.splash.finish(self)
+            self.splash = None
+    
+    def on_persistence_failed(self, message):
+        self.status_bar.showMessage(f"⚠️ {message} (will retry)", 10000)
+    
+    def quit_application(self):
+        """Tray menu Quit: close for real instead of hiding to the tray"""
+        self._quitting = True
+        self.close()
+        QApplication.quit()
+    
     def closeEvent(self, event):
-        # Hide to system tray instead of closing
-        if self.tray_icon.isVisible():
+        # Hide to system tray instead of closing, but get queued edits onto disk first
+        if self.tray_icon.isVisible() and not self._quitting:
+            if not self.task_manager.flush():
+                self.on_persistence_failed(self.task_manager.persistence.error or "Error saving tasks")
             self.hide()
             event.ignore()
+            return
+        
+        self.task_manager.close()
+        if self.task_manager.persistence.error:
+            QMessageBox.warning(self, APP_NAME, f"Some changes could not be saved:\n{self.task_manager.persistence.error}")
+        self.tray_icon.hide()
+        event.accept()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -2128,12 +2607,16 @@ if __name__ == "__main__":
     splash_pixmap.fill(QColor(THEMES[DEFAULT_THEME]["primary"]))
     splash = QSplashScreen(splash_pixmap)
     splash.show()
+    app.processEvents()
     
-    # Create and show main window
-    window = MainWindow()
+    # Load the first page of tasks, then show the main window while the rest loads
+    task_manager = TaskManager(load=False)
+    loader = TaskLoader(task_manager)
+    loader.start()
+    window = MainWindow(task_manager)
     window.show()
     
-    # Close splash screen
-    splash.finish(window)
+    # The splash screen shows progress and closes once every task is loaded
+    window.track_loading(loader, splash)
     
     sys.exit(app.exec_())
\ No newline at end of file
@@ -40,7 +40,7 @@ setup(
             'bundle_files': 1,
             'compressed': True,
             'includes': ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets'],
-            'packages': ['json', 'datetime', 'random', 'os', 'sys'],
+            'packages': ['json', 'datetime', 'random', 'os', 'sys', 'taskmaster'],
             'excludes': ['tkinter', 'unittest', 'email', 'http', 'xml', 'pydoc'],
             'optimize': 2,
         }
@@ -0,0 +1,5 @@
+import sys
+
+from taskmaster.cli import main
+
+sys.exit(main())
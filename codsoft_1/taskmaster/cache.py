@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+class QueryCache:
+    """Bounded LRU of query results, valid only for the data version they were computed at.
+    
+    Every mutation bumps the version, which invalidates all entries at once without
+    holding on to the results of older versions.
+    """
+    
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (version, result)
+    
+    def get(self, key, compute):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self.version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        result = compute()
+        self._entries[key] = (self.version, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+    
+    def invalidate(self):
+        self.version += 1
+        self._entries.clear()
+    
+    def stats(self):
+        return {"version": self.version, "size": len(self._entries),
+                "hits": self.hits, "misses": self.misses}
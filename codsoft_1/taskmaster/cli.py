@@ -0,0 +1,189 @@
+import argparse
+import datetime
+import json
+import sys
+
+from taskmaster.config import SAVE_FILE, PRIORITY_LEVELS, DEFAULT_CATEGORIES, FILTER_OPTIONS, SORT_OPTIONS
+from taskmaster.task import Task
+from taskmaster.manager import TaskManager
+from taskmaster.storage import JsonStorage, SqliteStorage
+
+def open_manager(path=None):
+    """TaskManager for a tasks.json file or a SQLite .db file (the configured backend by default)"""
+    if path is None:
+        return TaskManager()
+    if path.endswith(".db"):
+        return TaskManager(SqliteStorage(path))
+    return TaskManager(JsonStorage(path))
+
+def print_tasks(tasks, as_json=False):
+    if as_json:
+        print(json.dumps([task.to_dict() for task in tasks], ensure_ascii=False, indent=2))
+        return
+    for task in tasks:
+        check = "x" if task.completed else " "
+        print(f"[{check}] {task.id:<8} {task.due_date or '-':<10}  {task.priority:<6}  {task.category:<13} {task.title}")
+
+def sorted_tasks(task_manager, tasks, sort_option):
+    if not isinstance(sort_option, str) and len(sort_option) == 1:
+        sort_option = sort_option[0]  # A single option keeps its tie-breakers
+    return task_manager.sorter.sort(list(tasks), sort_option)
+
+def cmd_add(task_manager, args):
+    due_date = None
+    if args.due is not None:
+        try:
+            due_date = datetime.date.fromisoformat(args.due).isoformat()
+        except ValueError:
+            print(f"Error: invalid date {args.due}", file=sys.stderr)
+            return 2
+    if args.category not in task_manager.categories:
+        task_manager.add_category(args.category)
+    for tag in args.tag:
+        task_manager.add_tag(tag)
+    task = Task(args.title, args.description, due_date, args.priority, args.category,
+                tags=args.tag, recurring=args.recurring)
+    task_manager.add_task(task)
+    print(task.id)
+
+def cmd_list(task_manager, args):
+    if args.category:
+        tasks = task_manager.get_tasks_by_category(args.category)
+    elif args.tag:
+        tasks = task_manager.get_tasks_by_tag(args.tag)
+    elif args.date:
+        tasks = task_manager.get_tasks_by_date(args.date)
+    else:
+        tasks = task_manager.tasks
+    print_tasks(sorted_tasks(task_manager, tasks, args.sort), args.json)
+
+def cmd_filter(task_manager, args):
+    task_manager.search_index.wait()
+    tasks = task_manager.query_tasks(args.search, args.filter)
+    print_tasks(sorted_tasks(task_manager, tasks, args.sort), args.json)
+
+def check_ids(task_manager, task_ids):
+    """1 (after reporting them) if some ids are unknown, else 0"""
+    status = 0
+    for task_id in task_ids:
+        if task_manager.get_task(task_id) is None:
+            print(f"Error: no task with id {task_id}", file=sys.stderr)
+            status = 1
+    return status
+
+def cmd_complete(task_manager, args):
+    task_manager.complete_tasks(args.ids, completed=not args.undo)
+    return check_ids(task_manager, args.ids)
+
+def cmd_delete(task_manager, args):
+    status = check_ids(task_manager, args.ids)
+    task_manager.delete_tasks(args.ids)
+    return status
+
+def cmd_move(task_manager, args):
+    task_manager.move_tasks(args.ids, args.category)
+    return check_ids(task_manager, args.ids)
+
+def cmd_tag(task_manager, args):
+    if args.remove:
+        task_manager.untag_tasks(args.ids, args.tag)
+    else:
+        task_manager.tag_tasks(args.ids, args.tag)
+    return check_ids(task_manager, args.ids)
+
+def cmd_reschedule(task_manager, args):
+    due_date = None
+    if args.due.lower() != "none":
+        try:
+            due_date = datetime.date.fromisoformat(args.due).isoformat()
+        except ValueError:
+            print(f"Error: invalid date {args.due}", file=sys.stderr)
+            return 2
+    task_manager.reschedule_tasks(args.ids, due_date)
+    return check_ids(task_manager, args.ids)
+
+def cmd_stats(task_manager, args):
+    stats = task_manager.statistics.snapshot()
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        return
+    total = stats["total"]
+    percentage = int(stats["completed"] / total * 100) if total else 0
+    print(f"Completed: {stats['completed']} out of {total} tasks ({percentage}%)")
+    for priority in PRIORITY_LEVELS:
+        print(f"{priority} Priority: {stats['by_priority'].get(priority, 0)} tasks")
+    for category in task_manager.categories:
+        print(f"{category}: {stats['by_category'].get(category, 0)} tasks")
+    print(f"Overdue: {stats['overdue']} tasks")
+    print(f"Due Today: {stats['due_today']} tasks")
+    print(f"Due This Week: {stats['due_this_week']} tasks")
+    print(f"No Due Date: {stats['no_due_date']} tasks")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m taskmaster", description="TaskMaster Pro command line")
+    parser.add_argument("--file", help=f"tasks file to use (a .db file uses SQLite; default {SAVE_FILE})")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    add = commands.add_parser("add", help="add a task")
+    add.add_argument("title")
+    add.add_argument("-d", "--description", default="")
+    add.add_argument("--due", help="due date (YYYY-MM-DD)")
+    add.add_argument("-p", "--priority", choices=list(PRIORITY_LEVELS), default="None")
+    add.add_argument("-c", "--category", default="Other")
+    add.add_argument("-t", "--tag", action="append", default=[])
+    add.add_argument("--recurring", choices=["Daily", "Weekly", "Monthly", "Yearly"])
+    add.set_defaults(handler=cmd_add)
+    
+    list_ = commands.add_parser("list", help="list tasks, optionally by category, tag or due date")
+    group = list_.add_mutually_exclusive_group()
+    group.add_argument("-c", "--category", help=f"e.g. {DEFAULT_CATEGORIES[0]}")
+    group.add_argument("-t", "--tag")
+    group.add_argument("--date", help="due date (YYYY-MM-DD)")
+    list_.set_defaults(handler=cmd_list)
+    
+    filter_ = commands.add_parser("filter", help="search and filter like the task list")
+    filter_.add_argument("search", nargs="?", default="")
+    filter_.add_argument("-f", "--filter", choices=FILTER_OPTIONS, default="All")
+    filter_.set_defaults(handler=cmd_filter)
+    
+    for command in (list_, filter_):
+        command.add_argument("-s", "--sort", choices=SORT_OPTIONS, nargs="+", default=SORT_OPTIONS[0],
+                             help="one option, or several to sort by in turn (e.g. Priority \"Due Date\" Title)")
+    
+    complete = commands.add_parser("complete", help="mark tasks as completed")
+    complete.add_argument("ids", type=int, nargs="+")
+    complete.add_argument("--undo", action="store_true", help="mark them incomplete instead")
+    complete.set_defaults(handler=cmd_complete)
+    
+    delete = commands.add_parser("delete", help="delete tasks")
+    delete.add_argument("ids", type=int, nargs="+")
+    delete.set_defaults(handler=cmd_delete)
+    
+    move = commands.add_parser("move", help="move tasks to another category")
+    move.add_argument("category")
+    move.add_argument("ids", type=int, nargs="+")
+    move.set_defaults(handler=cmd_move)
+    
+    tag = commands.add_parser("tag", help="add a tag to tasks")
+    tag.add_argument("tag")
+    tag.add_argument("ids", type=int, nargs="+")
+    tag.add_argument("--remove", action="store_true", help="remove the tag instead")
+    tag.set_defaults(handler=cmd_tag)
+    
+    reschedule = commands.add_parser("reschedule", help="change the due date of tasks")
+    reschedule.add_argument("due", help="new due date (YYYY-MM-DD), or \"none\" to clear it")
+    reschedule.add_argument("ids", type=int, nargs="+")
+    reschedule.set_defaults(handler=cmd_reschedule)
+    
+    stats = commands.add_parser("stats", help="show task statistics")
+    stats.set_defaults(handler=cmd_stats)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    task_manager = open_manager(args.file)
+    try:
+        return args.handler(task_manager, args) or 0
+    finally:
+        task_manager.close()
@@ -0,0 +1,43 @@
+SAVE_FILE = "tasks.json"
+JOURNAL_FILE = SAVE_FILE + ".journal"
+JOURNAL_MODE = True  # Append mutations to JOURNAL_FILE instead of rewriting SAVE_FILE
+JOURNAL_COMPACT_THRESHOLD = 500  # Journal records before a background compaction
+SQLITE_FILE = "tasks.db"
+STORAGE_BACKEND = "json"  # "json" (SAVE_FILE + journal) or "sqlite" (SQLITE_FILE)
+PERSIST_COALESCE_SECONDS = 0.2  # Quiet time after the last edit before queued writes hit the disk
+PERSIST_MAX_DELAY_SECONDS = 2.0  # Longest an edit waits while a burst keeps going
+PERSIST_RETRY_SECONDS = 5.0  # Wait before retrying a failed write
+PROFILE_WINDOW = 500  # Recent durations kept per profiling span for percentiles and the histogram
+PROFILE_TRACE_EVENTS = 20000  # Spans kept for a JSON trace dump
+LOAD_PAGE_SIZE = 500  # Tasks loaded before the window is shown, and per page after that
+LOAD_REFRESH_SECONDS = 1.0  # How often views are refreshed while the rest of the board loads
+STREAM_CHUNK_SIZE = 64 * 1024
+IMPORT_MODES = ("merge", "replace", "skip_duplicates")
+EXPORT_FORMATS = ("json", "ndjson", "csv", "ics")
+EXPORT_CHUNK_SIZE = 1000  # Tasks serialised per write by TaskExporter
+
+# Options of the task list's filter and sort boxes (also used by the command line)
+FILTER_OPTIONS = ["All", "Completed", "Incomplete", "High Priority", "Medium Priority", "Low Priority", "Overdue"]
+SORT_OPTIONS = ["Due Date", "Priority", "Title", "Creation Date", "Category"]
+# Keys each sort option actually sorts by, most significant first (ties fall back to task id)
+SORT_KEYS = {
+    "Due Date": ("Due Date", "Priority", "Title"),
+    "Priority": ("Priority", "Due Date", "Title"),
+    "Title": ("Title",),
+    "Creation Date": ("Creation Date",),
+    "Category": ("Category", "Priority", "Due Date")
+}
+
+# Task priority levels
+PRIORITY_LEVELS = {
+    "High": {"color": "#F44336", "value": 3},
+    "Medium": {"color": "#FF9800", "value": 2},
+    "Low": {"color": "#4CAF50", "value": 1},
+    "None": {"color": "#9E9E9E", "value": 0}
+}
+
+# Task categories
+DEFAULT_CATEGORIES = [
+    "Work", "Personal", "Shopping", "Health", "Education", 
+    "Finance", "Home", "Family", "Entertainment", "Other"
+]
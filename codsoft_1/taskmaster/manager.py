@@ -0,0 +1,472 @@
+import datetime
+
+from taskmaster.config import DEFAULT_CATEGORIES
+from taskmaster.task import Task, TaskChange, task_ids, remap_duplicate_ids
+from taskmaster.store import TaskStore
+from taskmaster.recurrence import RecurrenceEngine
+from taskmaster.cache import QueryCache
+from taskmaster.statistics import TaskStatistics
+from taskmaster.search import SearchIndex
+from taskmaster.sorting import SortEngine
+from taskmaster.storage import create_storage
+from taskmaster.persistence import PersistenceWorker
+from taskmaster.profiling import profiler
+
+class TaskManager:
+    def __init__(self, storage=None, load=True):
+        self.store = TaskStore()
+        self.storage = storage if storage is not None else create_storage()
+        self.persistence = PersistenceWorker(self.storage)
+        self.categories = DEFAULT_CATEGORIES.copy()
+        self.tags = []
+        self.query_cache = QueryCache()
+        self._listeners = []
+        self.search_index = SearchIndex()
+        self.recurrence = RecurrenceEngine(self)
+        self.statistics = TaskStatistics(self)
+        self.sorter = SortEngine(self)
+        self.loading = False  # True while a TaskLoader is still adding pages
+        self._loader = None
+        self._save_deferred = False
+        if load:
+            self.load_tasks()
+        self.search_index.rebuild(self.store)
+        self.statistics.rebuild(self.store)
+    
+    @property
+    def tasks(self):
+        return list(self.store)
+    
+    @tasks.setter
+    def tasks(self, tasks):
+        if self._loader is not None:
+            self._loader.cancel()
+        tasks = list(tasks)
+        remap_duplicate_ids(tasks)
+        self.store = TaskStore(tasks)
+        self._clear_cache()
+        self.search_index.rebuild(self.store)
+        self._notify("reset")
+    
+    def subscribe(self, listener):
+        """Call listener(change) with a TaskChange after every mutation"""
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, kind, task=None, task_id=None, previous=None):
+        change = TaskChange(kind, task, task_id, previous)
+        profiler.count(f"changes.{kind}")
+        for listener in list(self._listeners):
+            try:
+                listener(change)
+            except Exception as e:
+                print(f"Error in task change listener: {e}")
+    
+    def add_task(self, task):
+        self.store.add(task)
+        self._clear_cache()
+        self.search_index.update(task)
+        self._persist({"op": "put", "task": task.to_dict()})
+        self._notify("added", task, task.id)
+        return task
+    
+    def update_task(self, task_id, updated_task):
+        previous = self.store.indexed_fields(task_id)
+        if self.store.replace(task_id, updated_task):
+            self._clear_cache()
+            if updated_task.id != task_id:
+                self.search_index.remove(task_id)
+            self.search_index.update(updated_task)
+            if updated_task.id != task_id:
+                self._persist({"op": "delete", "id": task_id})
+                self._persist({"op": "put", "task": updated_task.to_dict()})
+                self._notify("removed", None, task_id, previous)
+                self._notify("added", updated_task, updated_task.id)
+                return True
+            self._persist({"op": "put", "task": updated_task.to_dict()})
+            self._notify("updated", updated_task, task_id, previous)
+            return True
+        return False
+    
+    def delete_task(self, task_id):
+        previous = self.store.indexed_fields(task_id)
+        task = self.store.remove(task_id)
+        if task is not None:
+            self._clear_cache()
+            self.search_index.remove(task_id)
+            self._persist({"op": "delete", "id": task_id})
+            self._notify("removed", task, task_id, previous)
+            return True
+        return False
+    
+    @profiler.timed()
+    def commit_batch(self, edited=(), deleted_ids=(), metadata=False):
+        """Commit in-place edits of stored tasks and deletions as one write and one notification.
+        
+        Several changes are reported as one "batch" TaskChange, a lone change as itself.
+        Returns how many tasks changed.
+        """
+        changes = []
+        records = []
+        for task in edited:
+            previous = self.store.indexed_fields(task.id)
+            if previous is None:
+                continue
+            self.store.replace(task.id, task)
+            self.search_index.update(task)
+            records.append({"op": "put", "task": task.to_dict()})
+            changes.append(TaskChange("updated", task, task.id, previous))
+        for task_id in deleted_ids:
+            previous = self.store.indexed_fields(task_id)
+            task = self.store.remove(task_id)
+            if task is None:
+                continue
+            self.search_index.remove(task_id)
+            records.append({"op": "delete", "id": task_id})
+            changes.append(TaskChange("removed", task, task_id, previous))
+        if metadata:
+            records.append({"op": "meta", "categories": list(self.categories), "tags": list(self.tags)})
+            changes.append(TaskChange("metadata", None, None, None))
+        if not records:
+            return 0
+        
+        self._clear_cache()
+        self._persist_many(records)
+        if len(changes) == 1:
+            self._notify(*changes[0])
+        else:
+            self._notify("batch", tuple(changes))
+        return len(changes) - int(metadata)
+    
+    def _edit_tasks(self, task_ids, edit, metadata=False):
+        """Apply edit(task) in place to each stored task; edit returns False when nothing changed"""
+        edited = [task for task in self._tasks_for_ids(dict.fromkeys(task_ids)) if edit(task) is not False]
+        return self.commit_batch(edited, metadata=metadata)
+    
+    def complete_tasks(self, task_ids, completed=True):
+        """Mark tasks completed (or not) in one batch; returns how many changed"""
+        completion_date = datetime.datetime.now().isoformat() if completed else None
+        
+        def edit(task):
+            if task.completed == completed:
+                return False
+            task.completed = completed
+            task.completion_date = completion_date
+        return self._edit_tasks(task_ids, edit)
+    
+    def delete_tasks(self, task_ids):
+        return self.commit_batch(deleted_ids=dict.fromkeys(task_ids))
+    
+    def move_tasks(self, task_ids, category):
+        """Move tasks to category, adding it to the categories list if it is new"""
+        new_category = category not in self.categories
+        if new_category:
+            self.categories.append(category)
+        
+        def edit(task):
+            if task.category == category:
+                return False
+            task.category = category
+        return self._edit_tasks(task_ids, edit, metadata=new_category)
+    
+    def tag_tasks(self, task_ids, tag):
+        """Add tag to tasks, adding it to the tags list if it is new"""
+        new_tag = tag not in self.tags
+        if new_tag:
+            self.tags.append(tag)
+        
+        def edit(task):
+            if tag in task.tags:
+                return False
+            task.tags = task.tags + [tag]
+        return self._edit_tasks(task_ids, edit, metadata=new_tag)
+    
+    def untag_tasks(self, task_ids, tag):
+        def edit(task):
+            if tag not in task.tags:
+                return False
+            task.tags = [t for t in task.tags if t != tag]
+        return self._edit_tasks(task_ids, edit)
+    
+    def reschedule_tasks(self, task_ids, due_date):
+        """Give tasks a new due date (None clears it)"""
+        def edit(task):
+            if task.due_date == due_date:
+                return False
+            task.due_date = due_date
+        return self._edit_tasks(task_ids, edit)
+    
+    def get_task(self, task_id):
+        return self.store.get(task_id)
+    
+    def get_tasks_by_category(self, category):
+        return self.query_cache.get(("category", category),
+                                    lambda: tuple(self.store.lookup("category", category)))
+    
+    def get_tasks_by_priority(self, priority):
+        return self.query_cache.get(("priority", priority),
+                                    lambda: tuple(self.store.lookup("priority", priority)))
+    
+    def get_tasks_by_date(self, date):
+        return self.store.lookup("due_date", date)
+    
+    def workload(self, start, end):
+        """Open tasks per day within [start, end] (datetime.date), recurring occurrences included"""
+        counts = {}
+        months = {}
+        day = start
+        while day <= end:
+            date = day.isoformat()
+            count = self.store.count("due_date", date, lambda task: not task.completed)
+            month = months.get((day.year, day.month))
+            if month is None:
+                month = months[(day.year, day.month)] = self.recurrence.month(day.year, day.month)
+            for task_id in month.get(date, ()):
+                task = self.store.get(task_id)
+                if task is not None and not task.completed:
+                    count += 1
+            if count:
+                counts[date] = count
+            day += datetime.timedelta(days=1)
+        return counts
+    
+    def get_tasks_by_tag(self, tag):
+        return self.store.lookup("tag", tag)
+    
+    def get_completed_tasks(self):
+        return self.query_cache.get("completed",
+                                    lambda: tuple(task for task in self.store if task.completed))
+    
+    def get_incomplete_tasks(self):
+        return self.query_cache.get("incomplete",
+                                    lambda: tuple(task for task in self.store if not task.completed))
+    
+    def get_overdue_tasks(self):
+        today = datetime.datetime.now().date().isoformat()
+        # SQL only sees written edits; with some still queued the in-memory indexes answer instead
+        if self.storage.supports_queries and self.persistence.idle():
+            return self._tasks_for_ids(self.storage.query_overdue(today))
+        overdue = []
+        for due_date in self.store.index_values("due_date"):
+            if due_date and due_date < today:
+                overdue.extend(task for task in self.store.lookup("due_date", due_date)
+                               if not task.completed)
+        return overdue
+    
+    @profiler.timed()
+    def query_tasks(self, search_text="", filter_option="All"):
+        """Tasks matching the search box text and a filter_combo option"""
+        search_text = search_text.lower()
+        search_ids = self.search_index.search(search_text) if search_text else None
+        if search_ids is not None:
+            if filter_option == "All":
+                return self.store.in_order(search_ids)
+            search_text = ""  # Text already matched through the index
+        
+        if self.storage.supports_queries and self.persistence.idle():
+            # Only the filter runs as SQL: LIKE can't match word prefixes the way the index does
+            today = datetime.datetime.now().date().isoformat()
+            candidates = self._tasks_for_ids(self.storage.query_tasks("", filter_option, today))
+        elif filter_option == "Completed":
+            candidates = self.get_completed_tasks()
+        elif filter_option == "Incomplete":
+            candidates = self.get_incomplete_tasks()
+        elif filter_option in ("High Priority", "Medium Priority", "Low Priority"):
+            candidates = self.get_tasks_by_priority(filter_option.split()[0])
+        elif filter_option == "Overdue":
+            candidates = self.get_overdue_tasks()
+        else:
+            candidates = self.store
+        
+        if search_ids is not None:
+            return [task for task in candidates if task.id in search_ids]
+        if not search_text:
+            return list(candidates)
+        return [task for task in candidates if SearchIndex.text_matches(task, search_text)]
+    
+    def task_matches(self, task, search_text="", filter_option="All"):
+        """Whether a single task passes the same filter as query_tasks"""
+        search_text = search_text.lower()
+        if search_text:
+            matched = self.search_index.matches(task.id, search_text)
+            if matched is None:
+                matched = SearchIndex.text_matches(task, search_text)
+            if not matched:
+                return False
+        if filter_option == "Completed":
+            return task.completed
+        if filter_option == "Incomplete":
+            return not task.completed
+        if filter_option in ("High Priority", "Medium Priority", "Low Priority"):
+            return task.priority == filter_option.split()[0]
+        if filter_option == "Overdue":
+            today = datetime.datetime.now().date().isoformat()
+            return not task.completed and bool(task.due_date) and task.due_date < today
+        return True
+    
+    def _tasks_for_ids(self, task_ids):
+        return [task for task in map(self.store.get, task_ids) if task is not None]
+    
+    def add_category(self, category):
+        if category not in self.categories:
+            self.categories.append(category)
+            self.save_metadata()
+            return True
+        return False
+    
+    def add_tag(self, tag):
+        if tag not in self.tags:
+            self.tags.append(tag)
+            self.save_metadata()
+            return True
+        return False
+    
+    def save_metadata(self):
+        """Persist the categories and tags lists after they were edited"""
+        self._persist({"op": "meta", "categories": list(self.categories), "tags": list(self.tags)})
+        self._notify("metadata")
+    
+    def _persist(self, record):
+        """Queue one mutation (a journal record) for the persistence worker, or a full snapshot"""
+        self._persist_many((record,))
+    
+    def _persist_many(self, records):
+        """Queue mutations that must be written together, or one full snapshot"""
+        if not self.storage.incremental:
+            self.save_tasks()
+            return
+        self.persistence.put_many(records)
+    
+    def _clear_cache(self):
+        """Clear all caches when tasks are modified"""
+        self.query_cache.invalidate()
+    
+    def invalidate_queries(self):
+        """Drop cached query results after editing a Task in place without calling update_task"""
+        self._clear_cache()
+
+    @profiler.timed()
+    def save_tasks(self):
+        """Write a full snapshot of every task (a checkpoint when journaling)"""
+        if self.loading:
+            # A partially loaded board must not overwrite the full one
+            self._save_deferred = True
+            return
+        try:
+            data = {
+                "tasks": [task.to_dict() for task in self.store],
+                "categories": list(self.categories),
+                "tags": list(self.tags),
+                "next_id": task_ids.next_id
+            }
+            self.persistence.save_all(data)
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+    
+    def flush(self, timeout=None):
+        """Block until every queued write is on disk; False if one failed"""
+        return self.persistence.flush(timeout)
+    
+    def close(self):
+        """Flush outstanding writes and release the storage backend"""
+        if self._loader is not None:
+            self._loader.cancel()
+        self.persistence.close()
+        self.storage.close()
+    
+    @profiler.timed()
+    def load_tasks(self):
+        if not self.storage.exists():
+            return
+        
+        try:
+            data = self.storage.load()
+            tasks = Task.from_dicts(data.get("tasks", []))
+            task_ids.observe(data.get("next_id", 0) - 1)
+            remapped = remap_duplicate_ids(tasks)
+            self.store = TaskStore(tasks)
+            self._clear_cache()
+            self.categories = data.get("categories", DEFAULT_CATEGORIES.copy())
+            self.tags = data.get("tags", [])
+            if remapped:
+                print(f"Gave {remapped} tasks with duplicate ids new ids")
+                self.save_tasks()
+        except Exception as e:
+            print(f"Error loading tasks: {e}")
+            # Create backup of corrupted file
+            self.storage.quarantine()
+
+    @profiler.timed()
+    def import_batch(self, added, updated=(), categories=None, tags=None, replace=False):
+        """Commit an import in one go: one store update, one full save and one "reset" notification.
+        
+        A replace stops a progressive load; a merge keeps it going and save_tasks() waits for
+        the rest of the board before writing.
+        """
+        if replace:
+            if self._loader is not None:
+                self._loader.cancel()
+            added = list(added)
+            remap_duplicate_ids(added)
+            self.store = TaskStore(added)
+            if categories is not None:
+                self.categories = list(categories)
+            if tags is not None:
+                self.tags = list(tags)
+        else:
+            for task in updated:
+                if not self.store.replace(task.id, task):
+                    self.store.add(task)
+            for task in added:
+                if task.id in self.store:
+                    task.id = task_ids.allocate()
+                self.store.add(task)
+            self.categories = self.categories + [c for c in categories or [] if c not in self.categories]
+            self.tags = self.tags + [t for t in tags or [] if t not in self.tags]
+        self._clear_cache()
+        self.search_index.rebuild(self.store)
+        self.save_tasks()
+        self._notify("reset")
+    
+    def begin_loading(self, loader):
+        self.loading = True
+        self._loader = loader
+        self._save_deferred = False
+    
+    def load_metadata(self, meta):
+        """Apply categories, tags and next_id read by a TaskLoader"""
+        if "categories" in meta:
+            self.categories = meta["categories"]
+        if "tags" in meta:
+            self.tags = meta["tags"]
+        task_ids.observe(meta.get("next_id", 0) - 1)
+        if "categories" in meta or "tags" in meta:
+            self._notify("metadata")
+    
+    @profiler.timed()
+    def load_page(self, tasks):
+        """Add a page of tasks read by a TaskLoader; listeners hear about it in publish_loaded"""
+        for task in tasks:
+            task_ids.observe(task.id)
+        for task in tasks:
+            if task.id in self.store:
+                task.id = task_ids.allocate()
+                self._save_deferred = True  # Persist the remapped id
+            self.store.add(task)
+            self.search_index.update(task)
+        self._clear_cache()
+    
+    def publish_loaded(self):
+        """Refresh listeners after one or more load_page calls"""
+        self._notify("reset")
+    
+    def finish_loading(self):
+        self.loading = False
+        self._loader = None
+        if self._save_deferred:
+            self._save_deferred = False
+            self.save_tasks()
+        self.publish_loaded()
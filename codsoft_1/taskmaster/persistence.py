@@ -0,0 +1,188 @@
+import atexit
+import threading
+import time
+
+from taskmaster.config import PERSIST_COALESCE_SECONDS, PERSIST_MAX_DELAY_SECONDS, PERSIST_RETRY_SECONDS
+from taskmaster.profiling import profiler
+
+class PersistenceWorker:
+    """Writes task changes to storage on a background thread, a burst of edits at a time.
+    
+    Queued journal records for the same task (or for the metadata) replace each other in
+    place, so the journal still adds new tasks in store order, and a full snapshot replaces
+    everything queued before it. A burst of edits becomes a single write.
+    A failed write stays queued and is retried; on_error(message) is called on the worker thread.
+    """
+    
+    def __init__(self, storage, coalesce_seconds=PERSIST_COALESCE_SECONDS,
+                 max_delay_seconds=PERSIST_MAX_DELAY_SECONDS, retry_seconds=PERSIST_RETRY_SECONDS):
+        self.storage = storage
+        self.coalesce_seconds = coalesce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.retry_seconds = retry_seconds
+        self.on_error = None
+        self.error = None  # Message of the last failed write until a write succeeds again
+        self.writes = 0  # Storage writes issued so far
+        self._condition = threading.Condition()
+        self._snapshot = None
+        self._records = {}  # ("task", id), ("deleted", id) or ("meta",) -> journal record
+        self._first_change = None  # time.monotonic() of the oldest change not yet written
+        self._last_change = None
+        self._failed_at = None
+        self._attempts = 0
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = None
+    
+    @staticmethod
+    def _key(record):
+        if record["op"] == "put":
+            return ("task", record["task"]["id"])
+        if record["op"] == "delete":
+            return ("task", record["id"])
+        return ("meta",)
+    
+    def _pending(self):
+        return self._snapshot is not None or bool(self._records)
+    
+    def _changed(self):
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="task-persistence", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+        self._condition.notify_all()
+    
+    def _queue(self, record):
+        key = self._key(record)
+        queued = self._records.get(key)
+        if queued is not None and queued["op"] == "delete":
+            # A deleted task that comes back is re-added at the end, so keep the delete ahead of it
+            del self._records[key]
+            if record["op"] == "put":
+                self._records.setdefault(("deleted", key[1]), queued)
+        elif record["op"] == "delete":
+            self._records.pop(key, None)
+        self._records[key] = record
+    
+    def put(self, record):
+        """Queue a journal record ({"op": "put" | "delete" | "meta", ...})"""
+        self.put_many((record,))
+    
+    def put_many(self, records):
+        """Queue several journal records at once, so they are written in the same batch"""
+        with self._condition:
+            for record in records:
+                self._queue(record)
+            self._changed()
+    
+    def save_all(self, data):
+        """Queue a full snapshot; it supersedes every record queued before it"""
+        with self._condition:
+            self._snapshot = data
+            self._records.clear()
+            self._changed()
+    
+    def _due(self):
+        if self._failed_at is not None:
+            return self._failed_at + self.retry_seconds
+        return min(self._last_change + self.coalesce_seconds, self._first_change + self.max_delay_seconds)
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and (not self._pending() or self._failed_at is not None):
+                        return
+                    if not self._pending():
+                        self._condition.wait()
+                        continue
+                    if self._flush_requested or self._closed:
+                        break
+                    delay = self._due() - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                snapshot, records = self._snapshot, self._records
+                self._snapshot, self._records = None, {}
+                self._first_change = self._last_change = None
+                self._writing = True
+            
+            error = None
+            try:
+                if snapshot is not None:
+                    with profiler.span("persist.snapshot"):
+                        self.storage.save_all(snapshot)
+                    snapshot = None
+                if records:
+                    with profiler.span("persist.batch"):
+                        self.storage.apply_batch(list(records.values()))
+                    profiler.count("persist.records", len(records))
+            except Exception as e:
+                error = f"Error saving tasks: {e}"
+                print(error)
+            
+            with self._condition:
+                self._writing = False
+                self._attempts += 1
+                if error is None:
+                    self.writes += 1
+                    self.error = None
+                    self._failed_at = None
+                    self._flush_requested = self._flush_requested and self._pending()
+                else:
+                    self._requeue(snapshot, records)
+                    self.error = error
+                    self._failed_at = time.monotonic()
+                    self._flush_requested = False
+                self._condition.notify_all()
+            if error is not None and self.on_error is not None:
+                self.on_error(error)
+    
+    def _requeue(self, snapshot, records):
+        """Put a failed write back under anything queued while it ran"""
+        if self._snapshot is not None:
+            return  # A newer snapshot already covers it
+        self._snapshot = snapshot
+        newer, self._records = self._records, records
+        for record in newer.values():
+            self._queue(record)
+        if self._pending():
+            now = time.monotonic()
+            self._first_change = self._first_change or now
+            self._last_change = self._last_change or now
+    
+    def idle(self):
+        """True when nothing is queued or being written, so the storage reflects every edit"""
+        with self._condition:
+            return not (self._pending() or self._writing)
+    
+    def flush(self, timeout=None):
+        """Write everything queued so far now; False if a write failed or timeout ran out"""
+        with self._condition:
+            if not self._pending() and not self._writing:
+                return True
+            if self._closed or not self._thread.is_alive():
+                return False  # Nothing left to write it, e.g. the atexit flush after a failed close()
+            attempts = self._attempts
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: not (self._pending() or self._writing) or
+                        (self._failed_at is not None and self._attempts > attempts), timeout)
+            return not (self._pending() or self._writing)
+    
+    def close(self, timeout=None):
+        """Flush and stop the worker thread; False if something could not be written"""
+        written = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            atexit.unregister(self.flush)
+        return written
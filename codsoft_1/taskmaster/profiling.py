@@ -0,0 +1,151 @@
+import cProfile
+import functools
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from taskmaster.config import PROFILE_WINDOW, PROFILE_TRACE_EVENTS
+from taskmaster.storage import write_json_atomic
+
+class Profiler:
+    """Timing spans, counters and a rolling latency window for the hot paths.
+    
+    Every span keeps its last PROFILE_WINDOW durations for the histogram and adds an event to a
+    bounded trace that can be dumped in Chrome trace format (chrome://tracing, Perfetto).
+    """
+    
+    # Upper bounds of the latency histogram buckets, in milliseconds
+    BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 133, 266, 533)
+    
+    def __init__(self, window=PROFILE_WINDOW, trace_events=PROFILE_TRACE_EVENTS):
+        self.window = window
+        self.counters = Counter()
+        self._spans = {}  # name -> [calls, total seconds, max seconds, deque of recent seconds]
+        self._trace = deque(maxlen=trace_events)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._cprofile = None
+    
+    def record(self, name, seconds, start=None):
+        """Add one duration for name; start is its perf_counter() start time for the trace"""
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                span = self._spans[name] = [0, 0.0, 0.0, deque(maxlen=self.window)]
+            span[0] += 1
+            span[1] += seconds
+            span[2] = max(span[2], seconds)
+            span[3].append(seconds)
+            if start is not None:
+                self._trace.append((name, start, seconds, threading.get_ident()))
+    
+    def span(self, name):
+        """Context manager timing the enclosed block as one call of name"""
+        return _Span(self, name)
+    
+    def timed(self, name=None):
+        """Decorator timing every call of a function (named after it by default)"""
+        def decorate(func):
+            span_name = name or func.__name__
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(span_name, time.perf_counter() - start, start)
+            return wrapper
+        return decorate
+    
+    def count(self, name, n=1):
+        # Counted from worker threads too, and += on a dict entry is not atomic
+        with self._lock:
+            self.counters[name] += n
+    
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self._spans.clear()
+            self._trace.clear()
+    
+    def histogram(self, name):
+        """(bucket label, count) pairs for the recent durations of name"""
+        with self._lock:
+            span = self._spans.get(name)
+            recent = list(span[3]) if span else []
+        counts = [0] * (len(self.BUCKETS_MS) + 1)
+        for seconds in recent:
+            ms = seconds * 1000
+            i = 0
+            while i < len(self.BUCKETS_MS) and ms > self.BUCKETS_MS[i]:
+                i += 1
+            counts[i] += 1
+        labels = [f"≤{bound} ms" for bound in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]} ms"]
+        return list(zip(labels, counts))
+    
+    def snapshot(self):
+        """Per-span call counts and timings in milliseconds, plus the counters"""
+        with self._lock:
+            spans = {}
+            for name, (calls, total, longest, recent) in self._spans.items():
+                ordered = sorted(recent)
+                spans[name] = {
+                    "calls": calls,
+                    "total_ms": total * 1000,
+                    "mean_ms": total / calls * 1000,
+                    "max_ms": longest * 1000,
+                    "p50_ms": ordered[len(ordered) // 2] * 1000,
+                    "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+                }
+            return {"spans": spans, "counters": dict(self.counters)}
+    
+    def dump_trace(self, path):
+        """Write the recent spans as a Chrome trace, with the snapshot alongside"""
+        pid = os.getpid()
+        with self._lock:
+            events = [{"name": name, "ph": "X", "pid": pid, "tid": tid,
+                       "ts": round((start - self._origin) * 1e6, 1), "dur": round(seconds * 1e6, 1)}
+                      for name, start, seconds, tid in self._trace]
+        data = self.snapshot()
+        data["traceEvents"] = events
+        data["displayTimeUnit"] = "ms"
+        write_json_atomic(path, data, indent=2)
+    
+    @property
+    def cprofile_running(self):
+        return self._cprofile is not None
+    
+    def start_cprofile(self):
+        """Profile every function call on the calling thread until stop_cprofile"""
+        if self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+    
+    def stop_cprofile(self, path=None):
+        """Stop cProfile and, given a path, save its stats there (for pstats or snakeviz)"""
+        profile, self._cprofile = self._cprofile, None
+        if profile is None:
+            return None
+        profile.disable()
+        if path:
+            profile.dump_stats(path)
+        return profile
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.start)
+        return False
+
+profiler = Profiler()
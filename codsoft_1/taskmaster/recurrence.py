@@ -0,0 +1,106 @@
+import datetime
+from collections import OrderedDict
+from calendar import monthrange
+
+class RecurrenceEngine:
+    """Expands recurring tasks into occurrence dates on demand, cached per calendar month.
+    
+    Occurrences are the repeats after a task's due date; they are never stored as tasks.
+    """
+    
+    RULES = ("Daily", "Weekly", "Monthly", "Yearly")
+    CACHED_MONTHS = 24
+    
+    def __init__(self, task_manager):
+        self.task_manager = task_manager
+        self._months = OrderedDict()  # (year, month) -> {date iso: [task ids]}
+        task_manager.subscribe(self.on_tasks_changed)
+    
+    def on_tasks_changed(self, change):
+        if change.kind == "batch":
+            for single in change.task:
+                self.on_tasks_changed(single)
+        elif change.kind == "reset":
+            self._months.clear()
+        elif change.kind in ("added", "updated", "removed"):
+            was_recurring = change.previous is not None and change.previous.get("recurring")
+            is_recurring = change.task is not None and change.kind != "removed" and change.task.recurring
+            if was_recurring or is_recurring:
+                self._months.clear()
+    
+    @staticmethod
+    def _anchor(task):
+        try:
+            return datetime.date.fromisoformat(task.due_date) if task.due_date else None
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _on_day(year, month, day):
+        """date(year, month, day), clamped to the month's last day (Jan 31 -> Feb 28)"""
+        return datetime.date(year, month, min(day, monthrange(year, month)[1]))
+    
+    def occurrences(self, task, start, end):
+        """Yield the dates task repeats on within [start, end], after its due date"""
+        anchor = self._anchor(task)
+        if anchor is None or task.recurring not in self.RULES:
+            return
+        start = max(start, anchor + datetime.timedelta(days=1))
+        if start > end:
+            return
+        
+        if task.recurring in ("Daily", "Weekly"):
+            step = 1 if task.recurring == "Daily" else 7
+            offset = (start - anchor).days % step
+            current = start + datetime.timedelta(days=(step - offset) % step)
+            while current <= end:
+                yield current
+                current += datetime.timedelta(days=step)
+        elif task.recurring == "Monthly":
+            year, month = start.year, start.month
+            while (year, month) <= (end.year, end.month):
+                current = self._on_day(year, month, anchor.day)
+                if start <= current <= end:
+                    yield current
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        else:
+            for year in range(start.year, end.year + 1):
+                current = self._on_day(year, anchor.month, anchor.day)
+                if start <= current <= end:
+                    yield current
+    
+    def month(self, year, month):
+        """Occurrences in a calendar month as {date iso: [task ids]}"""
+        key = (year, month)
+        if key in self._months:
+            self._months.move_to_end(key)
+            return self._months[key]
+        
+        start = datetime.date(year, month, 1)
+        end = datetime.date(year, month, monthrange(year, month)[1])
+        days = {}
+        for rule in self.RULES:
+            for task in self.task_manager.store.lookup("recurring", rule):
+                for day in self.occurrences(task, start, end):
+                    days.setdefault(day.isoformat(), []).append(task.id)
+        
+        self._months[key] = days
+        if len(self._months) > self.CACHED_MONTHS:
+            self._months.popitem(last=False)
+        return days
+    
+    def tasks_on(self, date):
+        """Recurring tasks with an occurrence on date (a datetime.date)"""
+        task_ids = self.month(date.year, date.month).get(date.isoformat(), [])
+        return [task for task in map(self.task_manager.get_task, task_ids) if task is not None]
+    
+    def count_between(self, start, end):
+        """Number of occurrences of all recurring tasks within [start, end]"""
+        count = 0
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            for day, task_ids in self.month(year, month).items():
+                if start.isoformat() <= day <= end.isoformat():
+                    count += len(task_ids)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return count
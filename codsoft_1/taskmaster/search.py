@@ -0,0 +1,148 @@
+import re
+import bisect
+import threading
+
+class SearchIndex:
+    """Inverted word index over task text for prefix, multi-term AND search.
+    
+    The initial build runs on a worker thread; until it finishes search() returns None
+    and callers fall back to scanning with text_matches(), which has the same semantics.
+    Edits made meanwhile are applied directly and win over the build's older view of the
+    same task.
+    """
+    
+    TOKEN_PATTERN = re.compile(r"\w+")
+    
+    def __init__(self):
+        self._postings = {}  # token -> set of task ids
+        self._task_tokens = {}  # task id -> frozenset of its tokens
+        self._vocabulary = []  # sorted tokens, for prefix range scans
+        self._lock = threading.Lock()
+        self._removed = set()  # ids deleted while a build is in flight
+        self._builder = None
+        self._generation = 0
+        self._last_query = None
+        self.ready = False
+    
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN_PATTERN.findall(text.lower()) if text else []
+    
+    @classmethod
+    def _tokens_for(cls, task):
+        parts = [task.title, task.description, task.notes]
+        parts.extend(task.tags or [])
+        parts.extend(subtask.get("title", "") for subtask in task.subtasks or [])
+        return frozenset(token for part in parts for token in cls.tokenize(part))
+    
+    @staticmethod
+    def _terms_match(tokens, terms):
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+    
+    @classmethod
+    def text_matches(cls, task, text):
+        """Whether every term of text starts a word of task, as search() decides, without the index"""
+        terms = cls.tokenize(text)
+        return not terms or cls._terms_match(cls._tokens_for(task), terms)
+    
+    def rebuild(self, tasks):
+        """Index tasks from scratch on a worker thread"""
+        tasks = list(tasks)
+        with self._lock:
+            self._postings.clear()
+            self._task_tokens.clear()
+            self._vocabulary.clear()
+            self._removed.clear()
+            self._generation += 1
+            self._last_query = None
+            self.ready = False
+        self._builder = threading.Thread(target=self._build, args=(tasks, self._generation),
+                                         name="search-index", daemon=True)
+        self._builder.start()
+    
+    def wait(self):
+        if self._builder is not None:
+            self._builder.join()
+    
+    def _build(self, tasks, generation, chunk_size=2000):
+        try:
+            for start in range(0, len(tasks), chunk_size):
+                chunk = [(task.id, self._tokens_for(task)) for task in tasks[start:start + chunk_size]]
+                with self._lock:
+                    if generation != self._generation:
+                        return  # Superseded by a newer rebuild
+                    for task_id, tokens in chunk:
+                        if task_id not in self._task_tokens and task_id not in self._removed:
+                            self._set_tokens(task_id, tokens)
+            with self._lock:
+                if generation == self._generation:
+                    self._removed.clear()
+                    self._last_query = None
+                    self.ready = True
+        except Exception as e:
+            print(f"Error building search index: {e}")
+    
+    def _set_tokens(self, task_id, tokens):
+        old_tokens = self._task_tokens.get(task_id, frozenset())
+        for token in old_tokens - tokens:
+            ids = self._postings[token]
+            ids.discard(task_id)
+            if not ids:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        for token in tokens - old_tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                bisect.insort(self._vocabulary, token)
+            ids.add(task_id)
+        if tokens:
+            self._task_tokens[task_id] = tokens
+        else:
+            self._task_tokens.pop(task_id, None)
+    
+    def update(self, task):
+        with self._lock:
+            self._removed.discard(task.id)
+            self._set_tokens(task.id, self._tokens_for(task))
+            self._last_query = None
+    
+    def remove(self, task_id):
+        with self._lock:
+            self._set_tokens(task_id, frozenset())
+            if not self.ready:
+                self._removed.add(task_id)
+            self._last_query = None
+    
+    def _prefix_ids(self, prefix):
+        ids = set()
+        i = bisect.bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            ids |= self._postings[self._vocabulary[i]]
+            i += 1
+        return ids
+    
+    def search(self, text):
+        """Ids of tasks with a word starting with every term of text, or None if not searchable"""
+        terms = self.tokenize(text)
+        if not self.ready or not terms:
+            return None
+        with self._lock:
+            if self._last_query is not None and self._last_query[0] == terms:
+                return self._last_query[1]
+            result = None
+            # Longest terms first: they usually have the smallest posting sets
+            for term in sorted(set(terms), key=len, reverse=True):
+                ids = self._prefix_ids(term)
+                result = ids if result is None else result & ids
+                if not result:
+                    break
+            self._last_query = (terms, result)
+            return result
+    
+    def matches(self, task_id, text):
+        """Single-task form of search(); None if not searchable"""
+        terms = self.tokenize(text)
+        if not self.ready or not terms:
+            return None
+        return self._terms_match(self._task_tokens.get(task_id, ()), terms)
@@ -0,0 +1,115 @@
+from bisect import bisect_right
+
+from taskmaster.config import PRIORITY_LEVELS, SORT_KEYS
+
+_HIGHEST_PRIORITY = max(level["value"] for level in PRIORITY_LEVELS.values())
+_PRIORITY_RANK = {name: f"{_HIGHEST_PRIORITY - level['value']:03d}" for name, level in PRIORITY_LEVELS.items()}
+
+# Each sort field encodes a task as a string that sorts in the field's order. Variable-length
+# parts end in "\0", so a chain of fields is just their concatenation and compares as one
+# string, which keeps multi-key sorts as fast as a single-key one.
+SORT_FIELDS = {
+    "Due Date": lambda t: f"0{t.due_date}\0" if t.due_date else "1",  # Undated tasks last
+    "Priority": lambda t: _PRIORITY_RANK.get(t.priority, "999"),
+    "Title": lambda t: t.title.lower() + "\0",
+    "Creation Date": lambda t: (t.created_at or "") + "\0",
+    "Category": lambda t: (t.category or "") + "\0"
+}
+
+class SortEngine:
+    """Multi-key task ordering with the keys cached per task until the task changes.
+    
+    A sort is a chain of SORT_FIELDS names, most significant first; a single SORT_OPTIONS name
+    expands to its SORT_KEYS chain. Keys end with the task id, so every task has exactly one
+    place in a sorted list and a changed task can be re-placed with a bisect.
+    """
+    
+    def __init__(self, task_manager=None):
+        self._keys = {}  # field chain -> {task id: (task, key)}
+        if task_manager is not None:
+            task_manager.subscribe(self.on_tasks_changed)
+    
+    def on_tasks_changed(self, change):
+        if change.kind == "batch":
+            for single in change.task:
+                self.on_tasks_changed(single)
+        elif change.kind == "reset":
+            self.clear()
+        elif change.kind in ("updated", "removed"):
+            for keys in self._keys.values():
+                keys.pop(change.task_id, None)
+    
+    def clear(self):
+        """Drop every cached key"""
+        self._keys.clear()
+    
+    @staticmethod
+    def fields(sort_option):
+        """Field chain for a SORT_OPTIONS name or a sequence of field names; empty if none is known"""
+        if isinstance(sort_option, str):
+            sort_option = SORT_KEYS.get(sort_option, (sort_option,))
+        return tuple(field for field in sort_option if field in SORT_FIELDS)
+    
+    def key(self, sort_option):
+        """Key function for sort_option, or None when it doesn't sort"""
+        fields = self.fields(sort_option)
+        if not fields:
+            return None
+        keys = self._keys.setdefault(fields, {})
+        parts = [SORT_FIELDS[field] for field in fields]
+        
+        def key(task):
+            entry = keys.get(task.id)
+            # A replaced Task object means an edit the cache hasn't been told about
+            if entry is not None and entry[0] is task:
+                return entry[1]
+            value = "".join([part(task) for part in parts]) + f"{task.id:020d}"
+            keys[task.id] = (task, value)
+            return value
+        return key
+    
+    def sort(self, tasks, sort_option):
+        """Sort a list of tasks in place and return it"""
+        key = self.key(sort_option)
+        if key is not None:
+            tasks.sort(key=key)
+        return tasks
+    
+    def insertion_index(self, tasks, task, sort_option):
+        """Index where task belongs in tasks, which are sorted by sort_option and don't contain it"""
+        key = self.key(sort_option)
+        if key is None:
+            return len(tasks)
+        return bisect_right(_KeyView(tasks, key), key(task))
+    
+    def in_place(self, tasks, index, task, sort_option):
+        """True when task, the new version of tasks[index], still sorts between its neighbours"""
+        key = self.key(sort_option)
+        if key is None:
+            return True
+        value = key(task)
+        return ((index == 0 or key(tasks[index - 1]) < value) and
+                (index + 1 == len(tasks) or value < key(tasks[index + 1])))
+    
+    def reposition(self, tasks, index, sort_option):
+        """Move the changed tasks[index] to its sorted place; returns the new index"""
+        if self.in_place(tasks, index, tasks[index], sort_option):
+            return index
+        task = tasks.pop(index)
+        new_index = self.insertion_index(tasks, task, sort_option)
+        tasks.insert(new_index, task)
+        return new_index
+
+class _KeyView:
+    """Read-only sequence of the keys of a task list, for bisect"""
+    __slots__ = ("tasks", "key")
+    
+    def __init__(self, tasks, key):
+        self.tasks = tasks
+        self.key = key
+    
+    def __len__(self):
+        return len(self.tasks)
+    
+    def __getitem__(self, index):
+        return self.key(self.tasks[index])
@@ -0,0 +1,112 @@
+import datetime
+from collections import Counter
+
+class TaskStatistics:
+    """Statistics counters kept current in O(1) per task change.
+    
+    Each task's last contribution is remembered, so in-place edits are subtracted correctly.
+    The overdue/today/this-week buckets are relative to one day and are re-bucketed from the
+    per-date counts when the date rolls over.
+    """
+    
+    def __init__(self, task_manager):
+        self.task_manager = task_manager
+        self._contributions = {}  # task id -> (completed, priority, category, due_date)
+        self._day = None
+        self.total = 0
+        self.completed = 0
+        self.by_priority = Counter()
+        self.by_category = Counter()
+        self.no_due_date = 0
+        self._open_by_date = Counter()  # due date -> incomplete tasks due that day
+        self.overdue = 0
+        self.due_today = 0
+        self.due_this_week = 0
+        task_manager.subscribe(self.on_tasks_changed)
+    
+    def on_tasks_changed(self, change):
+        if change.kind == "batch":
+            for single in change.task:
+                self.on_tasks_changed(single)
+        elif change.kind == "reset":
+            self.rebuild(self.task_manager.store)
+        elif change.kind == "removed":
+            self._apply(change.task_id, None)
+        elif change.kind in ("added", "updated"):
+            self._apply(change.task_id, change.task)
+    
+    def rebuild(self, tasks):
+        self._contributions.clear()
+        self.total = self.completed = self.no_due_date = 0
+        self.by_priority.clear()
+        self.by_category.clear()
+        self._open_by_date.clear()
+        self.overdue = self.due_today = self.due_this_week = 0
+        self._day = datetime.date.today()
+        for task in tasks:
+            self._set(task.id, task)
+    
+    def _bucket(self, due_date):
+        """Which relative date bucket an incomplete task due on due_date falls in"""
+        today = self._day.isoformat()
+        if due_date < today:
+            return "overdue"
+        if due_date == today:
+            return "due_today"
+        if due_date <= (self._day + datetime.timedelta(days=7)).isoformat():
+            return "due_this_week"
+        return None
+    
+    def _count(self, contribution, sign):
+        completed, priority, category, due_date = contribution
+        self.total += sign
+        self.completed += sign * completed
+        self.by_priority[priority] += sign
+        self.by_category[category] += sign
+        if not due_date:
+            self.no_due_date += sign
+        elif not completed:
+            self._open_by_date[due_date] += sign
+            if not self._open_by_date[due_date]:
+                del self._open_by_date[due_date]
+            bucket = self._bucket(due_date)
+            if bucket:
+                setattr(self, bucket, getattr(self, bucket) + sign)
+    
+    def _apply(self, task_id, task):
+        self.roll_over()
+        self._set(task_id, task)
+    
+    def _set(self, task_id, task):
+        old = self._contributions.pop(task_id, None)
+        if old is not None:
+            self._count(old, -1)
+        if task is not None:
+            new = (bool(task.completed), task.priority, task.category, task.due_date)
+            self._contributions[task_id] = new
+            self._count(new, 1)
+    
+    def roll_over(self):
+        """Re-bucket overdue/today/this-week counts if the date changed since the last update"""
+        today = datetime.date.today()
+        if self._day == today:
+            return
+        self._day = today
+        self.overdue = self.due_today = self.due_this_week = 0
+        for due_date, count in self._open_by_date.items():
+            bucket = self._bucket(due_date)
+            if bucket:
+                setattr(self, bucket, getattr(self, bucket) + count)
+    
+    def snapshot(self):
+        self.roll_over()
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "by_priority": {key: count for key, count in self.by_priority.items() if count},
+            "by_category": {key: count for key, count in self.by_category.items() if count},
+            "overdue": self.overdue,
+            "due_today": self.due_today,
+            "due_this_week": self.due_this_week,
+            "no_due_date": self.no_due_date
+        }
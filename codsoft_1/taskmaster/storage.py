@@ -0,0 +1,713 @@
+import json
+import os
+import re
+import datetime
+import threading
+import codecs
+import itertools
+import sqlite3
+import stat
+import tempfile
+
+from taskmaster.config import (SAVE_FILE, JOURNAL_FILE, JOURNAL_MODE, JOURNAL_COMPACT_THRESHOLD, SQLITE_FILE,
+                               STORAGE_BACKEND, LOAD_PAGE_SIZE, STREAM_CHUNK_SIZE, DEFAULT_CATEGORIES)
+from taskmaster.task import Task, task_ids, remap_duplicate_ids
+
+# Read once at import: os.umask can only be queried by setting it, which would race other threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _fsync_dir(path):
+    """Flush a directory entry so a completed rename survives power loss (POSIX only)"""
+    if os.name != "posix":
+        return
+    dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to a temp file, fsync it and rename it over path so readers never see a torn file"""
+    # json.dumps without indent uses the C encoder, several times faster than json.dump on big boards
+    text = json.dumps(data, indent=indent, ensure_ascii=False)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w", encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the mode the file had, or the one open() would give it
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(path)
+
+def _tasks_last(data):
+    """Order snapshot keys so the tasks array comes last and a streaming reader sees everything else first"""
+    layout = {key: value for key, value in data.items() if key != "tasks"}
+    layout["tasks"] = data.get("tasks", [])
+    return layout
+
+class JsonObjectStream:
+    """Iterates the top-level object of a JSON file opened in binary mode, yielding (key, value).
+    
+    The array under stream_key is yielded one item at a time as (stream_key, item), so only a
+    chunk of the file and the current item are held in memory.
+    """
+    
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+    DELIMITERS = frozenset(" \t\n\r,:]}")
+    
+    def __init__(self, f, stream_key, chunk_size=STREAM_CHUNK_SIZE):
+        self.f = f
+        self.stream_key = stream_key
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+    
+    def _read(self):
+        """Append the next chunk to the buffer, dropping what was already parsed"""
+        if self._eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(chunk, final=self._eof)
+        self._pos = 0
+        return True
+    
+    def _peek(self):
+        while True:
+            self._pos = self.WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise ValueError("Unexpected end of JSON data")
+    
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} but found {self._buffer[self._pos]!r}")
+        self._pos += 1
+    
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+            if (end == len(self._buffer) or self._buffer[end] not in self.DELIMITERS) and self._read():
+                continue  # A number cut off at the end of a chunk may carry on in the next one
+            self._pos = end
+            return value
+    
+    def __iter__(self):
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == self.stream_key and self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield key, self._value()
+                        if self._peek() != ",":
+                            break
+                        self._pos += 1
+                    self._expect("]")
+            else:
+                yield key, self._value()
+            if self._peek() != ",":
+                break
+            self._pos += 1
+        self._expect("}")
+
+def _paged_load(data, page_size):
+    """Split fully loaded board data into the events produced by iter_load"""
+    yield "meta", {key: value for key, value in data.items() if key != "tasks"}
+    tasks = data.get("tasks", [])
+    for start in range(0, len(tasks), page_size):
+        yield "tasks", tasks[start:start + page_size]
+
+class TaskJournal:
+    """Append-only log of task mutations, folded into the tasks.json snapshot in the background.
+    
+    Every record carries a sequence number and the snapshot remembers the last sequence
+    folded into it, so replaying a journal that survived a crash is always idempotent.
+    """
+    
+    def __init__(self, snapshot_path=SAVE_FILE, path=JOURNAL_FILE,
+                 compact_threshold=JOURNAL_COMPACT_THRESHOLD):
+        self.snapshot_path = snapshot_path
+        self.path = path
+        self.compacting_path = f"{path}.compacting"
+        self.compact_threshold = compact_threshold
+        self.seq = 0
+        self.pending = 0
+        self._file = None
+        self._compactor = None
+        self._lock = threading.Lock()  # Serialises snapshot rewrites
+    
+    def has_records(self):
+        return os.path.exists(self.path) or os.path.exists(self.compacting_path)
+    
+    def append(self, record):
+        self.append_many([record])
+    
+    def append_many(self, records):
+        """Append records with a single write and fsync"""
+        if self._file is None:
+            self._file = self._open_for_append()
+        lines = []
+        for record in records:
+            self.seq += 1
+            record["seq"] = self.seq
+            lines.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode('utf-8') + b"\n")
+        self._file.write(b"".join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.pending += len(records)
+        if self.pending >= self.compact_threshold:
+            self.compact()
+    
+    def _open_for_append(self):
+        # Binary, so a crash that tore a multibyte character can't make the tail undecodable
+        f = open(self.path, "a+b")
+        # Terminate a record torn by a crash so the next one starts on its own line
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        return f
+    
+    @staticmethod
+    def _read(path):
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    yield json.loads(line.decode('utf-8'))
+                except ValueError:
+                    continue  # Torn tail of an interrupted append (UnicodeDecodeError is a ValueError too)
+    
+    @staticmethod
+    def fold(data, records):
+        """Apply journal records newer than the snapshot's journal_seq to snapshot data"""
+        # Snapshots written before ids were allocated may repeat an id; keep every copy so
+        # TaskManager can remap them, and let journal records address the first one
+        tasks = list(data.get("tasks", []))
+        rows = {}
+        for row, task_data in enumerate(tasks):
+            rows.setdefault(task_data.get("id"), row)
+        seq = data.get("journal_seq", 0)
+        next_id = data.get("next_id", 0)
+        for record in records:
+            if record.get("seq", 0) <= seq:
+                continue
+            seq = record["seq"]
+            op = record.get("op")
+            if op == "put":
+                task_id = record["task"]["id"]
+                if task_id in rows:
+                    tasks[rows[task_id]] = record["task"]
+                else:
+                    rows[task_id] = len(tasks)
+                    tasks.append(record["task"])
+                if isinstance(task_id, int):
+                    next_id = max(next_id, task_id + 1)
+            elif op == "delete":
+                row = rows.pop(record["id"], None)
+                if row is not None:
+                    tasks[row] = None
+            elif op == "meta":
+                data["categories"] = record["categories"]
+                data["tags"] = record["tags"]
+        data["tasks"] = [task_data for task_data in tasks if task_data is not None]
+        data["journal_seq"] = seq
+        if next_id:
+            data["next_id"] = next_id
+        return data
+    
+    @staticmethod
+    def plan(records, seq):
+        """Net effect of records newer than seq per task id, for applying them while streaming a snapshot.
+        
+        Returns ({id: [task_data, deleted, append_seq]}, last meta record, last seq). As in fold, a
+        put after a delete, or of an id the snapshot lacks, appends the task at append_seq.
+        """
+        plans = {}
+        meta = None
+        for record in records:
+            if record.get("seq", 0) <= seq:
+                continue
+            seq = record["seq"]
+            op = record.get("op")
+            if op == "put":
+                plan = plans.setdefault(record["task"]["id"], [None, False, None])
+                if plan[0] is None:
+                    plan[2] = seq
+                plan[0] = record["task"]
+            elif op == "delete":
+                plans[record["id"]] = [None, True, None]
+            elif op == "meta":
+                meta = record
+        return plans, meta, seq
+    
+    def pending_records(self):
+        """Every record not yet folded into the snapshot, oldest first"""
+        pending = list(self._read(self.path))
+        self.pending = len(pending)
+        return list(self._read(self.compacting_path)) + pending
+    
+    def replay(self, data):
+        """Bring snapshot data up to date with every record still in the journal"""
+        data = self.fold(data, self.pending_records())
+        self.seq = data["journal_seq"]
+        return data
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def compact(self, wait=False):
+        """Rotate the journal aside and fold it into the snapshot on a worker thread"""
+        if self._compactor is not None and self._compactor.is_alive():
+            if not wait:
+                return
+            self._compactor.join()
+        self.close()
+        if not os.path.exists(self.compacting_path):
+            if not os.path.exists(self.path):
+                return
+            os.replace(self.path, self.compacting_path)
+            _fsync_dir(self.path)
+            self.pending = 0
+        self._compactor = threading.Thread(target=self._fold_compacting, name="journal-compactor", daemon=True)
+        self._compactor.start()
+        if wait:
+            self._compactor.join()
+    
+    def _fold_compacting(self):
+        try:
+            with self._lock:
+                data = {"tasks": [], "categories": DEFAULT_CATEGORIES.copy(), "tags": []}
+                if os.path.exists(self.snapshot_path):
+                    with open(self.snapshot_path, "r", encoding='utf-8') as f:
+                        data = json.load(f)
+                data = self.fold(data, self._read(self.compacting_path))
+                write_json_atomic(self.snapshot_path, _tasks_last(data))
+                os.remove(self.compacting_path)
+                _fsync_dir(self.compacting_path)
+        except Exception as e:
+            print(f"Error compacting journal: {e}")
+    
+    def checkpoint(self, data):
+        """Write a full snapshot synchronously and drop the journal it supersedes"""
+        if self._compactor is not None:
+            self._compactor.join()
+        self.close()
+        data["journal_seq"] = self.seq
+        with self._lock:
+            write_json_atomic(self.snapshot_path, _tasks_last(data))
+            for path in (self.compacting_path, self.path):
+                if os.path.exists(path):
+                    os.remove(path)
+        self.pending = 0
+
+class JsonStorage:
+    """tasks.json snapshot storage with an optional append-only journal"""
+    
+    supports_queries = False
+    load_progress = 0.0
+    
+    def __init__(self, path=SAVE_FILE, journal_mode=JOURNAL_MODE):
+        self.path = path
+        self.journal = TaskJournal(path, f"{path}.journal") if journal_mode else None
+        # Without a journal every mutation needs a full save_all
+        self.incremental = self.journal is not None
+    
+    def exists(self):
+        return os.path.exists(self.path) or (self.journal is not None and self.journal.has_records())
+    
+    def load(self):
+        data = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding='utf-8') as f:
+                data = json.load(f)
+        if self.journal is not None:
+            data = self.journal.replay(data)
+            if os.path.exists(self.journal.compacting_path):
+                # A compaction was interrupted; finish folding it now
+                self.journal.compact()
+        return data
+    
+    def iter_load(self, page_size=LOAD_PAGE_SIZE):
+        """Yield ("meta", dict) and ("tasks", page) events while streaming the snapshot.
+        
+        Journal records are applied to tasks as they stream past. A journaled snapshot that
+        doesn't record its journal_seq ahead of the tasks array (as older versions wrote it)
+        falls back to a full load: edits journaled while the rest streamed in would otherwise
+        be numbered below that journal_seq and skipped on replay.
+        """
+        self.load_progress = 0.0
+        journal = self.journal
+        if os.path.exists(self.path) and (journal is None or not os.path.exists(journal.compacting_path)):
+            size = max(os.path.getsize(self.path), 1)
+            with open(self.path, "rb") as f:
+                stream = JsonObjectStream(f, "tasks")
+                items = iter(stream)
+                meta, first = {}, None
+                for key, value in items:
+                    if key == "tasks":
+                        first = value
+                        break
+                    meta[key] = value
+                
+                if journal is None or first is None or "journal_seq" in meta:
+                    records = journal.pending_records() if journal is not None else []
+                    plans, meta_record, seq = TaskJournal.plan(records, meta.get("journal_seq", 0))
+                    if journal is not None:
+                        journal.seq = seq
+                    if meta_record is not None:
+                        meta["categories"] = meta_record["categories"]
+                        meta["tags"] = meta_record["tags"]
+                    yield "meta", meta
+                    
+                    page, seen, tail = [], set(), {}
+                    if first is not None:
+                        items = itertools.chain([("tasks", first)], items)
+                    for key, task_data in items:
+                        if key != "tasks":
+                            tail[key] = task_data
+                            continue
+                        task_id = task_data.get("id")
+                        if task_id not in seen:
+                            seen.add(task_id)
+                            plan = plans.get(task_id)
+                            if plan is not None:
+                                if plan[1]:
+                                    continue
+                                task_data = plan[0]
+                        page.append(task_data)
+                        if len(page) >= page_size:
+                            self.load_progress = stream.bytes_read / size
+                            yield "tasks", page
+                            page = []
+                    appended = [plan for task_id, plan in plans.items()
+                                if plan[0] is not None and (plan[1] or task_id not in seen)]
+                    appended.sort(key=lambda plan: plan[2])
+                    page.extend(plan[0] for plan in appended)
+                    self.load_progress = 1.0
+                    if page:
+                        yield "tasks", page
+                    if tail:
+                        yield "meta", tail
+                    return
+        
+        data = self.load()
+        self.load_progress = 1.0
+        yield from _paged_load(data, page_size)
+    
+    def put_task(self, task_data):
+        self.journal.append({"op": "put", "task": task_data})
+    
+    def delete_task(self, task_id):
+        self.journal.append({"op": "delete", "id": task_id})
+    
+    def save_metadata(self, categories, tags):
+        self.journal.append({"op": "meta", "categories": categories, "tags": tags})
+    
+    def apply_batch(self, records):
+        """Write journal records ("put", "delete" or "meta") in one go"""
+        self.journal.append_many(records)
+    
+    def save_all(self, data):
+        if self.journal is not None:
+            self.journal.checkpoint(data)
+        else:
+            write_json_atomic(self.path, _tasks_last(data))
+    
+    def quarantine(self):
+        """Move a corrupted snapshot aside so the next save starts fresh"""
+        if os.path.exists(self.path):
+            backup_name = f"{self.path}.backup.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            try:
+                os.rename(self.path, backup_name)
+                print(f"Corrupted file backed up as: {backup_name}")
+            except Exception:
+                pass
+    
+    def close(self):
+        # Only fold a journal that has records; otherwise a read-only session would rewrite the snapshot
+        if self.journal is not None and self.journal.has_records():
+            self.journal.compact(wait=True)
+
+class SqliteStorage:
+    """SQLite task storage; writes are per row and list filters run as SQL queries.
+    
+    The connection is shared with the persistence worker thread, so every use holds _lock.
+    """
+    
+    supports_queries = True
+    incremental = True
+    load_progress = 0.0
+    
+    TASK_COLUMNS = ("id", "title", "description", "due_date", "priority", "category", "completed",
+                    "created_at", "reminder", "notes", "color", "recurring", "completion_date", "progress")
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            due_date TEXT,
+            priority TEXT,
+            category TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT,
+            reminder TEXT,
+            notes TEXT,
+            color TEXT,
+            recurring TEXT,
+            completion_date TEXT,
+            progress INTEGER DEFAULT 0,
+            extra TEXT
+        );
+        CREATE TABLE IF NOT EXISTS subtasks (
+            task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            title TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (task_id, position)
+        );
+        CREATE TABLE IF NOT EXISTS task_tags (
+            task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (task_id, position)
+        );
+        CREATE TABLE IF NOT EXISTS tags (
+            name TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS categories (
+            name TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_position ON tasks(position);
+        CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+        CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks(category);
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed);
+        CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags(tag);
+    """
+    
+    # filter_combo option -> SQL condition
+    FILTERS = {
+        "Completed": "completed = 1",
+        "Incomplete": "completed = 0",
+        "High Priority": "priority = 'High'",
+        "Medium Priority": "priority = 'Medium'",
+        "Low Priority": "priority = 'Low'",
+        "Overdue": "completed = 0 AND due_date IS NOT NULL AND due_date <> '' AND due_date < :today"
+    }
+    
+    def __init__(self, path=SQLITE_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._next_position = self.conn.execute("SELECT COALESCE(MAX(position), 0) + 1 FROM tasks").fetchone()[0]
+    
+    def exists(self):
+        """True once anything was saved, even just categories or tags"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM tasks) OR EXISTS (SELECT 1 FROM categories) "
+                "OR EXISTS (SELECT 1 FROM tags) OR EXISTS (SELECT 1 FROM meta)").fetchone()[0] == 1
+    
+    def load(self):
+        with self._lock:
+            return self._load()
+    
+    def _load(self):
+        subtasks, task_tags = {}, {}
+        for task_id, title, completed in self.conn.execute(
+                "SELECT task_id, title, completed FROM subtasks ORDER BY task_id, position"):
+            subtasks.setdefault(task_id, []).append({"title": title, "completed": bool(completed)})
+        for task_id, tag in self.conn.execute("SELECT task_id, tag FROM task_tags ORDER BY task_id, position"):
+            task_tags.setdefault(task_id, []).append(tag)
+        
+        tasks = []
+        columns = ", ".join(self.TASK_COLUMNS)
+        for row in self.conn.execute(f"SELECT {columns}, extra FROM tasks ORDER BY position"):
+            task_data = json.loads(row[-1]) if row[-1] else {}
+            task_data.update(zip(self.TASK_COLUMNS, row[:-1]))
+            task_data["completed"] = bool(task_data["completed"])
+            task_data["subtasks"] = subtasks.get(task_data["id"], [])
+            task_data["tags"] = task_tags.get(task_data["id"], [])
+            tasks.append(task_data)
+        
+        categories = [name for (name,) in self.conn.execute("SELECT name FROM categories ORDER BY position")]
+        data = {"tasks": tasks, "tags": [name for (name,) in self.conn.execute("SELECT name FROM tags ORDER BY position")]}
+        if categories:
+            data["categories"] = categories
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        if row is not None:
+            data["next_id"] = row[0]
+        return data
+    
+    def iter_load(self, page_size=LOAD_PAGE_SIZE):
+        """Same events as JsonStorage.iter_load; a SQLite board is read in one query"""
+        data = self.load()
+        self.load_progress = 1.0
+        yield from _paged_load(data, page_size)
+    
+    def _upsert(self, task_data):
+        known = set(self.TASK_COLUMNS) | {"subtasks", "tags"}
+        extra = {key: value for key, value in task_data.items() if key not in known}
+        values = [task_data.get(column) for column in self.TASK_COLUMNS]
+        values[self.TASK_COLUMNS.index("completed")] = int(bool(task_data.get("completed")))
+        columns = ", ".join(self.TASK_COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in self.TASK_COLUMNS[1:])
+        self.conn.execute(
+            f"INSERT INTO tasks (position, {columns}, extra) VALUES (?, {', '.join('?' * len(values))}, ?) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}, extra = excluded.extra",
+            [self._next_position] + values + [json.dumps(extra, ensure_ascii=False) if extra else None])
+        self._next_position += 1
+        
+        task_id = task_data["id"]
+        self.conn.execute("DELETE FROM subtasks WHERE task_id = ?", (task_id,))
+        self.conn.executemany(
+            "INSERT INTO subtasks (task_id, position, title, completed) VALUES (?, ?, ?, ?)",
+            [(task_id, i, subtask.get("title", ""), int(bool(subtask.get("completed"))))
+             for i, subtask in enumerate(task_data.get("subtasks") or [])])
+        self.conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+        self.conn.executemany(
+            "INSERT INTO task_tags (task_id, position, tag) VALUES (?, ?, ?)",
+            [(task_id, i, tag) for i, tag in enumerate(task_data.get("tags") or [])])
+    
+    def _write_metadata(self, categories, tags):
+        self.conn.execute("DELETE FROM categories")
+        self.conn.executemany("INSERT OR IGNORE INTO categories (name, position) VALUES (?, ?)",
+                              [(name, i) for i, name in enumerate(categories)])
+        self.conn.execute("DELETE FROM tags")
+        self.conn.executemany("INSERT OR IGNORE INTO tags (name, position) VALUES (?, ?)",
+                              [(name, i) for i, name in enumerate(tags)])
+    
+    def _write_next_id(self, next_id):
+        self.conn.execute("INSERT INTO meta (key, value) VALUES ('next_id', ?) "
+                          "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)", (next_id,))
+    
+    def put_task(self, task_data):
+        self.apply_batch([{"op": "put", "task": task_data}])
+    
+    def delete_task(self, task_id):
+        self.apply_batch([{"op": "delete", "id": task_id}])
+    
+    def save_metadata(self, categories, tags):
+        self.apply_batch([{"op": "meta", "categories": categories, "tags": tags}])
+    
+    def apply_batch(self, records):
+        """Apply JsonStorage journal records in a single transaction"""
+        with self._lock, self.conn:
+            for record in records:
+                if record["op"] == "put":
+                    task_data = record["task"]
+                    self._upsert(task_data)
+                    if isinstance(task_data.get("id"), int):
+                        self._write_next_id(task_data["id"] + 1)
+                elif record["op"] == "delete":
+                    self.conn.execute("DELETE FROM tasks WHERE id = ?", (record["id"],))
+                elif record["op"] == "meta":
+                    self._write_metadata(record["categories"], record["tags"])
+    
+    def save_all(self, data):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM tasks")
+            self._next_position = 1
+            for task_data in data.get("tasks", []):
+                self._upsert(task_data)
+            self._write_metadata(data.get("categories", []), data.get("tags", []))
+            if data.get("next_id"):
+                self._write_next_id(data["next_id"])
+    
+    def query_overdue(self, today):
+        with self._lock:
+            return [task_id for (task_id,) in self.conn.execute(
+                f"SELECT id FROM tasks WHERE {self.FILTERS['Overdue']} ORDER BY position", {"today": today})]
+    
+    def query_tasks(self, search_text, filter_option, today):
+        """Ids of tasks matching the search box text and a filter_combo option"""
+        conditions, params = [], {"today": today}
+        if search_text:
+            escaped = search_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params["pattern"] = f"%{escaped}%"
+            conditions.append("(title LIKE :pattern ESCAPE '\\' OR description LIKE :pattern ESCAPE '\\')")
+        if filter_option in self.FILTERS:
+            conditions.append(self.FILTERS[filter_option])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            return [task_id for (task_id,) in self.conn.execute(
+                f"SELECT id FROM tasks {where} ORDER BY position", params)]
+    
+    def quarantine(self):
+        pass
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+def create_storage(backend=STORAGE_BACKEND):
+    """Open the configured storage backend, migrating tasks.json the first time SQLite is used"""
+    if backend == "sqlite":
+        if not os.path.exists(SQLITE_FILE) and JsonStorage(SAVE_FILE).exists():
+            migrate_json_to_sqlite(SAVE_FILE, SQLITE_FILE)
+        return SqliteStorage(SQLITE_FILE)
+    return JsonStorage(SAVE_FILE)
+
+def migrate_json_to_sqlite(json_path=SAVE_FILE, db_path=SQLITE_FILE):
+    """One-shot copy of a tasks.json board (including its journal) into a SQLite database"""
+    data = JsonStorage(json_path).load()
+    data.setdefault("categories", DEFAULT_CATEGORIES.copy())
+    # tasks.id is the primary key, so duplicate ids from old boards must be remapped first
+    tasks = Task.from_dicts(data.get("tasks", []))
+    task_ids.observe(data.get("next_id", 0) - 1)
+    remap_duplicate_ids(tasks)
+    data["tasks"] = [task.to_dict() for task in tasks]
+    data["next_id"] = task_ids.next_id
+    storage = SqliteStorage(db_path)
+    try:
+        storage.save_all(data)
+    finally:
+        storage.close()
+    return len(data.get("tasks", []))
@@ -0,0 +1,138 @@
+class TaskStore:
+    """In-memory task store with an id index and incrementally maintained secondary indexes"""
+    
+    INDEXES = ("category", "priority", "due_date", "tag", "recurring")
+    
+    def __init__(self, tasks=None):
+        self._by_id = {}
+        self._positions = {}  # task id -> insertion counter, to keep index lookups in store order
+        self._next_position = 0
+        self._index_keys = {}  # task id -> keys the task is currently filed under
+        self._indexes = {name: {} for name in self.INDEXES}
+        for task in tasks or []:
+            self.add(task)
+    
+    def __len__(self):
+        return len(self._by_id)
+    
+    def __iter__(self):
+        return iter(list(self._by_id.values()))
+    
+    def __contains__(self, task_id):
+        return task_id in self._by_id
+    
+    @staticmethod
+    def _keys_for(task):
+        return {
+            "category": (task.category,),
+            "priority": (task.priority,),
+            "due_date": (task.due_date,),
+            "tag": tuple(dict.fromkeys(task.tags or [])),
+            "recurring": (task.recurring,)
+        }
+    
+    def _file(self, task):
+        """File a task under its current keys, touching only the buckets that changed"""
+        old_keys = self._index_keys.get(task.id)
+        keys = self._keys_for(task)
+        for name, values in keys.items():
+            index = self._indexes[name]
+            old_values = old_keys[name] if old_keys else ()
+            for value in old_values:
+                if value not in values:
+                    self._drop(index, value, task.id)
+            for value in values:
+                index.setdefault(value, {})[task.id] = task
+        self._index_keys[task.id] = keys
+    
+    @staticmethod
+    def _drop(index, value, task_id):
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(task_id, None)
+            if not bucket:
+                del index[value]
+    
+    def _unfile(self, task_id):
+        keys = self._index_keys.pop(task_id, None)
+        if not keys:
+            return
+        for name, values in keys.items():
+            for value in values:
+                self._drop(self._indexes[name], value, task_id)
+    
+    def get(self, task_id):
+        return self._by_id.get(task_id)
+    
+    def indexed_fields(self, task_id):
+        """Field values the task is currently filed under, before any in-place edits"""
+        keys = self._index_keys.get(task_id)
+        if keys is None:
+            return None
+        return {"category": keys["category"][0], "priority": keys["priority"][0],
+                "due_date": keys["due_date"][0], "tags": list(keys["tag"]),
+                "recurring": keys["recurring"][0]}
+    
+    def add(self, task):
+        if task.id not in self._positions:
+            self._positions[task.id] = self._next_position
+            self._next_position += 1
+        self._by_id[task.id] = task
+        self._file(task)
+        return task
+    
+    def replace(self, task_id, task):
+        """Swap the task stored under task_id, keeping its position when the id is unchanged"""
+        if task_id not in self._by_id:
+            return False
+        if task.id != task_id:
+            self.remove(task_id)
+            self.add(task)
+            return True
+        self._by_id[task_id] = task
+        self._file(task)
+        return True
+    
+    def remove(self, task_id):
+        task = self._by_id.pop(task_id, None)
+        if task is not None:
+            self._unfile(task_id)
+            del self._positions[task_id]
+        return task
+    
+    def reindex(self, task):
+        """Refile a task whose indexed fields were edited in place"""
+        if task.id in self._by_id:
+            self._file(task)
+    
+    def clear(self):
+        self._by_id.clear()
+        self._positions.clear()
+        self._index_keys.clear()
+        for index in self._indexes.values():
+            index.clear()
+    
+    def lookup(self, index, value):
+        bucket = self._indexes[index].get(value)
+        if not bucket:
+            return []
+        # Buckets are almost always already in store order, which keeps this sort linear
+        return sorted(bucket.values(), key=lambda task: self._positions[task.id])
+    
+    def count(self, index, value, predicate=None):
+        """Number of tasks filed under value, optionally only those matching predicate"""
+        bucket = self._indexes[index].get(value)
+        if not bucket:
+            return 0
+        if predicate is None:
+            return len(bucket)
+        return sum(1 for task in bucket.values() if predicate(task))
+    
+    def index_values(self, index):
+        return list(self._indexes[index].keys())
+    
+    def in_order(self, task_ids):
+        """Tasks for the given ids, in store order"""
+        positions = self._positions
+        return [self._by_id[task_id] for task_id in sorted(
+            (task_id for task_id in task_ids if task_id in positions), key=positions.__getitem__)]
@@ -0,0 +1,155 @@
+import json
+import datetime
+import threading
+import hashlib
+from collections import namedtuple
+
+class TaskIdAllocator:
+    """Hands out increasing task ids; the high-water mark is saved with the board so ids are never reused.
+    
+    Ids are only unique within one board: every board counts up from FIRST_ID, so two boards
+    share ids as a matter of course. Across boards (imports) a task is identified by its id
+    together with its creation time; see Task.same_task.
+    """
+    
+    FIRST_ID = 100000  # Above the old random 5-digit ids, so new ids can't collide with them
+    
+    def __init__(self):
+        self.next_id = self.FIRST_ID
+        self._lock = threading.Lock()
+    
+    def allocate(self):
+        with self._lock:
+            task_id = self.next_id
+            self.next_id += 1
+            return task_id
+    
+    def observe(self, task_id):
+        """Make sure task_id (or a saved next_id - 1) is never handed out again"""
+        if isinstance(task_id, int):
+            with self._lock:
+                self.next_id = max(self.next_id, task_id + 1)
+
+task_ids = TaskIdAllocator()
+
+class Task:
+    # Persisted fields, in to_dict order. Keys outside this schema are kept in extras.
+    FIELDS = ("id", "title", "description", "due_date", "priority", "category", "completed",
+              "created_at", "reminder", "subtasks", "notes", "tags", "color", "recurring",
+              "completion_date", "progress", "sticker")
+    _FIELD_SET = frozenset(FIELDS)
+    # Fields that make two tasks "the same task" when importing
+    CONTENT_FIELDS = ("title", "description", "due_date", "priority", "category", "notes",
+                      "tags", "subtasks", "recurring")
+    
+    __slots__ = FIELDS + ("extras",)
+    
+    def __init__(self, title, description="", due_date=None, priority="None", 
+                 category="Other", completed=False, created_at=None, reminder=None,
+                 subtasks=None, notes="", tags=None, color=None, recurring=None, task_id=None):
+        self.id = task_id if task_id is not None else task_ids.allocate()
+        self.title = title
+        self.description = description
+        self.due_date = due_date
+        self.priority = priority
+        self.category = category
+        self.completed = completed
+        self.created_at = created_at if created_at else datetime.datetime.now().isoformat()
+        self.reminder = reminder
+        self.subtasks = subtasks if subtasks else []
+        self.notes = notes
+        self.tags = tags if tags else []
+        self.color = color
+        self.recurring = recurring
+        self.completion_date = None
+        self.progress = 0
+        self.sticker = None
+        self.extras = {}
+    
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "due_date": self.due_date,
+            "priority": self.priority,
+            "category": self.category,
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "reminder": self.reminder,
+            "subtasks": self.subtasks,
+            "notes": self.notes,
+            "tags": self.tags,
+            "color": self.color,
+            "recurring": self.recurring,
+            "completion_date": self.completion_date,
+            "progress": self.progress,
+            "sticker": self.sticker
+        }
+        if self.extras:
+            data.update(self.extras)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from its to_dict form in one pass, without going through __init__"""
+        task = cls.__new__(cls)
+        get = data.get
+        task_id = get("id")
+        task.id = task_id if task_id is not None else task_ids.allocate()
+        task.title = data["title"]
+        task.description = get("description", "")
+        task.due_date = get("due_date")
+        task.priority = get("priority", "None")
+        task.category = get("category", "Other")
+        task.completed = get("completed", False)
+        task.created_at = get("created_at") or datetime.datetime.now().isoformat()
+        task.reminder = get("reminder")
+        task.subtasks = get("subtasks") or []
+        task.notes = get("notes", "")
+        task.tags = get("tags") or []
+        task.color = get("color")
+        task.recurring = get("recurring")
+        task.completion_date = get("completion_date")
+        task.progress = get("progress", 0)
+        task.sticker = get("sticker")
+        if data.keys() <= cls._FIELD_SET:
+            task.extras = {}
+        else:
+            task.extras = {key: value for key, value in data.items() if key not in cls._FIELD_SET}
+        return task
+    
+    def content_hash(self):
+        """Digest of the task's content, ignoring id, timestamps and completion state"""
+        content = json.dumps([getattr(self, field) for field in self.CONTENT_FIELDS],
+                             ensure_ascii=False, default=str)
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    
+    def same_task(self, other):
+        """Whether other is this task, possibly edited, rather than another board's task with the same id"""
+        return self.id == other.id and bool(self.created_at) and self.created_at == other.created_at
+    
+    @classmethod
+    def from_dicts(cls, items):
+        """Decode a whole tasks array"""
+        from_dict = cls.from_dict
+        return [from_dict(task_data) for task_data in items]
+
+def remap_duplicate_ids(tasks):
+    """Give every task whose id was already used earlier in the list a fresh id"""
+    seen = set()
+    for task in tasks:
+        task_ids.observe(task.id)
+    remapped = 0
+    for task in tasks:
+        if task.id in seen:
+            task.id = task_ids.allocate()
+            remapped += 1
+        seen.add(task.id)
+    return remapped
+
+# A single task change reported to TaskManager listeners. kind is "added", "updated",
+# "removed", "reset" (whole board replaced), "metadata" (categories/tags edited) or
+# "batch" (a bulk edit; task holds the tuple of its single TaskChanges);
+# previous holds the indexed fields the task had before the change.
+TaskChange = namedtuple("TaskChange", ["kind", "task", "task_id", "previous"])
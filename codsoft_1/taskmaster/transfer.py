@@ -0,0 +1,341 @@
+import json
+import os
+import datetime
+import threading
+import queue
+import time
+import csv
+import io
+
+from taskmaster.config import (LOAD_PAGE_SIZE, LOAD_REFRESH_SECONDS, IMPORT_MODES, EXPORT_FORMATS,
+                               EXPORT_CHUNK_SIZE)
+from taskmaster.task import Task, task_ids
+from taskmaster.recurrence import RecurrenceEngine
+from taskmaster.storage import JsonObjectStream
+
+class TaskLoader:
+    """Loads a board page by page: the first page on the calling thread, the rest on a worker.
+    
+    Pages are decoded on the worker but only added to the TaskManager from poll(), so the
+    store is never touched off the calling thread.
+    """
+    
+    def __init__(self, task_manager, page_size=LOAD_PAGE_SIZE):
+        self.task_manager = task_manager
+        self.page_size = page_size
+        self.loaded = 0
+        self.done = False
+        self._events = None
+        self._queue = queue.Queue()
+        self._cancelled = False
+        self._last_publish = 0.0
+    
+    @property
+    def progress(self):
+        return 1.0 if self.done else self.task_manager.storage.load_progress
+    
+    def start(self):
+        """Load up to the first page of tasks, then continue on a worker thread"""
+        self.task_manager.begin_loading(self)
+        try:
+            if self.task_manager.storage.exists():
+                self._events = self.task_manager.storage.iter_load(self.page_size)
+                for kind, value in self._events:
+                    self._apply(kind, value if kind == "meta" else Task.from_dicts(value))
+                    if kind == "tasks":
+                        threading.Thread(target=self._run, name="task-loader", daemon=True).start()
+                        return
+        except Exception as e:
+            self._failed(e)
+        self._finish()
+    
+    def _run(self):
+        try:
+            for kind, value in self._events:
+                if self._cancelled:
+                    return
+                self._queue.put((kind, value if kind == "meta" else Task.from_dicts(value)))
+        except Exception as e:
+            self._queue.put(("error", e))
+        self._queue.put(("done", None))
+    
+    def _apply(self, kind, value):
+        if kind == "meta":
+            self.task_manager.load_metadata(value)
+        elif kind == "tasks":
+            self.task_manager.load_page(value)
+            self.loaded += len(value)
+    
+    def _failed(self, e):
+        print(f"Error loading tasks: {e}")
+        self.task_manager.storage.quarantine()
+    
+    def _finish(self):
+        self.done = True
+        self.task_manager.finish_loading()
+    
+    def poll(self):
+        """Add every page read since the last call; returns False once loading is over"""
+        if self.done:
+            return False
+        added = False
+        while True:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "done":
+                self._finish()
+                return False
+            if kind == "error":
+                self._failed(value)
+            else:
+                self._apply(kind, value)
+                added = True
+        if added and time.monotonic() - self._last_publish >= LOAD_REFRESH_SECONDS:
+            self._last_publish = time.monotonic()
+            self.task_manager.publish_loaded()
+        return True
+    
+    def cancel(self):
+        """Stop loading, e.g. because the board was replaced by an import"""
+        self._cancelled = True
+        if not self.done:
+            self.done = True
+            self.task_manager.loading = False
+            self.task_manager._loader = None
+
+class TaskImporter:
+    """Reads an exported board and works out what to import on a worker thread.
+    
+    Modes: "merge" updates tasks that are already on the board (same id and creation time,
+    see Task.same_task) and skips tasks whose content is already on the board, "skip_duplicates" only adds tasks not on the board by id or content, and
+    "replace" swaps the whole board. apply() commits the result from the calling thread.
+    """
+    
+    def __init__(self, task_manager, path, mode="merge"):
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Unknown import mode: {mode}")
+        self.task_manager = task_manager
+        self.path = path
+        self.mode = mode
+        self.progress = 0.0
+        self.done = False
+        self.error = None
+        self.added = []
+        self.updated = []
+        self.skipped = 0
+        self.categories = None
+        self.tags = None
+        self._existing = list(task_manager.store)  # Snapshot taken on the calling thread
+    
+    def start(self):
+        threading.Thread(target=self._run, name="task-importer", daemon=True).start()
+    
+    def _run(self):
+        try:
+            size = max(os.path.getsize(self.path), 1)
+            tasks = []
+            with open(self.path, "rb") as f:
+                stream = JsonObjectStream(f, "tasks")
+                for key, value in stream:
+                    if key == "tasks":
+                        tasks.append(Task.from_dict(value))
+                        self.progress = 0.8 * stream.bytes_read / size
+                    elif key == "categories":
+                        self.categories = value
+                    elif key == "tags":
+                        self.tags = value
+                    elif key == "next_id":
+                        task_ids.observe(value - 1)
+            for task in tasks:
+                task_ids.observe(task.id)
+            if self.mode == "replace":
+                self.added = tasks
+            else:
+                self._dedup(tasks)
+        except Exception as e:
+            self.error = e
+        self.progress = 1.0
+        self.done = True
+    
+    def _dedup(self, tasks):
+        existing = {task.id: task for task in self._existing}
+        seen = {task.content_hash() for task in self._existing}
+        batch_ids = set()
+        for i, task in enumerate(tasks):
+            content = task.content_hash()
+            current = existing.get(task.id)
+            # Another board's task with the same id is a different task and gets a new id below
+            if (self.mode == "merge" and current is not None and task.id not in batch_ids and
+                    current.same_task(task)):
+                if current.content_hash() == content:
+                    self.skipped += 1
+                else:
+                    self.updated.append(task)
+            elif content in seen:
+                self.skipped += 1
+            else:
+                if task.id in existing or task.id in batch_ids:
+                    task.id = task_ids.allocate()
+                self.added.append(task)
+            seen.add(content)
+            batch_ids.add(task.id)
+            self.progress = 0.8 + 0.2 * (i + 1) / len(tasks)
+    
+    def apply(self):
+        self.task_manager.import_batch(self.added, self.updated, self.categories, self.tags,
+                                       replace=self.mode == "replace")
+
+class TaskExporter:
+    """Writes tasks as a JSON board, NDJSON, CSV or iCalendar VTODOs in chunks on a worker thread.
+    
+    The tasks are chosen on the calling thread with the same search text and filter_combo
+    option as query_tasks, so a filtered view of a large board can be exported on its own.
+    """
+    
+    CSV_COLUMNS = tuple(field for field in Task.FIELDS if field != "sticker")
+    ICS_PRIORITIES = {"High": 1, "Medium": 5, "Low": 9}
+    
+    def __init__(self, task_manager, path, fmt=None, search_text="", filter_option="All", sort_key=None,
+                 reverse=False):
+        fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.tasks = task_manager.query_tasks(search_text, filter_option)
+        if sort_key is not None:
+            self.tasks.sort(key=sort_key, reverse=reverse)
+        self.categories = list(task_manager.categories)
+        self.tags = list(task_manager.tags)
+        self.stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        self.written = 0
+        self.done = False
+        self.error = None
+    
+    @property
+    def progress(self):
+        return self.written / len(self.tasks) if self.tasks else 1.0
+    
+    def start(self):
+        threading.Thread(target=self._run, name="task-exporter", daemon=True).start()
+    
+    def _run(self):
+        try:
+            encode = getattr(self, f"_encode_{self.fmt}")
+            with open(self.path, "w", encoding='utf-8', newline="") as f:
+                f.write(self._header())
+                for start in range(0, len(self.tasks), EXPORT_CHUNK_SIZE):
+                    chunk = self.tasks[start:start + EXPORT_CHUNK_SIZE]
+                    f.write(encode(chunk, first=start == 0))
+                    self.written += len(chunk)
+                f.write(self._footer())
+        except Exception as e:
+            self.error = e
+        self.done = True
+    
+    def _header(self):
+        if self.fmt == "json":
+            meta = json.dumps({"categories": self.categories, "tags": self.tags}, ensure_ascii=False)
+            return meta[:-1] + ', "tasks": ['
+        if self.fmt == "csv":
+            return self._encode_csv_rows([self.CSV_COLUMNS])
+        if self.fmt == "ics":
+            return "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//TaskMaster Pro//EN\r\n"
+        return ""
+    
+    def _footer(self):
+        if self.fmt == "json":
+            return "]}\n"
+        if self.fmt == "ics":
+            return "END:VCALENDAR\r\n"
+        return ""
+    
+    def _encode_json(self, chunk, first):
+        items = ",\n".join(json.dumps(task.to_dict(), ensure_ascii=False) for task in chunk)
+        return items if first else ",\n" + items
+    
+    def _encode_ndjson(self, chunk, first):
+        return "".join(json.dumps(task.to_dict(), ensure_ascii=False) + "\n" for task in chunk)
+    
+    @staticmethod
+    def _encode_csv_rows(rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    
+    def _encode_csv(self, chunk, first):
+        rows = []
+        for task in chunk:
+            row = []
+            for column in self.CSV_COLUMNS:
+                value = getattr(task, column)
+                if column == "tags":
+                    value = ";".join(value)
+                elif column == "subtasks":
+                    value = json.dumps(value, ensure_ascii=False) if value else ""
+                row.append("" if value is None else value)
+            rows.append(row)
+        return self._encode_csv_rows(rows)
+    
+    @staticmethod
+    def _ics_text(text):
+        return (str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+                .replace("\r\n", "\\n").replace("\n", "\\n"))
+    
+    @staticmethod
+    def _ics_datetime(value):
+        """UTC form of an ISO timestamp, which RFC 5545 requires for CREATED, COMPLETED and triggers"""
+        try:
+            # astimezone() reads naive timestamps, as tasks store them, as local time
+            return (datetime.datetime.fromisoformat(value).astimezone(datetime.timezone.utc)
+                    .strftime("%Y%m%dT%H%M%SZ"))
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+    
+    @staticmethod
+    def _ics_fold(line):
+        """Fold a content line to 75 octets per RFC 5545"""
+        if len(line.encode("utf-8")) <= 75:
+            return line + "\r\n"
+        parts, current = [], ""
+        for char in line:
+            if len((current + char).encode("utf-8")) > (75 if not parts else 74):
+                parts.append(current)
+                current = ""
+            current += char
+        parts.append(current)
+        return "\r\n ".join(parts) + "\r\n"
+    
+    def _encode_ics(self, chunk, first):
+        lines = []
+        for task in chunk:
+            lines += ["BEGIN:VTODO", f"UID:{task.id}@taskmaster-pro",
+                      f"DTSTAMP:{self.stamp}", f"SUMMARY:{self._ics_text(task.title)}"]
+            if self._ics_datetime(task.created_at):
+                lines.append(f"CREATED:{self._ics_datetime(task.created_at)}")
+            if task.description:
+                lines.append(f"DESCRIPTION:{self._ics_text(task.description)}")
+            recurring = task.recurring in RecurrenceEngine.RULES and task.due_date
+            if recurring:
+                # An RRULE repeats from DTSTART, and DUE may not equal it, so the day is a duration
+                lines += [f"DTSTART;VALUE=DATE:{task.due_date.replace('-', '')}", "DURATION:P1D"]
+            elif task.due_date:
+                lines.append(f"DUE;VALUE=DATE:{task.due_date.replace('-', '')}")
+            if task.priority in self.ICS_PRIORITIES:
+                lines.append(f"PRIORITY:{self.ICS_PRIORITIES[task.priority]}")
+            lines.append(f"CATEGORIES:{','.join(self._ics_text(c) for c in [task.category] + task.tags)}")
+            if recurring:
+                lines.append(f"RRULE:FREQ={task.recurring.upper()}")
+            if task.completed:
+                lines.append("STATUS:COMPLETED")
+                if self._ics_datetime(task.completion_date):
+                    lines.append(f"COMPLETED:{self._ics_datetime(task.completion_date)}")
+            else:
+                lines.append("STATUS:NEEDS-ACTION")
+            if self._ics_datetime(task.reminder):
+                lines += ["BEGIN:VALARM", "ACTION:DISPLAY", f"DESCRIPTION:{self._ics_text(task.title)}",
+                          f"TRIGGER;VALUE=DATE-TIME:{self._ics_datetime(task.reminder)}", "END:VALARM"]
+            lines.append("END:VTODO")
+        return "".join(self._ics_fold(line) for line in lines)